@@ -0,0 +1,108 @@
+"""
+Run many TWAP parent orders at once through one ExecutionScheduler and report timer precision.
+
+Every parent's slices are due at the same instants, which is the worst case for the scheduler.
+"jitter" is how late the timer thread released each due event; "queue" is the further wait for
+a free worker while many child orders are placed at once. A market run is followed by a limit
+run whose open children are filled by a simulated counterparty, so fills are only seen by the
+tracker's refreshes; remainders are swept with a final market order. A run fails if any parent
+did not fill or a parent's filled quantity differs from the server's, and the market run also
+fails if its p99 jitter exceeds --max-jitter-ms.
+
+Usage:
+    python benchmarks/bench_execution.py [--parents 50] [--slices 20] [--duration 2] [--workers 4]
+"""
+
+import argparse
+import base64
+import os
+import sys
+import threading
+import time
+from decimal import Decimal
+
+from nacl.signing import SigningKey
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood import CryptoHood, ExecutionScheduler  # noqa: E402
+from mock_server import DEFAULT_SYMBOLS, MockServer  # noqa: E402
+
+
+def fill_until(server: MockServer, stop: threading.Event, interval: float = 0.1):
+    """Fill every open order on the server every interval seconds until stop is set."""
+    while not stop.wait(interval):
+        server.fill_open_orders()
+
+
+def run(args, private_key: str, order_type: str) -> bool:
+    """Run one batch of parent orders; limit children are filled by a simulated counterparty."""
+    failed = False
+    with MockServer(latency=args.latency, private_key=private_key) as server:
+        client = CryptoHood("bench-key", private_key, base_url=server.url, pool_maxsize=args.workers)
+        limit_price = None
+        if order_type == "limit":
+            limit_price = lambda parent: f"{server.state.prices[parent.symbol]:.2f}"  # noqa: E731
+        stop = threading.Event()
+        filler = threading.Thread(target=fill_until, args=(server, stop), daemon=True)
+        filler.start()
+        with ExecutionScheduler(client, poll_interval=args.poll_interval, workers=args.workers) as scheduler:
+            start = time.perf_counter()
+            parents = [scheduler.submit(DEFAULT_SYMBOLS[i % len(DEFAULT_SYMBOLS)], "buy", "0.01", args.duration,
+                                        slices=args.slices, order_type=order_type, limit_price=limit_price,
+                                        final_market=order_type == "limit")
+                       for i in range(args.parents)]
+            finished = all(parent.wait(args.duration + 30) for parent in parents)
+            elapsed = time.perf_counter() - start
+            stats = scheduler.stats()
+        stop.set()
+        filler.join()
+        client.close()
+        # Fills the server recorded for each parent's children, to catch fills the tracker missed
+        server_filled = {parent.id: sum(Decimal(server.state.orders_by_id[child['id']]["filled_asset_quantity"] or 0)
+                                        for child in parent.children) for parent in parents}
+
+    states = {}
+    for parent in parents:
+        states[parent.state] = states.get(parent.state, 0) + 1
+    children = sum(len(parent.children) for parent in parents)
+    print(f"{order_type}: {args.parents} parents, {children} child orders in {elapsed:.2f}s: {states}")
+    for name in ("jitter", "queue"):
+        print(f"{name:>8}: p50 {stats[f'{name}_p50_ms']:.2f} ms, p95 {stats[f'{name}_p95_ms']:.2f} ms, "
+              f"p99 {stats[f'{name}_p99_ms']:.2f} ms")
+
+    if not finished or states.get("filled", 0) != args.parents:
+        print("not every parent order filled")
+        failed = True
+    missed = [parent.id for parent in parents if parent.filled_quantity != server_filled[parent.id]]
+    if missed:
+        print(f"{len(missed)} parents disagree with the server's fills")
+        failed = True
+    # The limit run's refreshes make the in-process mock server encode large pages while holding the GIL,
+    # which delays the timer thread by up to the interpreter's switch interval; only the market run is gated
+    if order_type == "market" and stats["jitter_p99_ms"] > args.max_jitter_ms:
+        print(f"p99 timer jitter is above {args.max_jitter_ms} ms")
+        failed = True
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parents", type=int, default=50)
+    parser.add_argument("--slices", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per parent order")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--poll-interval", type=float, default=0.25, help="seconds between tracker refreshes")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated server latency in seconds")
+    parser.add_argument("--max-jitter-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    private_key = base64.b64encode(bytes(SigningKey.generate())).decode("utf-8")
+    failed = False
+    for order_type in ("market", "limit"):
+        failed = run(args, private_key, order_type) or failed
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
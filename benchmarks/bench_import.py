@@ -0,0 +1,84 @@
+"""
+Measure how long `import cryptohood` takes in a fresh interpreter and what it pulls in.
+
+Each statement runs in a new subprocess under `python -X importtime`; the cumulative time of
+its cryptohood imports, including submodules loaded on attribute access, is reported as the
+median over --runs. Importing the package must not load requests, PyNaCl, aiohttp or NumPy;
+those are only imported when a client, signer or portfolio is first used. The run fails if
+a heavy module is loaded by the bare import or its median import time exceeds --max-ms.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--max-ms 20]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = [
+    "import cryptohood",
+    "from cryptohood import ValidationError",
+    "from cryptohood.auth import CryptoHoodAuth",
+    "from cryptohood import CryptoHood",
+]
+
+HEAVY_MODULES = ("requests", "nacl", "aiohttp", "numpy")
+
+
+def import_time_ms(statement: str) -> float:
+    """Cumulative time of the cryptohood imports made by one statement, in milliseconds."""
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    total = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package, nested imports indented
+        parts = line.split("|")
+        if len(parts) != 3 or parts[2].startswith("  "):
+            continue
+        name = parts[2].strip()
+        # Names resolved through the package's lazy __getattr__ show up as separate top-level imports
+        if name == "cryptohood" or name.startswith("cryptohood."):
+            total = (total or 0) + int(parts[1])
+    if total is None:
+        raise RuntimeError(f"no import time reported for cryptohood in {statement!r}")
+    return total / 1000
+
+
+def loaded_heavy_modules() -> list:
+    """Heavy third-party modules present in sys.modules after a bare `import cryptohood`."""
+    code = ("import sys, cryptohood; "
+            f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+                            env=dict(os.environ, PYTHONPATH=ROOT))
+    return result.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=20.0, help="limit for the bare `import cryptohood`")
+    args = parser.parse_args()
+
+    failed = False
+    for statement in STATEMENTS:
+        times = [import_time_ms(statement) for _ in range(args.runs)]
+        median = statistics.median(times)
+        print(f"{statement:<45} median {median:8.2f} ms, min {min(times):8.2f} ms")
+        if statement == "import cryptohood" and median > args.max_ms:
+            print(f"import cryptohood is above {args.max_ms} ms")
+            failed = True
+
+    heavy = loaded_heavy_modules()
+    print(f"heavy modules loaded by import cryptohood: {', '.join(heavy) or 'none'}")
+    if heavy:
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compare JSON encode/decode cost of the available serializers on large paginated order responses.
+
+Usage:
+    python benchmarks/bench_json.py [--orders 50000] [--rounds 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood.serializers import _SERIALIZERS, get_serializer  # noqa: E402
+
+
+def make_page(count: int) -> dict:
+    """A page of orders shaped like the API's."""
+    return {"next": "https://trading.robinhood.com/api/v1/crypto/trading/orders/?cursor=abc", "previous": None,
+            "results": [{
+                "id": str(uuid.uuid4()),
+                "account_number": "000000000",
+                "symbol": "BTC-USD",
+                "client_order_id": str(uuid.uuid4()),
+                "side": "buy",
+                "executions": [{"effective_price": "60000.25", "quantity": "0.001", "timestamp": "2024-01-01T00:00:01Z"}],
+                "type": "limit",
+                "state": "filled",
+                "average_price": f"{60000 + i % 1000}.25",
+                "filled_asset_quantity": f"0.{i % 997:05d}",
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-01-01T00:00:01Z",
+                "limit_order_config": {"asset_quantity": f"0.{i % 997:05d}", "limit_price": "60000.25"}
+            } for i in range(count)]}
+
+
+def best_of(rounds: int, fn) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    page = make_page(args.orders)
+    payload = json.dumps(page).encode("utf-8")
+    order = {"client_order_id": str(uuid.uuid4()), "side": "buy", "type": "limit", "symbol": "BTC-USD",
+             "limit_order_config": {"asset_quantity": "0.001", "limit_price": "60000.25"}}
+    print(f"response page: {len(payload) / 1e6:.1f} MB, {args.orders} orders")
+
+    # Previous path: json.dumps() for the signature, then requests serialized the body again
+    encode_twice = best_of(args.rounds, lambda: [(json.dumps(order), json.dumps(order).encode("utf-8"))
+                                                 for _ in range(10000)])
+    print(f"{'serializer':<22}{'decode MB/s':>12}{'encode MB/s':>12}{'10k bodies ms':>15}")
+    print(f"{'json (encode twice)':<22}{'':>12}{'':>12}{encode_twice * 1000:>15.1f}")
+
+    for name, (_, available) in _SERIALIZERS.items():
+        if not available():
+            print(f"{name:<22}{'not installed':>12}")
+            continue
+        serializer = get_serializer(name)
+        decode = best_of(args.rounds, lambda: serializer.loads(payload))
+        encode = best_of(args.rounds, lambda: serializer.dumps(page))
+        bodies = best_of(args.rounds, lambda: [serializer.dumps(order) for _ in range(10000)])
+        size = len(payload) / 1e6
+        print(f"{name:<22}{size / decode:>12.0f}{size / encode:>12.0f}{bodies * 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
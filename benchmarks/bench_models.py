@@ -0,0 +1,87 @@
+"""
+Compare memory and conversion cost of raw order dicts against the typed models.
+
+Usage:
+    python benchmarks/bench_models.py [--orders 100000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood.models import Order, load_orders  # noqa: E402
+
+START = datetime(2024, 1, 1)
+
+
+def make_payload(count: int) -> bytes:
+    """A JSON page of orders shaped like the API's, decoded fresh for every measurement."""
+    return json.dumps({"results": [{
+        "id": str(uuid.uuid4()),
+        "account_number": "000000000",
+        "symbol": "BTC-USD",
+        "client_order_id": str(uuid.uuid4()),
+        "side": "buy",
+        "executions": [],
+        "type": "market",
+        "state": "filled",
+        "average_price": f"{60000 + i % 1000}.25",
+        "filled_asset_quantity": f"0.{i % 997:05d}",
+        # Real timestamps are unique per order, so they must not look like low-cardinality fields
+        "created_at": (START + timedelta(milliseconds=1001 * i)).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "updated_at": (START + timedelta(milliseconds=1001 * i + 250)).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        "market_order_config": {"asset_quantity": f"0.{i % 997:05d}"}
+    } for i in range(count)]}).encode("utf-8")
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=100000)
+    args = parser.parse_args()
+    payload = make_payload(args.orders)
+
+    def dicts():
+        return json.loads(payload)["results"]
+
+    def models():
+        return [Order.from_dict(record) for record in json.loads(payload)["results"]]
+
+    def table():
+        return load_orders(json.loads(payload)["results"])
+
+    print(f"{'container':<16}{'bytes/order':>14}{'load s':>10}{'sum s':>10}")
+    for name, build, total in (
+        ("list of dicts", dicts, lambda rows: sum(Decimal(row["filled_asset_quantity"]) for row in rows)),
+        ("list of Order", models, lambda rows: sum(row.filled_asset_quantity for row in rows)),
+        ("ColumnTable", table, lambda rows: sum(rows.decimal_column("filled_asset_quantity"))),
+    ):
+        rows, memory, load_time = measure(build)
+        start = time.perf_counter()
+        total(rows)
+        sum_time = time.perf_counter() - start
+        print(f"{name:<16}{memory / args.orders:>14.0f}{load_time:>10.3f}{sum_time:>10.3f}")
+        del rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measure request-signing throughput of CryptoHoodAuth.
+
+Compares always verifying each signature (the previous behaviour) with the default
+production mode and with batched sign_many().
+
+Usage:
+    python benchmarks/bench_signing.py [--count 20000]
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+import time
+
+from nacl.signing import SigningKey
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood import CryptoHoodAuth  # noqa: E402
+
+PATH = "/api/v1/crypto/trading/orders/"
+BODY = json.dumps({
+    "client_order_id": "131de903-5a9c-4260-abc1-28d562a5dcf0",
+    "side": "buy",
+    "symbol": "BTC-USD",
+    "type": "market",
+    "market_order_config": {"asset_quantity": "0.1"}
+})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    private_key = base64.b64encode(bytes(SigningKey.generate())).decode("utf-8")
+    verifying = CryptoHoodAuth("bench-key", private_key, verify_sample_rate=1.0)
+    production = CryptoHoodAuth("bench-key", private_key)
+
+    def timed(fn):
+        start = time.perf_counter()
+        fn()
+        return args.count / (time.perf_counter() - start)
+
+    results = [
+        ("verify every signature", timed(lambda: [verifying.generate_headers("POST", PATH, BODY) for _ in range(args.count)])),
+        ("production (no verify)", timed(lambda: [production.generate_headers("POST", PATH, BODY) for _ in range(args.count)])),
+        ("production sign_many", timed(lambda: production.sign_many([("POST", PATH, BODY)] * args.count))),
+    ]
+
+    print(f"{'mode':<26}{'signatures/s':>14}")
+    for name, rate in results:
+        print(f"{name:<26}{rate:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Measure throughput, latency and memory of every major client call path against the mock API.
+
+Each call path runs --calls times on one client (paginated paths fetch every page per call).
+Results can be saved with --save and compared with a previous run with --compare, so
+performance changes can be measured offline.
+
+Usage:
+    python benchmarks/bench_suite.py [--calls 200] [--orders 5000] [--latency 0] [--no-verify]
+                                     [--only orders] [--save results.json] [--compare baseline.json]
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from nacl.signing import SigningKey
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood import CryptoHood, ResponseCache  # noqa: E402
+from mock_server import DEFAULT_SYMBOLS, MockServer  # noqa: E402
+
+try:
+    import aiohttp  # noqa: F401
+    from cryptohood import AsyncCryptoHood
+except ImportError:
+    AsyncCryptoHood = None
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, len(ordered) * pct // 100)]
+
+
+def _place_and_cancel(client: CryptoHood):
+    order = client.place_order("BTC-USD", "buy", "limit", "0.001", price="50000")
+    client.cancel_order(order["id"])
+
+
+def _bulk_orders(client: CryptoHood):
+    orders = [{"symbol": "ETH-USD", "side": "buy", "order_type": "limit", "quantity": "0.01", "price": "100"}] * 20
+    client.place_orders(orders)
+
+
+def _async_gather(client: "AsyncCryptoHood", loop: asyncio.AbstractEventLoop):
+    async def gather():
+        await asyncio.gather(*[client.get_best_bid_ask(symbol) for symbol in DEFAULT_SYMBOLS * 4])
+    return lambda: loop.run_until_complete(gather())
+
+
+def call_paths(client: CryptoHood, cached: CryptoHood):
+    """(name, callable) for each measured call path."""
+    quantities = [str(q / 10) for q in range(1, 11)]
+    return [
+        ("get_account", client.get_account),
+        ("get_account cached", cached.get_account),
+        ("best_bid_ask 1", lambda: client.get_best_bid_ask("BTC-USD")),
+        ("best_bid_ask all", lambda: client.get_best_bid_ask(list(DEFAULT_SYMBOLS))),
+        ("estimated_price x10", lambda: client.get_estimated_price("BTC-USD", "ask", quantities)),
+        ("trading_pairs", lambda: list(client.iter_trading_pairs())),
+        ("holdings", lambda: list(client.iter_holdings())),
+        ("orders all pages", lambda: sum(1 for _ in client.iter_orders())),
+        ("orders prefetch", lambda: sum(1 for _ in client.iter_orders(prefetch=True))),
+        ("orders filtered", lambda: client.get_all_orders(symbol="BTC-USD", state="open")),
+        ("place + cancel", lambda: _place_and_cancel(client)),
+        ("place_orders x20", lambda: _bulk_orders(client)),
+    ]
+
+
+def measure(fn, calls: int):
+    """Return (calls/s, p50 ms, p99 ms, peak KiB allocated by one call)."""
+    fn()  # warm up connections and caches
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return calls / elapsed, _percentile(latencies, 50) * 1000, _percentile(latencies, 99) * 1000, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--orders", type=int, default=5000, help="orders in the mock account's history")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated server latency in seconds")
+    parser.add_argument("--no-verify", action="store_true", help="skip signature checks in the mock server")
+    parser.add_argument("--only", help="run only call paths whose name contains this text")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="print the change against results saved by --save")
+    args = parser.parse_args()
+
+    private_key = base64.b64encode(bytes(SigningKey.generate())).decode("utf-8")
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = {}
+    with MockServer(latency=args.latency, private_key=None if args.no_verify else private_key,
+                    orders=args.orders) as server:
+        client = CryptoHood("bench-key", private_key, base_url=server.url)
+        cached = CryptoHood("bench-key", private_key, base_url=server.url, cache=ResponseCache())
+        paths = call_paths(client, cached)
+
+        loop = None
+        if AsyncCryptoHood is not None:
+            loop = asyncio.new_event_loop()
+            async_client = AsyncCryptoHood("bench-key", private_key, base_url=server.url)
+            paths.append(("async gather x32", _async_gather(async_client, loop)))
+
+        print(f"{'call path':<22}{'calls/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'peak KiB':>10}{'vs base':>9}")
+        for name, fn in paths:
+            if args.only and args.only not in name:
+                continue
+            throughput, p50, p99, peak = measure(fn, args.calls)
+            results[name] = {"calls_per_s": throughput, "p50_ms": p50, "p99_ms": p99, "peak_kib": peak}
+            change = ""
+            if name in baseline:
+                change = f"{throughput / baseline[name]['calls_per_s'] - 1:+.0%}"
+            print(f"{name:<22}{throughput:>10.0f}{p50:>9.2f}{p99:>9.2f}{peak:>10.0f}{change:>9}")
+
+        client.close()
+        cached.close()
+        if loop is not None:
+            loop.run_until_complete(async_client.close())
+            loop.close()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
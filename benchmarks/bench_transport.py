@@ -0,0 +1,68 @@
+"""
+Compare the pooled keep-alive transport against one-shot ``requests.request`` calls.
+
+Usage:
+    python benchmarks/bench_transport.py [--calls 2000]
+"""
+
+import argparse
+import base64
+import os
+import sys
+import time
+
+import requests
+from nacl.signing import SigningKey
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood import CryptoHood  # noqa: E402
+from mock_server import MockServer  # noqa: E402
+
+
+class _UnpooledTransport:
+    """The pre-session code path: a fresh connection for every call."""
+
+    request = staticmethod(requests.request)
+
+    def close(self):
+        pass
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(client: CryptoHood, calls: int):
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        client.get_account()
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return calls / elapsed, _percentile(latencies, 50) * 1000, _percentile(latencies, 99) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    private_key = base64.b64encode(bytes(SigningKey.generate())).decode("utf-8")
+
+    with MockServer() as server:
+        unpooled = CryptoHood("bench-key", private_key, base_url=server.url)
+        unpooled.session = _UnpooledTransport()
+
+        with CryptoHood("bench-key", private_key, base_url=server.url) as pooled:
+            print(f"{'transport':<12}{'calls/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+            for name, client in (("unpooled", unpooled), ("pooled", pooled)):
+                client.get_account()  # warm-up
+                rate, p50, p99 = run(client, args.calls)
+                print(f"{name:<12}{rate:>12.1f}{p50:>10.3f}{p99:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,539 @@
+"""
+Local stand-in for the Robinhood Crypto API used by the benchmarks.
+
+Implements the documented endpoints (accounts, best_bid_ask, estimated_price, trading_pairs,
+holdings, orders with cursor pagination, order placement and cancel) against in-memory state.
+When given the client's private key it checks every request's x-signature with
+CryptoHoodAuth.verify_signature. Latency, 429 and 5xx responses can be injected, either at a
+fixed rate or for the next N requests, and the server clock can be skewed against the local one.
+
+The server speaks HTTP/1.1 with keep-alive so that pooled and unpooled clients can be
+compared on connection reuse alone.
+"""
+
+import base64
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood.auth import CryptoHoodAuth  # noqa: E402
+
+API = "/api/v1/crypto"
+DEFAULT_SYMBOLS = ("BTC-USD", "ETH-USD", "SOL-USD", "DOGE-USD", "AVAX-USD", "LINK-USD", "XRP-USD", "LTC-USD")
+DEFAULT_PAGE_SIZE = 100
+MAX_ESTIMATED_QUANTITIES = 10
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _validation_error(attr: str, detail: str) -> Dict:
+    return {"type": "validation_error", "errors": [{"attr": attr, "detail": detail}]}
+
+
+def _client_error(detail: str, status_code: int) -> Dict:
+    return {"type": "client_error", "errors": [{"detail": detail}], "status_code": status_code}
+
+
+class MockState:
+    """In-memory account, market and order data served by the mock API."""
+
+    def __init__(self, symbols=DEFAULT_SYMBOLS, orders: int = 0, seed: int = 0):
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.account = {
+            "account_number": "000000000",
+            "status": "active",
+            "buying_power": "100000.00",
+            "buying_power_currency": "USD"
+        }
+        self.pairs = {
+            symbol: {
+                "asset_code": symbol.split("-")[0],
+                "quote_code": "USD",
+                "quote_increment": "0.01",
+                "asset_increment": "0.00000001",
+                "max_order_size": "1000",
+                "min_order_size": "0.000001",
+                "status": "tradable",
+                "symbol": symbol
+            } for symbol in symbols
+        }
+        self.prices = {symbol: 10.0 ** self.random.uniform(-1, 4.8) for symbol in symbols}
+        self.holdings = [{
+            "account_number": self.account["account_number"],
+            "asset_code": pair["asset_code"],
+            "total_quantity": round(self.random.uniform(0, 10), 8),
+            "quantity_available_for_trading": round(self.random.uniform(0, 10), 8)
+        } for pair in self.pairs.values()]
+        self.orders = []
+        self.orders_by_id = {}
+        self.orders_by_client_id = {}
+
+        for _ in range(orders):
+            symbol = self.random.choice(symbols)
+            self.add_order({
+                "client_order_id": str(uuid.uuid4()),
+                "side": self.random.choice(("buy", "sell")),
+                "type": "market",
+                "symbol": symbol,
+                "market_order_config": {"asset_quantity": f"{self.random.uniform(0.001, 1):.8f}"}
+            }, state=self.random.choice(("filled", "filled", "canceled", "open")))
+
+    def quote(self, symbol: str) -> Dict:
+        """Quote for a symbol; the mid price takes a small random step on every call."""
+        price = self.prices[symbol] = self.prices[symbol] * (1 + self.random.gauss(0, 0.0005))
+        spread = 0.0015
+        return {
+            "symbol": symbol,
+            "price": round(price, 8),
+            "bid_inclusive_of_sell_spread": round(price * (1 - spread), 8),
+            "sell_spread": spread,
+            "ask_inclusive_of_buy_spread": round(price * (1 + spread), 8),
+            "buy_spread": spread,
+            "timestamp": _now()
+        }
+
+    def add_order(self, body: Dict, state: str = "open") -> Dict:
+        now = _now()
+        order_type = body.get("type")
+        config = body.get(f"{order_type}_order_config") or {}
+        filled = config.get("asset_quantity") if state == "filled" else "0"
+        order = {
+            "id": str(uuid.uuid4()),
+            "account_number": self.account["account_number"],
+            "symbol": body.get("symbol"),
+            "client_order_id": body.get("client_order_id"),
+            "side": body.get("side"),
+            "executions": [],
+            "type": order_type,
+            "state": state,
+            "average_price": round(self.prices[body["symbol"]], 2) if state == "filled" else None,
+            "filled_asset_quantity": filled,
+            "created_at": now,
+            "updated_at": now,
+            f"{order_type}_order_config": config
+        }
+        self.orders.append(order)
+        self.orders_by_id[order["id"]] = order
+        if order["client_order_id"]:
+            self.orders_by_client_id[order["client_order_id"]] = order
+        return order
+
+
+    def fill_open_orders(self, symbol: Optional[str] = None) -> int:
+        """Fill every open or partially filled order, as a counterparty would. Call with the lock held."""
+        filled = 0
+        for order in self.orders:
+            if order["state"] in ("open", "partially_filled") and (symbol is None or order["symbol"] == symbol):
+                config = order.get(f"{order['type']}_order_config") or {}
+                order["state"] = "filled"
+                order["filled_asset_quantity"] = config.get("asset_quantity")
+                order["average_price"] = config.get("limit_price") or round(self.prices[order["symbol"]], 2)
+                order["updated_at"] = _now()
+                filled += 1
+        return filled
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, status: int, text: str):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method: str):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        server.count_request()
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.auth is not None:
+            error = self._authentication_error(method, raw_body)
+            if error:
+                self._send_json(401, _client_error(error, 401))
+                return
+
+        fault = server.next_fault()
+        if fault == 429:
+            self._send_json(429, _client_error("Too many requests", 429),
+                            {"Retry-After": str(server.retry_after)})
+            return
+        if fault is not None:
+            self._send_json(fault, {"type": "server_error", "errors": [{"detail": "Injected failure"}],
+                                    "status_code": fault})
+            return
+
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        route = getattr(self, f"_{method.lower()}_routes")().get(url.path)
+        if route is None and method == "POST" and url.path.startswith(f"{API}/trading/orders/") \
+                and url.path.endswith("/cancel/"):
+            self._cancel(url.path[len(f"{API}/trading/orders/"):-len("/cancel/")])
+            return
+        if route is None:
+            self._send_json(404, _client_error("Not found", 404))
+            return
+
+        if method == "POST":
+            try:
+                body = json.loads(raw_body) if raw_body else {}
+            except ValueError:
+                self._send_json(400, _validation_error("body", "Invalid JSON"))
+                return
+            route(body)
+        else:
+            route(url.path, query)
+
+    def _authentication_error(self, method: str, body: bytes) -> Optional[str]:
+        auth = self.server.auth
+        api_key = self.headers.get("x-api-key")
+        timestamp = self.headers.get("x-timestamp") or ""
+        try:
+            signature = base64.b64decode(self.headers.get("x-signature") or "")
+            timestamp_ok = abs(time.time() + self.server.clock_skew - int(timestamp)) <= 30
+        except ValueError:
+            return "Invalid signature"
+        if api_key != auth.api_key:
+            return "Invalid API key"
+        if not timestamp_ok:
+            return "Timestamp is invalid or expired"
+
+        # Accept the signature over the full path and query, or over the path alone
+        prefix = f"{api_key}{timestamp}".encode("utf-8")
+        path = urlsplit(self.path).path
+        for signed_path in dict.fromkeys((self.path, path)):
+            message = prefix + signed_path.encode("utf-8") + method.encode("utf-8") + body
+            if auth.verify_signature(message, signature):
+                return None
+        return "Invalid signature"
+
+    def date_time_string(self, timestamp=None):
+        # The Date header follows the server's (possibly skewed) clock
+        return super().date_time_string(time.time() + self.server.clock_skew if timestamp is None else timestamp)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def _get_routes(self):
+        return {
+            f"{API}/trading/accounts/": self._account,
+            f"{API}/marketdata/best_bid_ask/": self._best_bid_ask,
+            f"{API}/marketdata/estimated_price/": self._estimated_price,
+            f"{API}/trading/trading_pairs/": self._trading_pairs,
+            f"{API}/trading/holdings/": self._holdings,
+            f"{API}/trading/orders/": self._orders,
+        }
+
+    def _post_routes(self):
+        return {f"{API}/trading/orders/": self._place_order}
+
+    def _page(self, path: str, query: Dict[str, List[str]], items: List[Dict]):
+        """Send one page of items with a cursor link to the next page, keeping the other filters."""
+        try:
+            offset = int(query.get("cursor", ["0"])[0])
+            limit = int(query.get("limit", [str(self.server.page_size)])[0])
+        except ValueError:
+            self._send_json(400, _validation_error("cursor", "Invalid cursor"))
+            return
+
+        def link(cursor: int) -> str:
+            params = [(name, value) for name, values in query.items() if name != "cursor" for value in values]
+            return f"{self.server.url}{path}?{urlencode(params + [('cursor', str(cursor))])}"
+
+        end = offset + limit
+        self._send_json(200, {
+            "next": link(end) if end < len(items) else None,
+            "previous": link(max(0, offset - limit)) if offset > 0 else None,
+            "results": items[offset:end]
+        })
+
+    def _account(self, path: str, query: Dict[str, List[str]]):
+        self._send_json(200, self.server.state.account)
+
+    def _best_bid_ask(self, path: str, query: Dict[str, List[str]]):
+        state = self.server.state
+        symbols = query.get("symbol") or list(state.pairs)
+        with state.lock:
+            results = [state.quote(symbol) for symbol in symbols if symbol in state.pairs]
+        self._send_json(200, {"results": results})
+
+    def _estimated_price(self, path: str, query: Dict[str, List[str]]):
+        state = self.server.state
+        symbol = (query.get("symbol") or [""])[0]
+        side = (query.get("side") or [""])[0]
+        quantities = [q for value in query.get("quantity", []) for q in value.split(",") if q]
+
+        if symbol not in state.pairs:
+            self._send_json(400, _validation_error("symbol", f"Invalid symbol: {symbol}"))
+            return
+        if side not in ("bid", "ask", "both"):
+            self._send_json(400, _validation_error("side", "Must be one of: bid, ask, both"))
+            return
+        if not quantities or len(quantities) > MAX_ESTIMATED_QUANTITIES:
+            self._send_json(400, _validation_error("quantity", f"Between 1 and {MAX_ESTIMATED_QUANTITIES} quantities"))
+            return
+        pair = state.pairs[symbol]
+        for quantity in quantities:
+            if not float(pair["min_order_size"]) <= float(quantity) <= float(pair["max_order_size"]):
+                self._send_json(400, _validation_error("quantity", f"Must be between {pair['min_order_size']} "
+                                                                   f"and {pair['max_order_size']}"))
+                return
+
+        with state.lock:
+            quote = state.quote(symbol)
+        results = []
+        for quantity in quantities:
+            # Larger orders walk further into the book, so the average fill moves away from the mid
+            impact = 1 + 0.0002 * float(quantity)
+            for book_side in (("bid", "ask") if side == "both" else (side,)):
+                bid = round(quote["bid_inclusive_of_sell_spread"] / impact, 8)
+                ask = round(quote["ask_inclusive_of_buy_spread"] * impact, 8)
+                results.append(dict(quote, side=book_side, quantity=float(quantity),
+                                    bid_inclusive_of_sell_spread=bid, ask_inclusive_of_buy_spread=ask))
+        self._send_json(200, {"results": results})
+
+    def _trading_pairs(self, path: str, query: Dict[str, List[str]]):
+        pairs = self.server.state.pairs
+        symbols = query.get("symbol")
+        items = [pairs[symbol] for symbol in symbols if symbol in pairs] if symbols else list(pairs.values())
+        self._page(path, query, items)
+
+    def _holdings(self, path: str, query: Dict[str, List[str]]):
+        codes = set(query.get("asset_code", []))
+        items = [holding for holding in self.server.state.holdings if not codes or holding["asset_code"] in codes]
+        self._page(path, query, items)
+
+    def _orders(self, path: str, query: Dict[str, List[str]]):
+        filters = {name: query[name][0] for name in ("symbol", "side", "state", "type", "id") if name in query}
+        ranges = []
+        for name in ("created_at", "updated_at"):
+            for bound in ("start", "end"):
+                if f"{name}_{bound}" in query:
+                    ranges.append((name, bound, _parse_time(query[f"{name}_{bound}"][0])))
+
+        state = self.server.state
+        with state.lock:
+            orders = list(state.orders)
+
+        def matches(order: Dict) -> bool:
+            if any(order.get(name) != value for name, value in filters.items()):
+                return False
+            for name, bound, limit in ranges:
+                value = _parse_time(order[name])
+                if (bound == "start" and value < limit) or (bound == "end" and value > limit):
+                    return False
+            return True
+
+        self._page(path, query, [order for order in orders if matches(order)])
+
+    def _place_order(self, body: Dict):
+        state = self.server.state
+        symbol = body.get("symbol")
+        order_type = body.get("type")
+
+        if symbol not in state.pairs:
+            self._send_json(400, _validation_error("symbol", f"Invalid symbol: {symbol}"))
+            return
+        if body.get("side") not in ("buy", "sell"):
+            self._send_json(400, _validation_error("side", "Must be either \"buy\" or \"sell\""))
+            return
+        if order_type not in ("market", "limit", "stop_limit", "stop_loss"):
+            self._send_json(400, _validation_error("type", "Invalid order type"))
+            return
+        if not (body.get(f"{order_type}_order_config") or {}).get("asset_quantity"):
+            self._send_json(400, _validation_error("asset_quantity", "This field is required"))
+            return
+
+        with state.lock:
+            # client_order_id makes placement idempotent, so retried requests return the original order
+            order = state.orders_by_client_id.get(body.get("client_order_id"))
+            if order is None:
+                order = state.add_order(body, state="filled" if order_type == "market" else "open")
+        self._send_json(201, order)
+
+    def _cancel(self, order_id: str):
+        state = self.server.state
+        with state.lock:
+            order = state.orders_by_id.get(order_id)
+            if order is not None and order["state"] in ("open", "partially_filled"):
+                order["state"] = "canceled"
+                order["updated_at"] = _now()
+                status = None
+            elif order is not None:
+                status = f"Order is already {order['state']}"
+
+        if order is None:
+            self._send_json(404, _client_error("Not found", 404))
+        elif status is not None:
+            self._send_json(400, _client_error(status, 400))
+        else:
+            self._send_text(200, f"Cancel request was submitted for order {order_id}")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many connections at once; the default backlog of 5 stalls them on SYN retries
+    request_queue_size = 128
+
+    def count_request(self):
+        with self.fault_lock:
+            self.requests += 1
+
+    def next_fault(self) -> Optional[int]:
+        """Status to return instead of serving the request, if a failure is due."""
+        with self.fault_lock:
+            if self.queued_faults:
+                return self.queued_faults.pop(0)
+            if self.throttle_rate and self.fault_random.random() < self.throttle_rate:
+                return 429
+            if self.error_rate and self.fault_random.random() < self.error_rate:
+                return 503
+        return None
+
+
+class MockServer:
+    """
+    Run the mock API on a background thread.
+
+    Usage:
+        with MockServer(private_key=private_key, orders=5000) as server:
+            client = CryptoHood("bench-key", private_key, base_url=server.url)
+            server.fail_next(429, count=2)
+
+    Attributes:
+        state (MockState): Data served by the API; may be modified between requests
+        requests (int): Requests received
+    """
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.0,
+                 private_key: Optional[str] = None,
+                 api_key: str = "bench-key",
+                 orders: int = 0,
+                 page_size: int = DEFAULT_PAGE_SIZE,
+                 throttle_rate: float = 0.0,
+                 error_rate: float = 0.0,
+                 retry_after: int = 1,
+                 clock_skew: float = 0.0):
+        """
+        Initialize the server.
+
+        Args:
+            host (str): Interface to listen on
+            port (int): Port to listen on (0 picks a free port)
+            latency (float): Seconds added to every response
+            private_key (Optional[str]): Base64 private key of the client; when given, every request's
+                API key, timestamp and signature are verified and failures get HTTP 401
+            api_key (str): API key expected when verifying signatures
+            orders (int): Number of historical orders to generate
+            page_size (int): Default page size of the paginated endpoints
+            throttle_rate (float): Fraction of requests answered with HTTP 429
+            error_rate (float): Fraction of requests answered with HTTP 503
+            retry_after (int): Retry-After seconds sent with HTTP 429
+            clock_skew (float): Seconds the server's clock is ahead of the local one; affects the Date
+                header and which request timestamps are accepted
+        """
+        self.httpd = _Server((host, port), _Handler)
+        self.httpd.state = self.state = MockState(orders=orders)
+        self.httpd.auth = CryptoHoodAuth(api_key, private_key) if private_key else None
+        self.httpd.latency = latency
+        self.httpd.page_size = page_size
+        self.httpd.throttle_rate = throttle_rate
+        self.httpd.error_rate = error_rate
+        self.httpd.retry_after = retry_after
+        self.httpd.clock_skew = clock_skew
+        self.httpd.queued_faults = []
+        self.httpd.fault_lock = threading.Lock()
+        self.httpd.fault_random = random.Random(1)
+        self.httpd.requests = 0
+        self.httpd.url = self.url
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> int:
+        return self.httpd.requests
+
+    def fail_next(self, status: int, count: int = 1):
+        """Answer the next count requests with the given status (e.g. 429 or 503)."""
+        with self.httpd.fault_lock:
+            self.httpd.queued_faults.extend([status] * count)
+
+    def set_faults(self, latency: Optional[float] = None, throttle_rate: Optional[float] = None,
+                   error_rate: Optional[float] = None, clock_skew: Optional[float] = None):
+        """Change the injected latency, failure rates or clock skew while the server runs."""
+        with self.httpd.fault_lock:
+            if latency is not None:
+                self.httpd.latency = latency
+            if throttle_rate is not None:
+                self.httpd.throttle_rate = throttle_rate
+            if error_rate is not None:
+                self.httpd.error_rate = error_rate
+            if clock_skew is not None:
+                self.httpd.clock_skew = clock_skew
+
+    def fill_open_orders(self, symbol: Optional[str] = None) -> int:
+        """Fill every open or partially filled order, optionally only for one symbol; returns how many."""
+        with self.state.lock:
+            return self.state.fill_open_orders(symbol)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,100 @@
+"""
+Stress one shared CryptoHood client from many threads and check that throughput scales.
+
+Every thread issues a mix of reads (account, quotes) and trades (place and cancel) through
+the same client, rate limiter and cache. The run fails if any call raises, if a response
+belongs to another thread's request, or if throughput at the highest thread count is below
+--min-efficiency times linear scaling.
+
+Usage:
+    python benchmarks/stress_threads.py [--threads 1 2 4 8 16] [--calls 200] [--latency 0.01]
+"""
+
+import argparse
+import base64
+import os
+import sys
+import threading
+import time
+import uuid
+
+from nacl.signing import SigningKey
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptohood import CryptoHood, RateLimiter, ResponseCache  # noqa: E402
+from mock_server import MockServer  # noqa: E402
+
+
+def worker(client: CryptoHood, calls: int, errors: list):
+    order_id = None
+    for i in range(calls):
+        try:
+            kind = i % 4
+            if kind == 0:
+                assert client.get_account()["account_number"]
+            elif kind == 1:
+                assert client.get_best_bid_ask("BTC-USD")["results"]
+            elif kind == 2:
+                client_order_id = str(uuid.uuid4())
+                order = client.place_order("BTC-USD", "buy", "limit", "0.001", price="50000",
+                                           client_order_id=client_order_id)
+                assert order["client_order_id"] == client_order_id, "response for another thread's order"
+                order_id = order["id"]
+            elif order_id is not None:
+                assert isinstance(client.cancel_order(order_id), str)
+                order_id = None
+        except Exception as e:
+            errors.append(e)
+
+
+def run(client: CryptoHood, threads: int, calls: int):
+    errors = []
+    pool = [threading.Thread(target=worker, args=(client, calls, errors)) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return threads * calls / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--calls", type=int, default=200, help="calls per thread")
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated server latency in seconds")
+    parser.add_argument("--min-efficiency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    private_key = base64.b64encode(bytes(SigningKey.generate())).decode("utf-8")
+    # Generous limits: the limiter is exercised for thread safety, not to throttle the run
+    limiter = RateLimiter({"marketdata": (1e6, 1e6), "trading": (1e6, 1e6)})
+    cache = ResponseCache(ttls={"/api/v1/crypto/trading/accounts/": 0.05})
+
+    failed = False
+    with MockServer(latency=args.latency, private_key=private_key) as server:
+        with CryptoHood("bench-key", private_key, base_url=server.url, pool_maxsize=max(args.threads),
+                        rate_limiter=limiter, cache=cache) as client:
+            print(f"{'threads':>8}{'calls/s':>12}{'speedup':>10}{'errors':>8}")
+            baseline = None
+            for threads in args.threads:
+                throughput, errors = run(client, threads, args.calls)
+                baseline = baseline or throughput / threads
+                print(f"{threads:>8}{throughput:>12.0f}{throughput / baseline:>10.1f}{len(errors):>8}")
+                for error in errors[:3]:
+                    print(f"    {type(error).__name__}: {error}")
+                failed = failed or bool(errors)
+
+            top = max(args.threads)
+            if throughput < args.min_efficiency * top * baseline:
+                print(f"throughput at {top} threads is below {args.min_efficiency:.0%} of linear scaling")
+                failed = True
+            print(f"cache: {cache.stats()}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
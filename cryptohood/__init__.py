@@ -5,9 +5,88 @@ This package provides a simple interface to interact with Robinhood's Crypto API
 allowing users to trade cryptocurrencies, fetch market data, and manage their accounts.
 """
 
-from .client import CryptoHood
-from .auth import CryptoHoodAuth
-from .exceptions import (CryptoHoodAPIError, AuthenticationError, ValidationError, ClientError, ServerError, OrderError)
+import importlib
+from typing import TYPE_CHECKING
+
+# Exceptions are light and often the only thing a caller needs, so they load with the package
+from .exceptions import (CryptoHoodAPIError, AuthenticationError, ValidationError, ClientError, ServerError, OrderError,
+                         RateLimitError, InvalidSymbolError)
+
+# Everything else is imported on first access, so "import cryptohood" does not load requests, aiohttp,
+# PyNaCl or NumPy until a class that needs them is used
+_LAZY_ATTRIBUTES = {
+    "CryptoHood": ".client",
+    "ClientConfig": ".config",
+    "AsyncCryptoHood": ".async_client",
+    "CryptoHoodAuth": ".auth",
+    "ServerClock": ".clock",
+    "RateLimiter": ".ratelimit",
+    "TokenBucket": ".ratelimit",
+    "RetryPolicy": ".retry",
+    "Instrumentation": ".instrumentation",
+    "RequestTiming": ".instrumentation",
+    "ResponseCache": ".cache",
+    "SingleFlight": ".singleflight",
+    "AsyncSingleFlight": ".singleflight",
+    "QuoteSnapshotService": ".marketdata",
+    "PriceLadder": ".pricing",
+    "PriceLadderService": ".pricing",
+    "QuoteStream": ".stream",
+    "QuoteUpdate": ".stream",
+    "OrderTracker": ".orders",
+    "ExecutionScheduler": ".execution",
+    "ParentOrder": ".execution",
+    "map_symbols": ".parallel",
+    "OrderStore": ".store",
+    "Portfolio": ".portfolio",
+    "get_serializer": ".serializers",
+    "OrderValidator": ".validation",
+    "Account": ".models",
+    "Quote": ".models",
+    "Holding": ".models",
+    "Order": ".models",
+    "TradingPair": ".models",
+    "ColumnTable": ".models",
+    "load_orders": ".models",
+}
+
+if TYPE_CHECKING:
+    from .client import CryptoHood
+    from .config import ClientConfig
+    from .async_client import AsyncCryptoHood
+    from .auth import CryptoHoodAuth
+    from .clock import ServerClock
+    from .ratelimit import RateLimiter, TokenBucket
+    from .retry import RetryPolicy
+    from .instrumentation import Instrumentation, RequestTiming
+    from .cache import ResponseCache
+    from .singleflight import SingleFlight, AsyncSingleFlight
+    from .marketdata import QuoteSnapshotService
+    from .pricing import PriceLadder, PriceLadderService
+    from .stream import QuoteStream, QuoteUpdate
+    from .orders import OrderTracker
+    from .execution import ExecutionScheduler, ParentOrder
+    from .parallel import map_symbols
+    from .store import OrderStore
+    from .portfolio import Portfolio
+    from .serializers import get_serializer
+    from .validation import OrderValidator
+    from .models import Account, Quote, Holding, Order, TradingPair, ColumnTable, load_orders
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 # Package metadata
 __version__ = "0.1.0"
@@ -16,6 +95,11 @@ __license__ = "MIT"
 
 # Export main classes and exceptions
 __all__ = [
-    "CryptoHood", "CryptoHoodAuth", "CryptoHoodAPIError", "AuthenticationError", "ValidationError", "ClientError", "ServerError",
-    "OrderError"
+    "CryptoHood", "ClientConfig", "AsyncCryptoHood", "CryptoHoodAuth", "ServerClock", "RateLimiter", "TokenBucket",
+    "RetryPolicy", "ResponseCache", "SingleFlight", "AsyncSingleFlight", "QuoteSnapshotService", "QuoteStream",
+    "QuoteUpdate", "OrderTracker", "ExecutionScheduler", "ParentOrder", "OrderStore", "Portfolio", "Account",
+    "Quote", "Holding", "Order", "TradingPair", "ColumnTable", "load_orders", "get_serializer", "OrderValidator",
+    "map_symbols", "Instrumentation", "RequestTiming", "PriceLadder", "PriceLadderService",
+    "CryptoHoodAPIError", "AuthenticationError", "ValidationError", "ClientError", "ServerError", "OrderError",
+    "RateLimitError", "InvalidSymbolError"
 ]
@@ -0,0 +1,673 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import List, Dict, Optional, Union, Any, AsyncIterator, Awaitable, Iterable, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .auth import CryptoHoodAuth
+from .cache import ResponseCache
+from .clock import ServerClock, is_timestamp_rejection
+from .client import (BASE_URL, CANCELABLE_ORDER_STATES, _as_list, _build_list_params, _build_order_payload,
+                     _build_orders_params, _error_from_response, _next_page_endpoint)
+from .exceptions import CryptoHoodAPIError, ClientError, OrderError, RateLimitError
+from .instrumentation import Instrumentation, RequestTiming
+from .orders import TERMINAL_ORDER_STATES
+from .ratelimit import RateLimiter, parse_retry_after
+from .retry import RetryPolicy, RetryStats
+from .serializers import JSONSerializer, get_serializer, loads_or_text
+from .singleflight import AsyncSingleFlight
+from .validation import OrderValidator
+
+
+def _flatten_params(params: Optional[Dict]) -> List[Tuple[str, str]]:
+    """Expand list values into repeated query parameters (e.g. ?symbol=BTC-USD&symbol=ETH-USD)."""
+    flat = []
+    for key, value in (params or {}).items():
+        if isinstance(value, (list, tuple)):
+            flat.extend((key, str(item)) for item in value)
+        else:
+            flat.append((key, str(value)))
+    return flat
+
+
+class AsyncCryptoHood:
+    """
+    Asyncio client for the Robinhood Crypto API.
+
+    Mirrors the method surface of CryptoHood, but every API method is a coroutine. A semaphore
+    bounds the number of signed requests in flight, so a single event loop can fan out many
+    calls with asyncio.gather without overrunning the connection pool.
+
+    Usage:
+        async with AsyncCryptoHood(api_key, private_key) as client:
+            account, quotes = await asyncio.gather(client.get_account(), client.get_best_bid_ask("BTC-USD"))
+    """
+
+    # Transport errors that are safe to retry when a RetryPolicy does not name its own
+    RETRYABLE_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError) if aiohttp else ()
+
+    def __init__(self,
+                 api_key: str,
+                 private_key: str,
+                 public_key: str = None,
+                 base_url: str = BASE_URL,
+                 max_concurrency: int = 100,
+                 limit_per_host: int = 0,
+                 timeout: Optional[float] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 serializer: Optional[Union[str, JSONSerializer]] = None,
+                 validate_orders: bool = False,
+                 instrumentation: Optional[Instrumentation] = None,
+                 sync_clock: bool = True,
+                 presign: bool = False,
+                 single_flight: bool = False):
+        """
+        Initialize the async client.
+
+        Args:
+            api_key (str): Your Robinhood API key
+            private_key (str): Base64 encoded private key
+            public_key (str): Optional base64 encoded public key
+            base_url (str): API root URL (default: https://trading.robinhood.com)
+            max_concurrency (int): Maximum number of requests in flight at once
+            limit_per_host (int): Maximum open connections per host (0 means bounded only by max_concurrency)
+            timeout (Optional[float]): Total request timeout in seconds (default: no timeout)
+            rate_limiter (Optional[RateLimiter]): Paces outgoing requests locally; may be shared between clients
+            retry_policy (Optional[RetryPolicy]): When and how to retry failed requests (default: no retries)
+            serializer (Optional[Union[str, JSONSerializer]]): JSON library for bodies: "json", "orjson", "ujson"
+                or a serializer instance (default: fastest installed)
+            validate_orders (bool): Check orders against the trading pair rules before sending them; the
+                rules are loaded on the first order
+            instrumentation (Optional[Instrumentation]): Collects per-endpoint timings and runs request hooks;
+                may be shared between clients (default: a new one per client)
+            sync_clock (bool): Correct request timestamps for the server's clock, estimated from response
+                Date headers, and re-sign and resend a request once if the server rejects its timestamp
+            presign (bool): Sign repeated body-less requests for the next second on a background thread
+            single_flight (bool): Share one request and its parsed response between identical GET calls
+                (same endpoint and query parameters) that are in flight at the same time
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncCryptoHood requires aiohttp. Install it with: pip install cryptohood[async]")
+
+        self.base_url = base_url.rstrip("/")
+        self.clock = ServerClock() if sync_clock else None
+        self.single_flight = AsyncSingleFlight() if single_flight else None
+        self.auth = CryptoHoodAuth(api_key, private_key, public_key, clock=self.clock)
+        if presign:
+            self.auth.start_presigning()
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.retry_stats = RetryStats()
+        self.serializer = get_serializer(serializer)
+        self.validator = OrderValidator() if validate_orders else None
+        self.instrumentation = instrumentation or Instrumentation()
+        self._session = None
+        self._semaphore = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Create the HTTP session and semaphore on first use, inside the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session, release all pooled connections and stop presigning."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.auth.stop_presigning()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the client's request metrics.
+
+        Returns:
+            Dict[str, Any]: "endpoints" (per-endpoint calls, errors, retries, latency percentiles and mean
+            phase timings, see Instrumentation.snapshot()), "retries" (retry counters) and "single_flight"
+            (GET calls sent and shared, or None when single_flight is off)
+        """
+        return {
+            "endpoints": self.instrumentation.snapshot(),
+            "retries": self.retry_stats.snapshot(),
+            "single_flight": self.single_flight.stats() if self.single_flight is not None else None
+        }
+
+    async def __aenter__(self) -> "AsyncCryptoHood":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _make_request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Any:
+        """
+        Make an authenticated request to the Robinhood API.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): API endpoint
+            params (Dict): Query parameters
+            data (Dict): Request body data
+
+        Returns:
+            Any: Response data
+
+        Raises:
+            RateLimitError: If the server rejected the request with HTTP 429
+        """
+        if method == "GET" and self.single_flight is not None:
+            key = ResponseCache.make_key(endpoint, params)
+            return await self.single_flight.do(key, lambda: self._timed_request(method, endpoint, params, data))
+        return await self._timed_request(method, endpoint, params, data)
+
+    async def _timed_request(self, method: str, endpoint: str, params: Optional[Dict], data: Optional[Dict]) -> Any:
+        """Send one request, recording its timing with the instrumentation."""
+        timing = self.instrumentation.start(method, endpoint)
+        try:
+            return await self._send(method, endpoint, params, data, timing)
+        except Exception as e:
+            timing.error = e
+            raise
+        finally:
+            self.instrumentation.finish(timing)
+
+    async def _send(self, method: str, endpoint: str, params: Optional[Dict], data: Optional[Dict],
+                    timing: RequestTiming) -> Any:
+        """Send a request with retries, recording the time spent in each phase."""
+        url = f"{self.base_url}{endpoint}"
+        # Serialize once: the signed bytes are exactly the bytes sent
+        body = self.serializer.dumps(data) if data else b""
+        session = self._get_session()
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        resigned = False
+
+        while True:
+            attempt += 1
+            timing.attempts += 1
+            clock = time.perf_counter()
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(endpoint)
+
+            try:
+                async with self._semaphore:
+                    # Waiting for the rate limiter and a concurrency slot both count as queued
+                    now = time.perf_counter()
+                    timing.queued += now - clock
+                    clock = now
+
+                    # Sign every attempt, inside the semaphore, so the timestamp is fresh when the request is sent
+                    headers = self.auth.generate_headers(method, endpoint, body)
+                    self.retry_stats.record_attempt()
+                    now = time.perf_counter()
+                    timing.sign += now - clock
+                    clock = now
+
+                    sent_at = time.time()
+                    async with session.request(method, url, headers=headers, params=_flatten_params(params),
+                                               data=body or None) as response:
+                        status = response.status
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        date = response.headers.get("Date")
+                        content = await response.read()
+                    received_at = time.time()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                timing.transport += time.perf_counter() - clock
+                if policy.is_retryable_exception(e, self.RETRYABLE_EXCEPTIONS) and await self._wait_before_retry(
+                        attempt, started):
+                    continue
+                raise CryptoHoodAPIError(f"Request failed: {str(e)}")
+
+            now = time.perf_counter()
+            timing.transport += now - clock
+            timing.status = status
+            if self.clock is not None:
+                self.clock.observe(date, sent_at, received_at)
+
+            if status == 429 and self.rate_limiter:
+                self.rate_limiter.penalize(endpoint, retry_after)
+
+            if policy.is_retryable_status(status) and await self._wait_before_retry(
+                    attempt, started, retry_after if status == 429 else None):
+                continue
+
+            if status == 429:
+                raise RateLimitError(retry_after)
+            payload = loads_or_text(self.serializer, content)
+            timing.decode += time.perf_counter() - now
+            if 200 <= status < 300:
+                return payload
+            # A timestamp rejected for clock skew: re-sign once with the server's clock and resend
+            if not resigned and self.clock is not None and is_timestamp_rejection(status, payload) \
+                    and self.clock.calibrate(date, sent_at, received_at):
+                resigned = True
+                # The resend corrects the clock; it does not use up one of the retry policy's attempts
+                attempt -= 1
+                continue
+            raise _error_from_response(status, payload)
+
+    async def _wait_before_retry(self, attempt: int, started: float, retry_after: Optional[int] = None) -> bool:
+        """
+        Sleep before the next attempt if the retry policy allows one.
+
+        Args:
+            attempt (int): Number of attempts made so far
+            started (float): time.monotonic() when the first attempt started
+            retry_after (Optional[int]): Server-provided Retry-After in seconds
+
+        Returns:
+            bool: True if the caller should try again
+        """
+        delay = self.retry_policy.next_delay(attempt, time.monotonic() - started, retry_after)
+        if delay is None:
+            # Without retries enabled nothing was given up on
+            if self.retry_policy.max_attempts > 1:
+                self.retry_stats.record_exhausted()
+            return False
+
+        self.retry_stats.record_retry(delay)
+        await asyncio.sleep(delay)
+        return True
+
+    async def get_account(self) -> Dict:
+        """
+        Get Robinhood Crypto account details.
+
+        Returns:
+            Dict: Account information
+        """
+        endpoint = "/api/v1/crypto/trading/accounts/"
+        return await self._make_request("GET", endpoint)
+
+    async def get_best_bid_ask(self, symbols: Union[str, List[str]] = None) -> Dict:
+        """
+        Get best bid and ask prices for specified symbols.
+
+        Args:
+            symbols (Union[str, List[str]]): Single symbol or list of symbols (e.g., "BTC-USD")
+
+        Returns:
+            Dict: Best bid and ask prices for requested symbols
+        """
+        endpoint = "/api/v1/crypto/marketdata/best_bid_ask/"
+
+        params = {}
+        if symbols:
+            params = {"symbol": _as_list(symbols)}
+
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def get_estimated_price(self, symbol: str, side: str, quantities: Union[str, List[str]]) -> Dict:
+        """
+        Get estimated price for specific symbol and quantities.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTC-USD")
+            side (str): Order side ("bid", "ask", or "both")
+            quantities (Union[str, List[str]]): Quantities to estimate
+
+        Returns:
+            Dict: Estimated prices for requested quantities
+        """
+        endpoint = "/api/v1/crypto/marketdata/estimated_price/"
+
+        if isinstance(quantities, list):
+            quantities = ",".join(quantities)
+
+        params = {"symbol": symbol, "side": side, "quantity": quantities}
+
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def place_order(self,
+                          symbol: str,
+                          side: str,
+                          order_type: str,
+                          quantity: str,
+                          price: str = None,
+                          client_order_id: Optional[str] = None) -> Dict:
+        """
+        Place a crypto order.
+
+        The same client_order_id is sent on every retry, so the API never fills a retried order twice.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTC-USD")
+            side (str): Order side ("buy" or "sell")
+            order_type (str): Order type ("market" or "limit")
+            quantity (str): Order quantity
+            price (str, optional): Limit price (required for limit orders)
+            client_order_id (str, optional): Idempotency key (default: a new UUID4)
+
+        Returns:
+            Dict: Order details
+
+        Raises:
+            InvalidSymbolError: If validate_orders is enabled and the symbol is not a trading pair
+            ValidationError: If the order breaks the trading rules (checked locally when validate_orders is enabled)
+        """
+        if self.validator is not None:
+            await self.validator.ensure_loaded_async(self)
+            self.validator.validate(symbol, side, order_type, quantity, price)
+
+        endpoint = "/api/v1/crypto/trading/orders/"
+        data = _build_order_payload(symbol, side, order_type, quantity, price, client_order_id)
+
+        return await self._make_request("POST", endpoint, data=data)
+
+    async def get_trading_pairs(self,
+                                symbols: Optional[Union[str, List[str]]] = None,
+                                limit: Optional[int] = None,
+                                cursor: Optional[str] = None) -> Dict:
+        """
+        Get list of trading pairs.
+
+        Args:
+            symbols (Optional[Union[str, List[str]]]): Single symbol or list of symbols
+            limit (Optional[int]): Number of results per page
+            cursor (Optional[str]): Pagination cursor
+
+        Returns:
+            Dict: Trading pairs information with pagination
+        """
+        endpoint = "/api/v1/crypto/trading/trading_pairs/"
+        params = _build_list_params('symbol', symbols, limit, cursor)
+
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def get_holdings(self,
+                           asset_codes: Optional[Union[str, List[str]]] = None,
+                           limit: Optional[int] = None,
+                           cursor: Optional[str] = None) -> Dict:
+        """
+        Get cryptocurrency holdings for current user.
+
+        Args:
+            asset_codes (Optional[Union[str, List[str]]]): Single asset code or list of codes
+            limit (Optional[int]): Number of results per page
+            cursor (Optional[str]): Pagination cursor
+
+        Returns:
+            Dict: Holdings information with pagination
+        """
+        endpoint = "/api/v1/crypto/trading/holdings/"
+        params = _build_list_params('asset_code', asset_codes, limit, cursor)
+
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def get_orders(self,
+                         created_at_start: Optional[Union[str, datetime]] = None,
+                         created_at_end: Optional[Union[str, datetime]] = None,
+                         updated_at_start: Optional[Union[str, datetime]] = None,
+                         updated_at_end: Optional[Union[str, datetime]] = None,
+                         symbol: Optional[str] = None,
+                         order_id: Optional[str] = None,
+                         side: Optional[str] = None,
+                         state: Optional[str] = None,
+                         order_type: Optional[str] = None,
+                         limit: Optional[int] = None,
+                         cursor: Optional[str] = None) -> Dict:
+        """
+        Get list of orders for current user.
+
+        Takes the same filters as CryptoHood.get_orders().
+
+        Returns:
+            Dict: Orders information with pagination
+        """
+        endpoint = "/api/v1/crypto/trading/orders/"
+        params = _build_orders_params(created_at_start, created_at_end, updated_at_start, updated_at_end, symbol, order_id,
+                                      side, state, order_type, limit, cursor)
+
+        return await self._make_request("GET", endpoint, params=params)
+
+    async def _iter_results(self, response: Dict, prefetch: bool = False) -> AsyncIterator[Dict]:
+        """
+        Follow the next cursor lazily, yielding one record at a time.
+
+        Args:
+            response (Dict): First page
+            prefetch (bool): Request the next page concurrently while the current page is consumed
+        """
+        pending = None
+        try:
+            while True:
+                next_endpoint = _next_page_endpoint(response)
+                if prefetch and next_endpoint:
+                    pending = asyncio.ensure_future(self._make_request("GET", next_endpoint))
+
+                for record in response.get('results', []):
+                    yield record
+
+                if not next_endpoint:
+                    return
+                response = await pending if pending else await self._make_request("GET", next_endpoint)
+                pending = None
+
+        finally:
+            if pending and not pending.done():
+                pending.cancel()
+
+    async def iter_orders(self, prefetch: bool = False, **filters) -> AsyncIterator[Dict]:
+        """
+        Iterate over all orders matching the filters, one page in memory at a time.
+
+        Args:
+            prefetch (bool): Request the next page while the current one is consumed
+            **filters: Same parameters as get_orders()
+        """
+        async for order in self._iter_results(await self.get_orders(**filters), prefetch):
+            yield order
+
+    async def iter_holdings(self,
+                            asset_codes: Optional[Union[str, List[str]]] = None,
+                            limit: Optional[int] = None,
+                            prefetch: bool = False) -> AsyncIterator[Dict]:
+        """
+        Iterate over all holdings, one page in memory at a time.
+
+        Args:
+            asset_codes (Optional[Union[str, List[str]]]): Single asset code or list of codes
+            limit (Optional[int]): Number of results per page
+            prefetch (bool): Request the next page while the current one is consumed
+        """
+        async for holding in self._iter_results(await self.get_holdings(asset_codes=asset_codes, limit=limit),
+                                                prefetch):
+            yield holding
+
+    async def iter_trading_pairs(self,
+                                 symbols: Optional[Union[str, List[str]]] = None,
+                                 limit: Optional[int] = None,
+                                 prefetch: bool = False) -> AsyncIterator[Dict]:
+        """
+        Iterate over all trading pairs, one page in memory at a time.
+
+        Args:
+            symbols (Optional[Union[str, List[str]]]): Single symbol or list of symbols
+            limit (Optional[int]): Number of results per page
+            prefetch (bool): Request the next page while the current one is consumed
+        """
+        async for pair in self._iter_results(await self.get_trading_pairs(symbols=symbols, limit=limit), prefetch):
+            yield pair
+
+    async def cancel_order(self, order_id: str) -> str:
+        """
+        Cancel an open crypto trading order.
+
+        Args:
+            order_id (str): UUID of the order to cancel
+
+        Returns:
+            str: Success message with order ID
+
+        Raises:
+            OrderError: If the order is not found, already cancelled or completed
+        """
+        endpoint = f"/api/v1/crypto/trading/orders/{order_id}/cancel/"
+
+        try:
+            response = await self._make_request("POST", endpoint)
+
+            # Handle text/plain response
+            if isinstance(response, str):
+                return response
+            return f"Cancel request was submitted for order {order_id}"
+
+        except ClientError as e:
+            if e.status_code == 404:
+                raise OrderError(f"Order {order_id} not found")
+            elif "already cancelled" in str(e).lower():
+                raise OrderError(f"Order {order_id} is already cancelled")
+            elif "already completed" in str(e).lower():
+                raise OrderError(f"Order {order_id} is already completed")
+            raise
+
+    @staticmethod
+    async def gather(*aws: Awaitable, return_exceptions: bool = False) -> List[Any]:
+        """
+        Run several client calls concurrently and return their results in order.
+
+        Concurrency is still capped by the client's semaphore, so it is safe to pass hundreds of calls.
+
+        Args:
+            *aws (Awaitable): Coroutines returned by client methods
+            return_exceptions (bool): Return exceptions in place of results instead of raising the first one
+
+        Returns:
+            List[Any]: Results in the same order as the inputs
+        """
+        return await asyncio.gather(*aws, return_exceptions=return_exceptions)
+
+    async def get_best_bid_ask_many(self, symbols: Iterable[str], batch_size: int = 20) -> Dict[str, Dict]:
+        """
+        Fetch best bid/ask quotes for many symbols using concurrent batched requests.
+
+        Args:
+            symbols (Iterable[str]): Trading pair symbols
+            batch_size (int): Number of symbols per request
+
+        Returns:
+            Dict[str, Dict]: Quote for each symbol, keyed by symbol
+        """
+        symbols = list(dict.fromkeys(symbols))
+        batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+        responses = await self.gather(*(self.get_best_bid_ask(batch) for batch in batches))
+
+        return {quote['symbol']: quote for response in responses for quote in response.get('results', [])}
+
+    async def get_estimated_prices(self, symbol_quantities: Dict[str, Union[str, List[str]]], side: str) -> Dict[str, Dict]:
+        """
+        Fetch estimated prices for several symbols concurrently.
+
+        Args:
+            symbol_quantities (Dict[str, Union[str, List[str]]]): Quantities to estimate, keyed by symbol
+            side (str): Order side ("bid", "ask", or "both")
+
+        Returns:
+            Dict[str, Dict]: Estimated price response for each symbol
+        """
+        symbols = list(symbol_quantities)
+        responses = await self.gather(*(self.get_estimated_price(symbol, side, symbol_quantities[symbol])
+                                        for symbol in symbols))
+        return dict(zip(symbols, responses))
+
+    async def get_orders_for_symbols(self, symbols: Iterable[str], **filters) -> Dict[str, Dict]:
+        """
+        Fetch the first page of orders for several symbols concurrently.
+
+        Args:
+            symbols (Iterable[str]): Trading pair symbols
+            **filters: Any other get_orders() filters
+
+        Returns:
+            Dict[str, Dict]: Orders response for each symbol
+        """
+        symbols = list(symbols)
+        responses = await self.gather(*(self.get_orders(symbol=symbol, **filters) for symbol in symbols))
+        return dict(zip(symbols, responses))
+
+    async def _run_bounded(self, coroutines: List[Awaitable], max_concurrency: int) -> List[Any]:
+        """
+        Await coroutines with at most max_concurrency running at once.
+
+        Returns:
+            List[Any]: Each result, or the API error it raised, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(coroutine):
+            async with semaphore:
+                try:
+                    return await coroutine
+                except CryptoHoodAPIError as e:
+                    return e
+
+        return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+
+    async def place_orders(self, orders: List[Dict], max_concurrency: int = 8) -> List[Union[Dict, CryptoHoodAPIError]]:
+        """
+        Place several orders concurrently.
+
+        Args:
+            orders (List[Dict]): Keyword arguments for place_order() for each order
+            max_concurrency (int): Maximum number of orders in flight
+
+        Returns:
+            List[Union[Dict, CryptoHoodAPIError]]: Order details, or the error raised for that order, in input order
+        """
+        specs = [dict(order, client_order_id=order.get('client_order_id') or str(uuid.uuid4())) for order in orders]
+        return await self._run_bounded([self.place_order(**spec) for spec in specs], max_concurrency)
+
+    async def cancel_orders(self,
+                            order_ids: Optional[List[str]] = None,
+                            max_concurrency: int = 8,
+                            **filters) -> Dict[str, Union[str, CryptoHoodAPIError]]:
+        """
+        Cancel several orders concurrently.
+
+        Args:
+            order_ids (Optional[List[str]]): Orders to cancel. When omitted, every open or partially filled order
+                matching filters is cancelled.
+            max_concurrency (int): Maximum number of cancellations in flight
+            **filters: get_orders() filters used to select orders when order_ids is omitted. Without a state
+                filter only open and partially filled orders are fetched.
+
+        Returns:
+            Dict[str, Union[str, CryptoHoodAPIError]]: Success message, or the error raised, keyed by order ID
+        """
+        if order_ids is None:
+            state = filters.pop('state', None)
+            states = [state] if state else CANCELABLE_ORDER_STATES
+            order_ids = []
+            for state in states:
+                order_ids.extend([order['id'] async for order in self.iter_orders(state=state, **filters)
+                                  if order.get('state') not in TERMINAL_ORDER_STATES])
+
+        results = await self._run_bounded([self.cancel_order(order_id) for order_id in order_ids], max_concurrency)
+        return dict(zip(order_ids, results))
+
+    async def cancel_all_orders(self,
+                                symbol: Optional[str] = None,
+                                max_concurrency: int = 8) -> Dict[str, Union[str, CryptoHoodAPIError]]:
+        """
+        Cancel every open or partially filled order, optionally only for one symbol.
+
+        Args:
+            symbol (Optional[str]): Trading pair symbol (e.g., "BTC-USD")
+            max_concurrency (int): Maximum number of cancellations in flight
+
+        Returns:
+            Dict[str, Union[str, CryptoHoodAPIError]]: Success message, or the error raised, keyed by order ID
+        """
+        return await self.cancel_orders(symbol=symbol, max_concurrency=max_concurrency)
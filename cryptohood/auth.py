@@ -1,9 +1,14 @@
 import base64
+import os
+import random
+import threading
 import time
-from typing import Dict
-from nacl.signing import SigningKey, VerifyKey
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from .exceptions import AuthenticationError
 
+# Ed25519 seeds and public keys are 32 bytes
+KEY_SIZE = 32
+
 
 class CryptoHoodAuth:
     """
@@ -11,11 +16,23 @@ class CryptoHoodAuth:
 
     Attributes:
         api_key (str): The API key from Robinhood API Credentials Portal
-        private_key (SigningKey): NaCl signing key generated from private key seed
+        private_key (SigningKey): NaCl signing key generated from private key seed; with lazy_key it
+            is built, and PyNaCl imported, on first use
         public_key (VerifyKey): NaCl verify key for signature verification
+        verify_sample_rate (float): Fraction of generated signatures that are verified before use
+        clock (Optional[ServerClock]): Source of request timestamps (default: the local clock)
     """
 
-    def __init__(self, api_key: str, private_key_base64: str, public_key_base64: str = None):
+    # Body-less requests presigned for the next second by the background presigner
+    MAX_PRESIGNED = 64
+
+    def __init__(self,
+                 api_key: str,
+                 private_key_base64: str,
+                 public_key_base64: str = None,
+                 verify_sample_rate: float = 0.0,
+                 clock=None,
+                 lazy_key: bool = False):
         """
         Initialize the authentication handler.
 
@@ -23,36 +40,116 @@ class CryptoHoodAuth:
             api_key (str): Your Robinhood API key
             private_key_base64 (str): Base64 encoded private key
             public_key_base64 (str): Optional base64 encoded public key for verification
+            verify_sample_rate (float): Fraction of signatures to verify against the public key, from 0.0
+                (production default, never) to 1.0 (always). Useful to diagnose key mismatches.
+            clock (Optional[ServerClock]): Source of request timestamps, corrected for the server's clock
+                (default: the local clock)
+            lazy_key (bool): Only decode and check the keys now; load PyNaCl and build the signing key on
+                the first signature. Saves startup time in processes that may never sign.
         """
         self.api_key = api_key
+        self.verify_sample_rate = verify_sample_rate
+        self.clock = clock
+
+        # Signatures of body-less requests keyed by timestamp, then (method, path). A signature only
+        # depends on the timestamp, method, path and body, so within one second a GET to the same
+        # path is signed once. Only the previous, current and next second are kept.
+        self._signatures = {}
+        self._presign_thread = None
+        self._presign_stop = threading.Event()
+        self._presign_pid = None
+
+        # Constant parts of every request, computed once
+        self._api_key_bytes = api_key.encode("utf-8")
+        self._static_headers = {"x-api-key": api_key, "Content-Type": "application/json"}
+
+        try:
+            # Convert base64 keys to raw bytes; the NaCl key objects are built from them
+            self._private_key_seed = base64.b64decode(private_key_base64)
+            self._public_key_bytes = base64.b64decode(public_key_base64) if public_key_base64 else None
+        except Exception as e:
+            raise AuthenticationError(f"Failed to initialize authentication: {str(e)}")
+
+        self._private_key = None
+        self._public_key = None
+        if lazy_key:
+            for name, key in (("private", self._private_key_seed), ("public", self._public_key_bytes)):
+                if key is not None and len(key) != KEY_SIZE:
+                    raise AuthenticationError(f"Failed to initialize authentication: the {name} key must be "
+                                              f"{KEY_SIZE} bytes long")
+        else:
+            self._load_keys()
 
+    def _load_keys(self):
+        """Build the NaCl signing and verify keys."""
         try:
-            # Convert base64 private key to seed
-            private_key_seed = base64.b64decode(private_key_base64)
-            self.private_key = SigningKey(private_key_seed)
+            from nacl.signing import SigningKey, VerifyKey
 
+            private_key = SigningKey(self._private_key_seed)
             # If public key is provided, set up verification
-            if public_key_base64:
-                public_key_bytes = base64.b64decode(public_key_base64)
-                self.public_key = VerifyKey(public_key_bytes)
+            if self._public_key_bytes:
+                public_key = VerifyKey(self._public_key_bytes)
             else:
-                self.public_key = self.private_key.verify_key
+                public_key = private_key.verify_key
 
         except Exception as e:
             raise AuthenticationError(f"Failed to initialize authentication: {str(e)}")
+        self._private_key, self._public_key = private_key, public_key
+
+    @property
+    def private_key(self):
+        """NaCl signing key, built on first use when lazy_key is set."""
+        if self._private_key is None:
+            self._load_keys()
+        return self._private_key
+
+    @private_key.setter
+    def private_key(self, key):
+        self._private_key = key
+
+    @property
+    def public_key(self):
+        """NaCl verify key, built on first use when lazy_key is set."""
+        if self._public_key is None:
+            self._load_keys()
+        return self._public_key
+
+    @public_key.setter
+    def public_key(self, key):
+        self._public_key = key
 
     def _get_timestamp(self) -> int:
-        """Get current UTC timestamp in seconds."""
-        return int(time.time())
+        """Get current UTC timestamp in seconds, on the server's clock when a clock is set."""
+        clock = self.clock
+        return int(clock.now() if clock is not None else time.time())
+
+    def _should_verify(self) -> bool:
+        """Decide whether this signature is checked against the public key."""
+        rate = self.verify_sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def _sign(self, timestamp: bytes, method: str, path: str, body: Union[str, bytes]) -> str:
+        """Sign one request message and return the base64 signature."""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        # Same bytes as f"{api_key}{timestamp}{path}{method}{body}".encode("utf-8")
+        message = b"".join((self._api_key_bytes, timestamp, path.encode("utf-8"), method.encode("utf-8"), body))
+        signature = self.private_key.sign(message).signature
+
+        if self._should_verify():
+            self.public_key.verify(message, signature)
 
-    def generate_headers(self, method: str, path: str, body: str = "") -> Dict[str, str]:
+        return base64.b64encode(signature).decode("ascii")
+
+    def generate_headers(self, method: str, path: str, body: Union[str, bytes] = "") -> Dict[str, str]:
         """
         Generate authentication headers for API requests.
 
         Args:
             method (str): HTTP method (GET, POST, etc.)
             path (str): API endpoint path
-            body (str): Request body (if any)
+            body (Union[str, bytes]): Request body (if any), exactly as it will be sent
 
         Returns:
             Dict[str, str]: Headers containing authentication information
@@ -60,26 +157,108 @@ class CryptoHoodAuth:
         timestamp = self._get_timestamp()
 
         try:
-            # Create message to sign
-            message = f"{self.api_key}{timestamp}{path}{method}{body}"
-
-            # Sign the message
-            signed = self.private_key.sign(message.encode("utf-8"))
-
-            # Generate signature
-            signature = base64.b64encode(signed.signature).decode("utf-8")
-
-            # Verify signature if public key is available
-            if self.public_key:
-                self.public_key.verify(signed.message, signed.signature)
-
-            # Return headers
-            return {
-                "x-api-key": self.api_key,
-                "x-signature": signature,
-                "x-timestamp": str(timestamp),
-                "Content-Type": "application/json"
-            }
+            headers = dict(self._static_headers)
+            headers["x-signature"] = self._signature(timestamp, method, path, body) if not body else \
+                self._sign(str(timestamp).encode("ascii"), method, path, body)
+            headers["x-timestamp"] = str(timestamp)
+            return headers
+
+        except Exception as e:
+            raise AuthenticationError(f"Failed to generate authentication headers: {str(e)}")
+
+    def _signature(self, timestamp: int, method: str, path: str, body: Union[str, bytes] = b"") -> str:
+        """Signature of a body-less request, reused for the rest of the second."""
+        signatures = self._signatures.get(timestamp)
+        if signatures is None:
+            # Swap in a new mapping rather than pruning the shared one, so readers never see a partial update
+            signatures = {}
+            tables = {ts: table for ts, table in self._signatures.items() if ts >= timestamp - 1}
+            tables[timestamp] = signatures
+            self._signatures = tables
+        key = (method, path)
+        signature = signatures.get(key)
+        if signature is None:
+            signature = signatures[key] = self._sign(str(timestamp).encode("ascii"), method, path, body)
+        return signature
+
+    def presign(self, requests: Iterable[Tuple[str, str]], timestamp: Optional[int] = None):
+        """
+        Sign body-less requests ahead of time so later generate_headers() calls only look them up.
+
+        Args:
+            requests (Iterable[Tuple[str, str]]): (method, path) of each request
+            timestamp (Optional[int]): Second to sign for (default: the current one)
+        """
+        timestamp = self._get_timestamp() if timestamp is None else timestamp
+        for method, path in requests:
+            self._signature(timestamp, method, path)
+
+    def start_presigning(self, lead: float = 0.05):
+        """
+        Start a background thread that signs recently used body-less requests for each next second.
+
+        Shortly before every second boundary the thread signs the requests seen in the current
+        second with the next timestamp, so polling requests find their signature ready and signing
+        work stays off the calling threads. Requests with a body (orders) are always signed inline.
+        Calling this again, or in a forked child whose thread did not survive, restarts the thread.
+
+        Args:
+            lead (float): Seconds before each second boundary to presign
+        """
+        thread = self._presign_thread
+        if thread is not None and thread.is_alive() and self._presign_pid == os.getpid():
+            return
+        self._presign_stop = threading.Event()
+        self._presign_pid = os.getpid()
+        self._presign_thread = threading.Thread(target=self._presign_loop, args=(lead, self._presign_stop),
+                                                name="cryptohood-presign", daemon=True)
+        self._presign_thread.start()
+
+    def stop_presigning(self):
+        """Stop the background presigning thread."""
+        self._presign_stop.set()
+        thread = self._presign_thread
+        if thread is not None and thread is not threading.current_thread() and self._presign_pid == os.getpid():
+            thread.join()
+        self._presign_thread = None
+
+    def _presign_loop(self, lead: float, stop: threading.Event):
+        while True:
+            now = self.clock.now() if self.clock is not None else time.time()
+            if stop.wait(max(0.0, 1.0 - (now % 1.0) - lead)):
+                return
+            timestamp = self._get_timestamp()
+            recent = list(self._signatures.get(timestamp, ()))[:self.MAX_PRESIGNED]
+            try:
+                self.presign(recent, timestamp + 1)
+            except Exception:
+                # A failed presign only means the next request signs inline
+                pass
+            # Stay past the boundary check so each second is presigned once
+            if stop.wait(lead):
+                return
+
+    def sign_many(self, requests: Iterable[Tuple[str, str, Union[str, bytes]]]) -> List[Dict[str, str]]:
+        """
+        Generate authentication headers for a batch of requests sharing one timestamp.
+
+        Args:
+            requests (Iterable[Tuple[str, str, str]]): (method, path, body) for each request
+
+        Returns:
+            List[Dict[str, str]]: Headers for each request, in input order
+        """
+        timestamp = str(self._get_timestamp())
+        timestamp_bytes = timestamp.encode("ascii")
+
+        try:
+            signed = []
+            for method, path, body in requests:
+                headers = dict(self._static_headers)
+                headers["x-signature"] = self._sign(timestamp_bytes, method, path, body)
+                headers["x-timestamp"] = timestamp
+                signed.append(headers)
+            return signed
 
         except Exception as e:
             raise AuthenticationError(f"Failed to generate authentication headers: {str(e)}")
@@ -0,0 +1,169 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+ACCOUNTS_ENDPOINT = "/api/v1/crypto/trading/accounts/"
+TRADING_PAIRS_ENDPOINT = "/api/v1/crypto/trading/trading_pairs/"
+
+# Reference data changes rarely; these are the endpoints cached when no TTLs are given
+DEFAULT_TTLS = {
+    ACCOUNTS_ENDPOINT: 30.0,
+    TRADING_PAIRS_ENDPOINT: 300.0,
+}
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "refreshing")
+
+    def __init__(self, value: Any, expires_at: float):
+        self.value = value
+        self.expires_at = expires_at
+        self.refreshing = False
+
+
+class ResponseCache:
+    """
+    In-process TTL cache for reference-data responses, with LRU eviction.
+
+    Keys cover the endpoint and every query parameter (symbols, limit, cursor, ...). An entry past
+    its TTL but still inside the stale window is served immediately while a background thread
+    fetches a fresh copy (stale-while-revalidate). Cached responses are shared between callers
+    and must not be mutated.
+
+    Usage:
+        cache = ResponseCache(ttls={"/api/v1/crypto/trading/trading_pairs/": 600}, stale_ttl=60)
+        client = CryptoHood(api_key, private_key, cache=cache)
+        client.get_trading_pairs("BTC-USD")  # network
+        client.get_trading_pairs("BTC-USD")  # cache hit
+        cache.invalidate()
+
+    Attributes:
+        ttls (Dict[str, float]): Time to live in seconds, keyed by endpoint path
+        maxsize (int): Maximum number of cached responses
+        stale_ttl (float): Seconds an expired entry may still be served while it is refreshed
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, maxsize: int = 256, stale_ttl: float = 0.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttls (Optional[Dict[str, float]]): Time to live in seconds, keyed by endpoint path
+                (default: 30s for accounts, 300s for trading pairs)
+            maxsize (int): Maximum number of cached responses
+            stale_ttl (float): Seconds an expired entry may still be served while it is refreshed
+        """
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> Tuple[Hashable, ...]:
+        """Build a hashable key from the endpoint and its query parameters."""
+        items = []
+        for name, value in sorted((params or {}).items()):
+            if isinstance(value, (list, tuple)):
+                value = tuple(value)
+            items.append((name, value))
+        return (endpoint, tuple(items))
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """Return the TTL configured for an endpoint, or None if it is not cached."""
+        return self.ttls.get(endpoint.split("?", 1)[0])
+
+    def get_or_fetch(self, endpoint: str, params: Optional[Dict], fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached response for the request, calling fetch() on a miss.
+
+        Args:
+            endpoint (str): API endpoint path
+            params (Optional[Dict]): Query parameters
+            fetch (Callable[[], Any]): Performs the request
+
+        Returns:
+            Any: Cached or freshly fetched response
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl is None:
+            return fetch()
+
+        key = self.make_key(endpoint, params)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now < entry.expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.value
+
+                if now < entry.expires_at + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        threading.Thread(target=self._refresh, args=(key, fetch, ttl), daemon=True).start()
+                    return entry.value
+
+            self.misses += 1
+
+        value = fetch()
+        self._store(key, value, ttl)
+        return value
+
+    def _refresh(self, key: Tuple[Hashable, ...], fetch: Callable[[], Any], ttl: float):
+        """Fetch a fresh copy of a stale entry in the background."""
+        try:
+            value = fetch()
+        except Exception:
+            # Keep serving the stale value; the next stale hit will try again
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            return
+
+        self._store(key, value, ttl)
+
+    def _store(self, key: Tuple[Hashable, ...], value: Any, ttl: float):
+        """Insert or replace an entry and evict the least recently used ones over maxsize."""
+        with self._lock:
+            self._entries[key] = _CacheEntry(value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """
+        Drop cached responses.
+
+        Args:
+            endpoint (Optional[str]): Only drop responses for this endpoint path (default: drop everything)
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if key[0] == endpoint]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries)
+            }
@@ -1,19 +1,228 @@
-import json
-from typing import List, Dict, Optional, Union, Any
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Union, Any, Iterator
 import uuid
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
-from urllib.parse import urlencode
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlencode, urlsplit
 from .auth import CryptoHoodAuth
-from .exceptions import (CryptoHoodAPIError, ValidationError, ClientError, ServerError, OrderError)
+from .cache import ResponseCache
+from .clock import ServerClock, is_timestamp_rejection
+from .config import BASE_URL, ClientConfig
+from .exceptions import (CryptoHoodAPIError, ValidationError, ClientError, ServerError, OrderError, RateLimitError)
+from .instrumentation import Instrumentation, RequestTiming
+from .orders import TERMINAL_ORDER_STATES
+from .ratelimit import RateLimiter, parse_retry_after
+from .retry import RetryPolicy, RetryStats
+from .serializers import JSONSerializer, get_serializer, loads_or_text
+from .singleflight import SingleFlight
+from .validation import VALID_ORDER_SIDES, VALID_ORDER_TYPES, OrderValidator
+
+VALID_ORDER_STATES = ['open', 'canceled', 'partially_filled', 'filled', 'failed']
+# States in which an order can still be cancelled
+CANCELABLE_ORDER_STATES = ['open', 'partially_filled']
+
+
+def _as_list(value: Union[str, List[str]]) -> List[str]:
+    """Wrap a single string in a list so it can be sent as a repeated query parameter."""
+    if isinstance(value, str):
+        return [value]
+    return value
+
+
+def _format_datetime(dt: Union[str, datetime]) -> str:
+    """Format datetime objects the way the API expects (ISO 8601, UTC)."""
+    if isinstance(dt, datetime):
+        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return dt
+
+
+def _error_from_response(status_code: int, error_data: Any) -> CryptoHoodAPIError:
+    """
+    Map an error response body to the matching exception.
+
+    Args:
+        status_code (int): HTTP status code of the response
+        error_data (Any): Decoded response body
+
+    Returns:
+        CryptoHoodAPIError: Exception to raise for this response
+    """
+    if not isinstance(error_data, dict):
+        return CryptoHoodAPIError(f"Unknown error (HTTP {status_code}): {error_data}")
+
+    error_type = error_data.get('type')
+
+    if error_type == 'validation_error':
+        return ValidationError(error_data)
+    elif error_type == 'client_error':
+        return ClientError({'status_code': status_code, **error_data})
+    elif error_type == 'server_error':
+        return ServerError({'status_code': status_code, **error_data})
+    else:
+        return CryptoHoodAPIError(f"Unknown error: {error_data}")
+
+
+def _next_page_endpoint(response: Dict) -> Optional[str]:
+    """Return the path and query of a paginated response's next page, or None on the last page."""
+    next_url = response.get('next') if isinstance(response, dict) else None
+    if not next_url:
+        return None
+
+    parts = urlsplit(next_url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def _build_order_payload(symbol: str,
+                         side: str,
+                         order_type: str,
+                         quantity: str,
+                         price: str = None,
+                         client_order_id: Optional[str] = None) -> Dict:
+    """Build the request body for a new order, generating a client_order_id if none is given."""
+    order_config = {"asset_quantity": quantity}
+    if price and order_type == "limit":
+        order_config["price"] = price
+
+    return {
+        "client_order_id": client_order_id or str(uuid.uuid4()),
+        "side": side,
+        "type": order_type,
+        "symbol": symbol,
+        f"{order_type}_order_config": order_config
+    }
+
+
+def _build_list_params(filter_name: str,
+                       values: Optional[Union[str, List[str]]] = None,
+                       limit: Optional[int] = None,
+                       cursor: Optional[str] = None) -> Dict:
+    """Build query parameters for the paginated list endpoints (trading pairs, holdings)."""
+    params = {}
+
+    if values:
+        params[filter_name] = _as_list(values)
+
+    if limit:
+        params['limit'] = limit
+
+    if cursor:
+        params['cursor'] = cursor
+
+    return params
+
+
+def _build_orders_params(created_at_start: Optional[Union[str, datetime]] = None,
+                         created_at_end: Optional[Union[str, datetime]] = None,
+                         updated_at_start: Optional[Union[str, datetime]] = None,
+                         updated_at_end: Optional[Union[str, datetime]] = None,
+                         symbol: Optional[str] = None,
+                         order_id: Optional[str] = None,
+                         side: Optional[str] = None,
+                         state: Optional[str] = None,
+                         order_type: Optional[str] = None,
+                         limit: Optional[int] = None,
+                         cursor: Optional[str] = None) -> Dict:
+    """
+    Validate order filters and build query parameters for the orders endpoint.
+
+    Raises:
+        ValidationError: If side, state or order_type is not a supported value
+    """
+    params = {}
+
+    # Add parameters if they are provided
+    if created_at_start:
+        params['created_at_start'] = _format_datetime(created_at_start)
+    if created_at_end:
+        params['created_at_end'] = _format_datetime(created_at_end)
+    if updated_at_start:
+        params['updated_at_start'] = _format_datetime(updated_at_start)
+    if updated_at_end:
+        params['updated_at_end'] = _format_datetime(updated_at_end)
+    if symbol:
+        params['symbol'] = symbol.upper()
+    if order_id:
+        params['id'] = order_id
+    if side:
+        if side not in VALID_ORDER_SIDES:
+            raise ValidationError({'errors': [{'attr': 'side', 'detail': 'Must be either "buy" or "sell"'}]})
+        params['side'] = side
+    if state:
+        if state not in VALID_ORDER_STATES:
+            raise ValidationError({'errors': [{'attr': 'state', 'detail': f'Must be one of: {", ".join(VALID_ORDER_STATES)}'}]})
+        params['state'] = state
+    if order_type:
+        if order_type not in VALID_ORDER_TYPES:
+            raise ValidationError({'errors': [{'attr': 'type', 'detail': f'Must be one of: {", ".join(VALID_ORDER_TYPES)}'}]})
+        params['type'] = order_type
+    if limit:
+        params['limit'] = limit
+    if cursor:
+        params['cursor'] = cursor
+
+    return params
+
+
+# Live clients, so a forked child can drop the connection pools it inherited
+_clients = weakref.WeakSet()
+
+
+def _reset_clients_after_fork():
+    for client in list(_clients):
+        client._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
 
 
 class CryptoHood:
     """
     Main client for interacting with Robinhood Crypto API.
+
+    Thread safety:
+        One client can be shared by any number of threads. Requests draw connections from a
+        thread-safe pool (size it with pool_maxsize to at least the number of threads, or
+        excess connections are opened and discarded), signing holds no per-request state,
+        and the rate limiter, response cache, retry counters and order validator are guarded
+        by their own short locks that are never held during network I/O. The session keeps no
+        cookies, so responses never write shared session state. Do not call close() while
+        other threads still have requests in flight.
+
+    Processes:
+        Clients can be pickled (only their ClientConfig is sent) and survive fork: the session
+        and signing key are created lazily in the process that uses them, and a forked child
+        opens its own connections instead of reusing the parent's sockets. See
+        cryptohood.parallel.map_symbols() for running work across a process pool.
     """
 
-    def __init__(self, api_key: str, private_key: str, public_key: str = None):
+    # Transport errors that are safe to retry when a RetryPolicy does not name its own
+    RETRYABLE_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+    def __init__(self,
+                 api_key: str,
+                 private_key: str,
+                 public_key: str = None,
+                 base_url: str = BASE_URL,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 timeout: Optional[float] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[ResponseCache] = None,
+                 serializer: Optional[Union[str, JSONSerializer]] = None,
+                 validate_orders: bool = False,
+                 instrumentation: Optional[Instrumentation] = None,
+                 sync_clock: bool = True,
+                 presign: bool = False,
+                 single_flight: bool = False):
         """
         Initialize the CryptoHood client.
 
@@ -21,9 +230,165 @@ class CryptoHood:
             api_key (str): Your Robinhood API key
             private_key (str): Base64 encoded private key
             public_key (str): Optional base64 encoded public key
+            base_url (str): API root URL (default: https://trading.robinhood.com)
+            pool_connections (int): Number of per-host connection pools to keep
+            pool_maxsize (int): Maximum number of kept-alive connections per host
+            pool_block (bool): Block when all pooled connections are busy instead of opening extra ones
+            timeout (Optional[float]): Request timeout in seconds (default: no timeout)
+            rate_limiter (Optional[RateLimiter]): Paces outgoing requests locally; may be shared between clients
+            retry_policy (Optional[RetryPolicy]): When and how to retry failed requests (default: no retries)
+            cache (Optional[ResponseCache]): Caches reference data such as trading pairs and account details
+            serializer (Optional[Union[str, JSONSerializer]]): JSON library for bodies: "json", "orjson", "ujson"
+                or a serializer instance (default: fastest installed)
+            validate_orders (bool): Check orders against the trading pair rules before sending them; the
+                rules are loaded on the first order
+            instrumentation (Optional[Instrumentation]): Collects per-endpoint timings and runs request hooks;
+                may be shared between clients (default: a new one per client)
+            sync_clock (bool): Correct request timestamps for the server's clock, estimated from response
+                Date headers, and re-sign and resend a request once if the server rejects its timestamp
+            presign (bool): Sign repeated body-less requests for the next second on a background thread
+            single_flight (bool): Share one request and its parsed response between identical GET calls
+                (same endpoint and query parameters) that are in flight at the same time
+        """
+        self.config = ClientConfig(api_key, private_key, public_key, base_url, pool_connections, pool_maxsize,
+                                   pool_block, timeout, retry_policy, rate_limiter.limits if rate_limiter else None,
+                                   serializer, validate_orders, sync_clock, presign, single_flight)
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=1)
+        self.retry_stats = RetryStats()
+        self.cache = cache
+        self.serializer = get_serializer(serializer)
+        self.validator = OrderValidator() if validate_orders else None
+        self.instrumentation = instrumentation or Instrumentation()
+        self.clock = ServerClock() if sync_clock else None
+        self.single_flight = SingleFlight() if single_flight else None
+
+        # The signing key and session are built on first use, in the process that uses them
+        self._init_lock = threading.Lock()
+        self._auth = None
+        self._session = None
+        self._pid = os.getpid()
+        _clients.add(self)
+
+    @classmethod
+    def from_config(cls, config: ClientConfig, **overrides) -> "CryptoHood":
         """
-        self.base_url = "https://trading.robinhood.com"
-        self.auth = CryptoHoodAuth(api_key, private_key, public_key)
+        Build a client from a ClientConfig.
+
+        Args:
+            config (ClientConfig): Client settings
+            **overrides: Constructor arguments that replace the config's (e.g. cache)
+
+        Returns:
+            CryptoHood: New client
+        """
+        return cls(**dict(config.client_kwargs(), **overrides))
+
+    def __getstate__(self) -> Dict:
+        # Only the config crosses process boundaries; sessions, keys and locks are rebuilt on the other side
+        return {"config": self.config}
+
+    def __setstate__(self, state: Dict):
+        self.__init__(**state["config"].client_kwargs())
+
+    @property
+    def auth(self) -> CryptoHoodAuth:
+        """Request signer, created with the signing key on first use."""
+        if self._auth is None:
+            with self._init_lock:
+                if self._auth is None:
+                    config = self.config
+                    auth = CryptoHoodAuth(config.api_key, config.private_key, config.public_key, clock=self.clock)
+                    if config.presign:
+                        auth.start_presigning()
+                    self._auth = auth
+        return self._auth
+
+    @auth.setter
+    def auth(self, auth: CryptoHoodAuth):
+        self._auth = auth
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session, created on first use and recreated in a forked child process."""
+        if self._session is None or self._pid != os.getpid():
+            with self._init_lock:
+                if self._session is None or self._pid != os.getpid():
+                    config = self.config
+                    self._session = self._create_session(config.pool_connections, config.pool_maxsize,
+                                                         config.pool_block)
+                    self._pid = os.getpid()
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session):
+        self._session = session
+        self._pid = os.getpid()
+
+    def _after_fork(self):
+        """Drop state inherited from the parent process; a connection socket must never be shared."""
+        self._init_lock = threading.Lock()
+        self._session = None
+        # Calls in flight at fork belong to parent threads that the child does not have; waiting on them would hang
+        if self.single_flight is not None:
+            self.single_flight = SingleFlight()
+        # The presigning thread does not survive fork
+        if self._auth is not None and self.config.presign:
+            self._auth.start_presigning()
+
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int, pool_block: bool) -> requests.Session:
+        """
+        Create a pooled, keep-alive HTTP session.
+
+        Args:
+            pool_connections (int): Number of per-host connection pools to keep
+            pool_maxsize (int): Maximum number of kept-alive connections per host
+            pool_block (bool): Block when the pool is exhausted
+
+        Returns:
+            requests.Session: Session whose connections are reused across requests
+        """
+        session = requests.Session()
+        # The API is authenticated by signed headers; rejecting cookies keeps responses from mutating shared state
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Close the HTTP session, release all pooled connections and stop presigning."""
+        if self._session is not None and self._pid == os.getpid():
+            self._session.close()
+        self._session = None
+        if self._auth is not None:
+            self._auth.stop_presigning()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the client's request metrics.
+
+        Returns:
+            Dict[str, Any]: "endpoints" (per-endpoint calls, errors, retries, latency percentiles and mean
+            phase timings, see Instrumentation.snapshot()), "retries" (retry counters), "cache" (cache
+            counters, or None without a cache) and "single_flight" (GET calls sent and shared, or None
+            when single_flight is off)
+        """
+        return {
+            "endpoints": self.instrumentation.snapshot(),
+            "retries": self.retry_stats.snapshot(),
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "single_flight": self.single_flight.stats() if self.single_flight is not None else None
+        }
+
+    def __enter__(self) -> "CryptoHood":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _make_request(self, method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Any:
         """
@@ -37,33 +402,130 @@ class CryptoHood:
 
         Returns:
             Any: Response data
+
+        Raises:
+            RateLimitError: If the server rejected the request with HTTP 429
         """
+        if method == "GET" and self.single_flight is not None:
+            key = ResponseCache.make_key(endpoint, params)
+            return self.single_flight.do(key, lambda: self._timed_request(method, endpoint, params, data))
+        return self._timed_request(method, endpoint, params, data)
+
+    def _timed_request(self, method: str, endpoint: str, params: Optional[Dict], data: Optional[Dict]) -> Any:
+        """Send one request, recording its timing with the instrumentation."""
+        timing = self.instrumentation.start(method, endpoint)
+        try:
+            return self._send(method, endpoint, params, data, timing)
+        except Exception as e:
+            timing.error = e
+            raise
+        finally:
+            self.instrumentation.finish(timing)
+
+    def _send(self, method: str, endpoint: str, params: Optional[Dict], data: Optional[Dict],
+              timing: RequestTiming) -> Any:
+        """Send a request with retries, recording the time spent in each phase."""
         url = f"{self.base_url}{endpoint}"
-        body = json.dumps(data) if data else ""
+        # Serialize once: the signed bytes are exactly the bytes sent
+        body = self.serializer.dumps(data) if data else b""
+        policy = self.retry_policy
+        started = time.monotonic()
+        attempt = 0
+        resigned = False
+
+        while True:
+            attempt += 1
+            timing.attempts += 1
+            clock = time.perf_counter()
+            if self.rate_limiter:
+                self.rate_limiter.acquire(endpoint)
+                now = time.perf_counter()
+                timing.queued += now - clock
+                clock = now
+
+            # Sign every attempt so the timestamp is never stale
+            headers = self.auth.generate_headers(method, endpoint, body)
+            self.retry_stats.record_attempt()
+            now = time.perf_counter()
+            timing.sign += now - clock
+            clock = now
+
+            sent_at = time.time()
+            try:
+                response = self.session.request(method=method,
+                                                url=url,
+                                                headers=headers,
+                                                params=params,
+                                                data=body or None,
+                                                timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                timing.transport += time.perf_counter() - clock
+                if policy.is_retryable_exception(e, self.RETRYABLE_EXCEPTIONS) and self._wait_before_retry(attempt, started):
+                    continue
+                raise CryptoHoodAPIError(f"Request failed: {str(e)}")
+
+            now = time.perf_counter()
+            received_at = time.time()
+            timing.transport += now - clock
+            timing.server = (timing.server or 0.0) + response.elapsed.total_seconds()
+            timing.status = response.status_code
+            date = response.headers.get("Date")
+            if self.clock is not None:
+                self.clock.observe(date, sent_at, received_at)
+
+            retry_after = None
+            if response.status_code == 429:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if self.rate_limiter:
+                    self.rate_limiter.penalize(endpoint, retry_after)
+
+            if policy.is_retryable_status(response.status_code) and self._wait_before_retry(attempt, started, retry_after):
+                continue
+
+            # Handle different status codes (orders are created with 201)
+            if response.status_code == 429:
+                raise RateLimitError(retry_after)
+            payload = loads_or_text(self.serializer, response.content)
+            timing.decode += time.perf_counter() - now
+            if 200 <= response.status_code < 300:
+                return payload
+            # A timestamp rejected for clock skew: re-sign once with the server's clock and resend
+            if not resigned and self.clock is not None and is_timestamp_rejection(response.status_code, payload) \
+                    and self.clock.calibrate(date, sent_at, received_at):
+                resigned = True
+                # The resend corrects the clock; it does not use up one of the retry policy's attempts
+                attempt -= 1
+                continue
+            raise _error_from_response(response.status_code, payload)
+
+    def _cached_request(self, endpoint: str, params: Dict = None) -> Any:
+        """Make a GET request, serving it from the response cache when one is configured."""
+        if self.cache is None:
+            return self._make_request("GET", endpoint, params=params)
+        return self.cache.get_or_fetch(endpoint, params, lambda: self._make_request("GET", endpoint, params=params))
 
-        headers = self.auth.generate_headers(method, endpoint, body)
+    def _wait_before_retry(self, attempt: int, started: float, retry_after: Optional[int] = None) -> bool:
+        """
+        Sleep before the next attempt if the retry policy allows one.
 
-        try:
-            response = requests.request(method=method, url=url, headers=headers, params=params, json=data)
-
-            # Handle different status codes
-            if response.status_code == 200:
-                return response.json()
-            else:
-                error_data = response.json()
-                error_type = error_data.get('type')
-
-                if error_type == 'validation_error':
-                    raise ValidationError(error_data)
-                elif error_type == 'client_error':
-                    raise ClientError(error_data)
-                elif error_type == 'server_error':
-                    raise ServerError(error_data)
-                else:
-                    raise CryptoHoodAPIError(f"Unknown error: {error_data}")
-
-        except requests.exceptions.RequestException as e:
-            raise CryptoHoodAPIError(f"Request failed: {str(e)}")
+        Args:
+            attempt (int): Number of attempts made so far
+            started (float): time.monotonic() when the first attempt started
+            retry_after (Optional[int]): Server-provided Retry-After in seconds
+
+        Returns:
+            bool: True if the caller should try again
+        """
+        delay = self.retry_policy.next_delay(attempt, time.monotonic() - started, retry_after)
+        if delay is None:
+            # Without retries enabled nothing was given up on
+            if self.retry_policy.max_attempts > 1:
+                self.retry_stats.record_exhausted()
+            return False
+
+        self.retry_stats.record_retry(delay)
+        time.sleep(delay)
+        return True
 
     def get_account(self) -> Dict:
         """
@@ -77,7 +539,7 @@ class CryptoHood:
                 - buying_power_currency (str)
         """
         endpoint = "/api/v1/crypto/trading/accounts/"
-        return self._make_request("GET", endpoint)
+        return self._cached_request(endpoint)
 
     def get_best_bid_ask(self, symbols: Union[str, List[str]] = None) -> Dict:
         """
@@ -93,9 +555,7 @@ class CryptoHood:
 
         params = {}
         if symbols:
-            if isinstance(symbols, str):
-                symbols = [symbols]
-            params = {"symbol": symbols}
+            params = {"symbol": _as_list(symbols)}
 
         return self._make_request("GET", endpoint, params=params)
 
@@ -120,33 +580,39 @@ class CryptoHood:
 
         return self._make_request("GET", endpoint, params=params)
 
-    def place_order(self, symbol: str, side: str, order_type: str, quantity: str, price: str = None) -> Dict:
+    def place_order(self,
+                    symbol: str,
+                    side: str,
+                    order_type: str,
+                    quantity: str,
+                    price: str = None,
+                    client_order_id: Optional[str] = None) -> Dict:
         """
         Place a crypto order.
 
+        The same client_order_id is sent on every retry, so the API never fills a retried order twice.
+
         Args:
             symbol (str): Trading pair symbol (e.g., "BTC-USD")
             side (str): Order side ("buy" or "sell")
             order_type (str): Order type ("market" or "limit")
             quantity (str): Order quantity
             price (str, optional): Limit price (required for limit orders)
+            client_order_id (str, optional): Idempotency key (default: a new UUID4)
 
         Returns:
             Dict: Order details
-        """
-        endpoint = "/api/v1/crypto/trading/orders/"
 
-        order_config = {"asset_quantity": quantity}
-        if price and order_type == "limit":
-            order_config["price"] = price
+        Raises:
+            InvalidSymbolError: If validate_orders is enabled and the symbol is not a trading pair
+            ValidationError: If the order breaks the trading rules (checked locally when validate_orders is enabled)
+        """
+        if self.validator is not None:
+            self.validator.ensure_loaded(self)
+            self.validator.validate(symbol, side, order_type, quantity, price)
 
-        data = {
-            "client_order_id": str(uuid.uuid4()),
-            "side": side,
-            "type": order_type,
-            "symbol": symbol,
-            f"{order_type}_order_config": order_config
-        }
+        endpoint = "/api/v1/crypto/trading/orders/"
+        data = _build_order_payload(symbol, side, order_type, quantity, price, client_order_id)
 
         return self._make_request("POST", endpoint, data=data)
 
@@ -166,20 +632,9 @@ class CryptoHood:
             Dict: Trading pairs information with pagination
         """
         endpoint = "/api/v1/crypto/trading/trading_pairs/"
-        params = {}
-
-        if symbols:
-            if isinstance(symbols, str):
-                symbols = [symbols]
-            params['symbol'] = symbols
+        params = _build_list_params('symbol', symbols, limit, cursor)
 
-        if limit:
-            params['limit'] = limit
-
-        if cursor:
-            params['cursor'] = cursor
-
-        return self._make_request("GET", endpoint, params=params)
+        return self._cached_request(endpoint, params=params)
 
     def get_holdings(self,
                      asset_codes: Optional[Union[str, List[str]]] = None,
@@ -197,18 +652,7 @@ class CryptoHood:
             Dict: Holdings information with pagination
         """
         endpoint = "/api/v1/crypto/trading/holdings/"
-        params = {}
-
-        if asset_codes:
-            if isinstance(asset_codes, str):
-                asset_codes = [asset_codes]
-            params['asset_code'] = asset_codes
-
-        if limit:
-            params['limit'] = limit
-
-        if cursor:
-            params['cursor'] = cursor
+        params = _build_list_params('asset_code', asset_codes, limit, cursor)
 
         return self._make_request("GET", endpoint, params=params)
 
@@ -244,95 +688,128 @@ class CryptoHood:
             Dict: Orders information with pagination
         """
         endpoint = "/api/v1/crypto/trading/orders/"
-        params = {}
+        params = _build_orders_params(created_at_start, created_at_end, updated_at_start, updated_at_end, symbol, order_id,
+                                      side, state, order_type, limit, cursor)
 
-        # Helper function to format datetime objects
-        def format_datetime(dt):
-            if isinstance(dt, datetime):
-                return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-            return dt
-
-        # Add parameters if they are provided
-        if created_at_start:
-            params['created_at_start'] = format_datetime(created_at_start)
-        if created_at_end:
-            params['created_at_end'] = format_datetime(created_at_end)
-        if updated_at_start:
-            params['updated_at_start'] = format_datetime(updated_at_start)
-        if updated_at_end:
-            params['updated_at_end'] = format_datetime(updated_at_end)
-        if symbol:
-            params['symbol'] = symbol.upper()
-        if order_id:
-            params['id'] = order_id
-        if side:
-            if side not in ['buy', 'sell']:
-                raise ValidationError({'errors': [{'attr': 'side', 'detail': 'Must be either "buy" or "sell"'}]})
-            params['side'] = side
-        if state:
-            valid_states = ['open', 'canceled', 'partially_filled', 'filled', 'failed']
-            if state not in valid_states:
-                raise ValidationError({'errors': [{'attr': 'state', 'detail': f'Must be one of: {", ".join(valid_states)}'}]})
-            params['state'] = state
-        if order_type:
-            valid_types = ['limit', 'market', 'stop_limit', 'stop_loss']
-            if order_type not in valid_types:
-                raise ValidationError({'errors': [{'attr': 'type', 'detail': f'Must be one of: {", ".join(valid_types)}'}]})
-            params['type'] = order_type
-        if limit:
-            params['limit'] = limit
-        if cursor:
-            params['cursor'] = cursor
+        return self._make_request("GET", endpoint, params=params)
 
-            return self._make_request("GET", endpoint, params=params)
+    def _iter_pages(self, response: Dict, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Follow the next cursor lazily, yielding one page at a time.
+
+        Args:
+            response (Dict): First page
+            prefetch (bool): Fetch the next page on a background thread while the current page is consumed
+
+        Yields:
+            Dict: Each page, starting with the one passed in
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        try:
+            while True:
+                next_endpoint = _next_page_endpoint(response)
+                pending = None
+                if executor and next_endpoint:
+                    pending = executor.submit(self._make_request, "GET", next_endpoint)
 
-        def get_paginated_results(self, initial_response: Dict) -> List:
-            """
-            Helper method to get all paginated results.
+                yield response
 
-            Args:
-                initial_response (Dict): Initial API response with pagination
+                if not next_endpoint:
+                    return
+                response = pending.result() if pending else self._make_request("GET", next_endpoint)
 
-            Returns:
-                List: All combined results
-            """
-            all_results = initial_response.get('results', [])
-            next_url = initial_response.get('next')
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
 
-            while next_url:
-                # Extract endpoint and params from next_url
-                path = next_url.split(self.base_url)[-1]
-                response = self._make_request("GET", path)
-                all_results.extend(response.get('results', []))
-                next_url = response.get('next')
+    def _iter_results(self, response: Dict, prefetch: bool = False) -> Iterator[Dict]:
+        """Yield every record of a paginated response, one at a time."""
+        for page in self._iter_pages(response, prefetch):
+            yield from page.get('results', [])
 
-            return all_results
+    def iter_orders(self, prefetch: bool = False, **filters) -> Iterator[Dict]:
+        """
+        Iterate over all orders matching the filters, one page in memory at a time.
 
-        def get_all_holdings(self, asset_codes: Optional[Union[str, List[str]]] = None) -> List:
-            """
-            Get all holdings without pagination.
+        Args:
+            prefetch (bool): Fetch the next page in the background while the current one is consumed
+            **filters: Same parameters as get_orders()
 
-            Args:
-                asset_codes (Optional[Union[str, List[str]]]): Single asset code or list of codes
+        Yields:
+            Dict: One order at a time
+        """
+        yield from self._iter_results(self.get_orders(**filters), prefetch)
 
-            Returns:
-                List: All holdings
-            """
-            initial_response = self.get_holdings(asset_codes=asset_codes)
-            return self.get_paginated_results(initial_response)
+    def iter_holdings(self,
+                      asset_codes: Optional[Union[str, List[str]]] = None,
+                      limit: Optional[int] = None,
+                      prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over all holdings, one page in memory at a time.
+
+        Args:
+            asset_codes (Optional[Union[str, List[str]]]): Single asset code or list of codes
+            limit (Optional[int]): Number of results per page
+            prefetch (bool): Fetch the next page in the background while the current one is consumed
+
+        Yields:
+            Dict: One holding at a time
+        """
+        yield from self._iter_results(self.get_holdings(asset_codes=asset_codes, limit=limit), prefetch)
+
+    def iter_trading_pairs(self,
+                           symbols: Optional[Union[str, List[str]]] = None,
+                           limit: Optional[int] = None,
+                           prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Iterate over all trading pairs, one page in memory at a time.
+
+        Args:
+            symbols (Optional[Union[str, List[str]]]): Single symbol or list of symbols
+            limit (Optional[int]): Number of results per page
+            prefetch (bool): Fetch the next page in the background while the current one is consumed
+
+        Yields:
+            Dict: One trading pair at a time
+        """
+        yield from self._iter_results(self.get_trading_pairs(symbols=symbols, limit=limit), prefetch)
+
+    def get_paginated_results(self, initial_response: Dict) -> List:
+        """
+        Helper method to get all paginated results.
+
+        Args:
+            initial_response (Dict): Initial API response with pagination
+
+        Returns:
+            List: All combined results
+        """
+        return list(self._iter_results(initial_response))
+
+    def get_all_holdings(self, asset_codes: Optional[Union[str, List[str]]] = None) -> List:
+        """
+        Get all holdings without pagination.
+
+        Args:
+            asset_codes (Optional[Union[str, List[str]]]): Single asset code or list of codes
+
+        Returns:
+            List: All holdings
+        """
+        return list(self.iter_holdings(asset_codes=asset_codes))
 
-        def get_all_orders(self, **kwargs) -> List:
-            """
-            Get all orders without pagination.
+    def get_all_orders(self, **kwargs) -> List:
+        """
+        Get all orders without pagination.
 
-            Args:
-                **kwargs: Same parameters as get_orders()
+        Args:
+            **kwargs: Same parameters as get_orders()
 
-            Returns:
-                List: All orders
-            """
-            initial_response = self.get_orders(**kwargs)
-            return self.get_paginated_results(initial_response)
+        Returns:
+            List: All orders
+        """
+        return list(self.iter_orders(**kwargs))
 
     def cancel_order(self, order_id: str) -> str:
         """
@@ -368,3 +845,80 @@ class CryptoHood:
             elif "already completed" in str(e).lower():
                 raise OrderError(f"Order {order_id} is already completed")
             raise
+
+    def _run_parallel(self, fn, items: List, max_workers: int) -> List[Union[Any, CryptoHoodAPIError]]:
+        """
+        Call fn for each item on a bounded thread pool.
+
+        Returns:
+            List[Union[Any, CryptoHoodAPIError]]: Each result, or the API error it raised, in input order
+        """
+        def call(item):
+            try:
+                return fn(item)
+            except CryptoHoodAPIError as e:
+                return e
+
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+            return list(executor.map(call, items))
+
+    def place_orders(self, orders: List[Dict], max_workers: int = 8) -> List[Union[Dict, CryptoHoodAPIError]]:
+        """
+        Place several orders concurrently.
+
+        Each order gets its client_order_id before submission, so retries stay idempotent. Requests
+        still go through the client's rate limiter, so the pool never outruns the API limits.
+
+        Args:
+            orders (List[Dict]): Keyword arguments for place_order() for each order, e.g.
+                {"symbol": "BTC-USD", "side": "buy", "order_type": "market", "quantity": "0.001"}
+            max_workers (int): Maximum number of orders in flight
+
+        Returns:
+            List[Union[Dict, CryptoHoodAPIError]]: Order details, or the error raised for that order
+            (ValidationError, OrderError, ...), in input order
+        """
+        specs = [dict(order, client_order_id=order.get('client_order_id') or str(uuid.uuid4())) for order in orders]
+        return self._run_parallel(lambda spec: self.place_order(**spec), specs, max_workers)
+
+    def cancel_orders(self,
+                      order_ids: Optional[List[str]] = None,
+                      max_workers: int = 8,
+                      **filters) -> Dict[str, Union[str, CryptoHoodAPIError]]:
+        """
+        Cancel several orders concurrently.
+
+        Args:
+            order_ids (Optional[List[str]]): Orders to cancel. When omitted, every open or partially filled order
+                matching filters is cancelled.
+            max_workers (int): Maximum number of cancellations in flight
+            **filters: get_orders() filters used to select orders when order_ids is omitted. Without a state
+                filter only open and partially filled orders are fetched.
+
+        Returns:
+            Dict[str, Union[str, CryptoHoodAPIError]]: Success message, or the error raised, keyed by order ID
+            in input order
+        """
+        if order_ids is None:
+            state = filters.pop('state', None)
+            states = [state] if state else CANCELABLE_ORDER_STATES
+            order_ids = [order['id'] for state in states for order in self.iter_orders(state=state, **filters)
+                         if order.get('state') not in TERMINAL_ORDER_STATES]
+
+        results = self._run_parallel(self.cancel_order, order_ids, max_workers)
+        return dict(zip(order_ids, results))
+
+    def cancel_all_orders(self, symbol: Optional[str] = None, max_workers: int = 8) -> Dict[str, Union[str, CryptoHoodAPIError]]:
+        """
+        Cancel every open or partially filled order, optionally only for one symbol.
+
+        Args:
+            symbol (Optional[str]): Trading pair symbol (e.g., "BTC-USD")
+            max_workers (int): Maximum number of cancellations in flight
+
+        Returns:
+            Dict[str, Union[str, CryptoHoodAPIError]]: Success message, or the error raised, keyed by order ID
+        """
+        return self.cancel_orders(symbol=symbol, max_workers=max_workers)
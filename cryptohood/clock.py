@@ -0,0 +1,114 @@
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+from typing import Any, Optional
+
+
+def is_timestamp_rejection(status_code: int, error_data: Any) -> bool:
+    """Whether an error response rejected the request's x-timestamp rather than its signature or key."""
+    if status_code != 401:
+        return False
+    if isinstance(error_data, dict):
+        details = " ".join(str(error.get('detail', '')) for error in error_data.get('errors', [])
+                           if isinstance(error, dict))
+    else:
+        details = str(error_data)
+    return "timestamp" in details.lower()
+
+
+class ServerClock:
+    """
+    Estimates the API server's clock from response Date headers.
+
+    Requests are signed with a timestamp that the server accepts only within 30 seconds of its
+    own clock, so a drifting local clock causes authentication failures. Each response's Date
+    header gives the server time to the second; the offset from the local clock at the middle
+    of the round trip is one sample, and samples are smoothed with an exponentially weighted
+    moving average (Date's one-second resolution makes single samples noisy by up to half a
+    second). now() is the local time plus the smoothed offset.
+
+    Observing a response costs two clock reads and a string comparison: a Date header is
+    parsed only when it differs from the previous one.
+
+    Attributes:
+        alpha (float): Weight of each new sample in the moving average
+        samples (int): Samples observed
+    """
+
+    def __init__(self, alpha: float = 0.1):
+        """
+        Initialize the clock with no offset.
+
+        Args:
+            alpha (float): Weight of each new sample in the moving average, from 0 to 1
+        """
+        self.alpha = alpha
+        self.samples = 0
+        self._offset = 0.0
+        self._last_header = None
+        self._last_server_time = None
+        self._lock = threading.Lock()
+
+    @property
+    def offset(self) -> float:
+        """Estimated server time minus local time, in seconds."""
+        return self._offset
+
+    def now(self) -> float:
+        """Estimated current server time as a Unix timestamp."""
+        return time.time() + self._offset
+
+    def _server_time(self, date_header: str) -> Optional[float]:
+        if date_header == self._last_header:
+            return self._last_server_time
+        parsed = parsedate_tz(date_header)
+        if parsed is None:
+            return None
+        # The header is truncated to the second; the middle of that second is the best estimate
+        server_time = mktime_tz(parsed) + 0.5
+        self._last_header, self._last_server_time = date_header, server_time
+        return server_time
+
+    def observe(self, date_header: Optional[str], sent_at: float, received_at: float):
+        """
+        Add one sample from a response.
+
+        Args:
+            date_header (Optional[str]): The response's Date header; ignored if missing or invalid
+            sent_at (float): time.time() when the request was sent
+            received_at (float): time.time() when the response arrived
+        """
+        if not date_header:
+            return
+        with self._lock:
+            server_time = self._server_time(date_header)
+            if server_time is None:
+                return
+            sample = server_time - (sent_at + received_at) / 2
+            self._offset = sample if not self.samples else self._offset + self.alpha * (sample - self._offset)
+            self.samples += 1
+
+    def calibrate(self, date_header: Optional[str], sent_at: float, received_at: float) -> bool:
+        """
+        Replace the estimate with one response's sample, after the server rejected a timestamp.
+
+        Args:
+            date_header (Optional[str]): The response's Date header
+            sent_at (float): time.time() when the request was sent
+            received_at (float): time.time() when the response arrived
+
+        Returns:
+            bool: True if the header was usable and the offset was reset
+        """
+        if not date_header:
+            return False
+        with self._lock:
+            server_time = self._server_time(date_header)
+            if server_time is None:
+                return False
+            self._offset = server_time - (sent_at + received_at) / 2
+            self.samples += 1
+            return True
+
+    def __repr__(self) -> str:
+        return f"ServerClock(offset={self._offset:+.3f}s, samples={self.samples})"
@@ -0,0 +1,86 @@
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+BASE_URL = "https://trading.robinhood.com"
+
+
+class ClientConfig:
+    """
+    Picklable settings for building a CryptoHood client.
+
+    A config holds only plain values (credentials, URLs, pool sizes, limits), so it can be sent
+    to other processes. Each process then builds its own session and signing key from it with
+    CryptoHood.from_config(). Rate limits are applied per process: divide them by the number
+    of worker processes to stay within the account-wide limit.
+
+    Usage:
+        config = ClientConfig(api_key, private_key, rate_limits={"marketdata": (0.5, 10)})
+        client = CryptoHood.from_config(config)
+    """
+
+    def __init__(self,
+                 api_key: str,
+                 private_key: str,
+                 public_key: str = None,
+                 base_url: str = BASE_URL,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 timeout: Optional[float] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 serializer: Optional[Union[str, Any]] = None,
+                 validate_orders: bool = False,
+                 sync_clock: bool = True,
+                 presign: bool = False,
+                 single_flight: bool = False):
+        """
+        Initialize the config. Arguments match CryptoHood's, except:
+
+        Args:
+            rate_limits (Optional[Dict[str, Tuple[float, float]]]): (requests per second, burst size) keyed by
+                endpoint family; each client built from the config gets its own RateLimiter with these limits
+            serializer (Optional[Union[str, Any]]): Serializer name ("json", "orjson", "ujson") or a picklable
+                serializer instance
+        """
+        self.api_key = api_key
+        self.private_key = private_key
+        self.public_key = public_key
+        self.base_url = base_url
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.rate_limits = dict(rate_limits) if rate_limits is not None else None
+        self.serializer = serializer
+        self.validate_orders = validate_orders
+        self.sync_clock = sync_clock
+        self.presign = presign
+        self.single_flight = single_flight
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        """Return CryptoHood constructor arguments, with a fresh RateLimiter if rate limits are set."""
+        return {
+            "api_key": self.api_key,
+            "private_key": self.private_key,
+            "public_key": self.public_key,
+            "base_url": self.base_url,
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+            "timeout": self.timeout,
+            "rate_limiter": RateLimiter(self.rate_limits) if self.rate_limits is not None else None,
+            "retry_policy": self.retry_policy,
+            "serializer": self.serializer,
+            "validate_orders": self.validate_orders,
+            "sync_clock": self.sync_clock,
+            "presign": self.presign,
+            "single_flight": self.single_flight
+        }
+
+    def __repr__(self) -> str:
+        # Never include the private key
+        return f"ClientConfig(api_key={self.api_key!r}, base_url={self.base_url!r})"
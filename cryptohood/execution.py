@@ -0,0 +1,456 @@
+import heapq
+import itertools
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_DOWN, Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .exceptions import ValidationError
+from .instrumentation import _Histogram
+from .orders import TERMINAL_ORDER_STATES, OrderTracker
+
+# Quantity precision when no OrderValidator supplies the pair's increment
+DEFAULT_QUANTITY_INCREMENT = Decimal("0.00000001")
+
+
+def _decimal(value: Any) -> Decimal:
+    return Decimal(str(value)) if value not in (None, "") else Decimal(0)
+
+
+class ParentOrder:
+    """
+    A large order executed as a schedule of child orders.
+
+    Attributes:
+        id (str): Local identifier of the parent order
+        symbol (str): Trading pair symbol
+        side (str): "buy" or "sell"
+        quantity (Decimal): Total quantity to execute
+        order_type (str): Type of the child orders ("market" or "limit")
+        weights (List[Decimal]): Share of the quantity targeted by each slice, summing to 1
+        start (float): time.monotonic() of the first slice
+        duration (float): Seconds from the first slice to the end of the schedule
+        state (str): "scheduled", "running", "filled", "expired", "canceled" or "failed"
+        children (List[Dict]): Child orders as returned by place_order()
+        errors (List[Exception]): Errors raised while placing or canceling children
+        slices_done (int): Slices executed so far
+    """
+
+    def __init__(self,
+                 symbol: str,
+                 side: str,
+                 quantity: Decimal,
+                 order_type: str,
+                 weights: List[Decimal],
+                 start: float,
+                 duration: float,
+                 limit_price: Optional[Union[str, Callable[["ParentOrder"], str]]],
+                 final_market: bool,
+                 tracker: OrderTracker):
+        self.id = str(uuid.uuid4())
+        self.symbol = symbol
+        self.side = side
+        self.quantity = quantity
+        self.order_type = order_type
+        self.weights = weights
+        self.start = start
+        self.duration = duration
+        self.limit_price = limit_price
+        self.final_market = final_market
+        self.state = 'scheduled'
+        self.children = []
+        self.errors = []
+        self.slices_done = 0
+        self.swept = False
+        self._cancel_requested = set()
+        self._tracker = tracker
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    @property
+    def end(self) -> float:
+        """time.monotonic() at which the schedule ends."""
+        return self.start + self.duration
+
+    def target(self, slices: int) -> Decimal:
+        """Cumulative quantity that should be executed or working after the first `slices` slices."""
+        if slices >= len(self.weights):
+            return self.quantity
+        return self.quantity * sum(self.weights[:slices], Decimal(0))
+
+    def _child_states(self) -> List[Dict]:
+        """Latest known version of each child: from the tracker if it has seen an update, else as placed."""
+        return [self._tracker.get(child['id']) or child for child in self.children]
+
+    @property
+    def filled_quantity(self) -> Decimal:
+        """Quantity filled across all children, as of the tracker's last refresh."""
+        return sum((_decimal(child.get('filled_asset_quantity')) for child in self._child_states()), Decimal(0))
+
+    def working_quantity(self) -> Decimal:
+        """Unfilled quantity of children that can still fill."""
+        working = Decimal(0)
+        for child in self._child_states():
+            if child.get('state') not in TERMINAL_ORDER_STATES:
+                working += _decimal(_child_quantity(child)) - _decimal(child.get('filled_asset_quantity'))
+        return working
+
+    @property
+    def done(self) -> bool:
+        """Whether the parent reached a final state."""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the parent reaches a final state.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait
+
+        Returns:
+            bool: True if the parent finished, False on timeout
+        """
+        return self._done.wait(timeout)
+
+    def _finish(self, state: str):
+        self.state = state
+        self._done.set()
+
+    def __repr__(self) -> str:
+        return (f"ParentOrder({self.side} {self.quantity} {self.symbol}, state={self.state!r}, "
+                f"slices={self.slices_done}/{len(self.weights)}, children={len(self.children)})")
+
+
+def _child_quantity(order: Dict) -> Optional[str]:
+    config = order.get(f"{order.get('type')}_order_config") or {}
+    return config.get('asset_quantity')
+
+
+class ExecutionScheduler:
+    """
+    Executes large orders as time-sliced child orders (TWAP, or VWAP-style with a volume profile).
+
+    A parent order's quantity is split into slices spread evenly over its duration. Each slice
+    places a child order for the parent's cumulative target so far, minus what has already
+    filled and what is still working, so shortfalls from unfilled or rejected children roll
+    into later slices. With limit children, children still open when the next slice is due
+    are canceled first and their remainder re-placed at the new price. When the schedule ends
+    the remaining open children are canceled and, with final_market=True, any remainder is
+    swept with a market order.
+
+    All parent orders share one timer thread driven by a heap of due events, so timing does not
+    depend on how many parents run. The timer thread only dispatches; child orders are placed
+    on a small worker pool so a slow request does not delay other parents' slices. Requests
+    go through the client, so its RateLimiter paces them. Fills are tracked by an OrderTracker
+    that polls get_orders for orders updated since its last poll.
+
+    Usage:
+        with ExecutionScheduler(client) as scheduler:
+            parent = scheduler.submit("BTC-USD", "buy", "0.5", duration=600, slices=20)
+            parent.wait()
+
+    Attributes:
+        client (CryptoHood): Client used to place and cancel child orders
+        tracker (OrderTracker): Tracks child order fills
+        poll_interval (float): Seconds between tracker refreshes and end-of-schedule checks
+        finish_timeout (float): Seconds after the end of a schedule to wait for children to settle
+    """
+
+    def __init__(self,
+                 client,
+                 tracker: Optional[OrderTracker] = None,
+                 poll_interval: float = 1.0,
+                 workers: int = 4,
+                 finish_timeout: float = 60.0,
+                 validator=None):
+        """
+        Initialize the scheduler; call start() or use it as a context manager to run it.
+
+        Args:
+            client (CryptoHood): Client used to place and cancel child orders
+            tracker (Optional[OrderTracker]): Tracker for child orders (default: a new one, refreshed by the
+                scheduler every poll_interval with a watermark overlap of at least poll_interval)
+            poll_interval (float): Seconds between tracker refreshes and end-of-schedule checks
+            workers (int): Threads placing child orders. More workers place simultaneous slices sooner but
+                compete with the timer thread for the GIL, which adds to its jitter
+            finish_timeout (float): Seconds after the end of a schedule to wait for children to settle
+            validator (Optional[OrderValidator]): Rounds child quantities to the pair's increment and skips
+                slices below its minimum order size (default: the client's validator, if any)
+        """
+        self.client = client
+        # Rewinding each refresh by a whole poll interval keeps fills stamped late by the server in range
+        self.tracker = tracker or OrderTracker(client, overlap=max(1.0, poll_interval))
+        self._owns_tracker = tracker is None
+        self.poll_interval = poll_interval
+        self.workers = workers
+        self.finish_timeout = finish_timeout
+        self.validator = validator if validator is not None else getattr(client, 'validator', None)
+
+        self._parents = {}
+        self._events = []
+        self._sequence = itertools.count()
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._thread = None
+        self._executor = None
+        self._jitter = _Histogram(4096)
+        self._queue_delay = _Histogram(4096)
+        self._events_run = 0
+
+    def start(self) -> "ExecutionScheduler":
+        """Start the timer thread, the worker pool and, if the scheduler owns it, the tracker."""
+        with self._wakeup:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopping = False
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="cryptohood-execution")
+            self._thread = threading.Thread(target=self._run, name="cryptohood-execution-timer", daemon=True)
+            self._thread.start()
+        if self._owns_tracker:
+            self.tracker.start(self.poll_interval)
+        return self
+
+    def stop(self, cancel: bool = False):
+        """
+        Stop the timer thread and worker pool.
+
+        Args:
+            cancel (bool): Cancel all running parent orders (and their open children) first
+        """
+        if cancel:
+            for parent in list(self._parents.values()):
+                self.cancel(parent.id)
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._owns_tracker:
+            self.tracker.stop()
+
+    def __enter__(self) -> "ExecutionScheduler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def submit(self,
+               symbol: str,
+               side: str,
+               quantity: Union[str, Decimal],
+               duration: float,
+               slices: int = 10,
+               volume_profile: Optional[Sequence[float]] = None,
+               order_type: str = "market",
+               limit_price: Optional[Union[str, Callable[[ParentOrder], str]]] = None,
+               final_market: bool = False,
+               delay: float = 0.0) -> ParentOrder:
+        """
+        Schedule a parent order.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTC-USD")
+            side (str): "buy" or "sell"
+            quantity (Union[str, Decimal]): Total quantity to execute
+            duration (float): Seconds over which the slices are spread
+            slices (int): Number of child orders for an even (TWAP) schedule
+            volume_profile (Optional[Sequence[float]]): Relative expected volume per slice (VWAP-style); its
+                length sets the number of slices and each slice's share of the quantity
+            order_type (str): Child order type, "market" or "limit"
+            limit_price (Optional[Union[str, Callable[[ParentOrder], str]]]): Price of limit children, or a
+                function called at each slice to price it (e.g. from the current best bid)
+            final_market (bool): Sweep any remainder with a market order when the schedule ends
+            delay (float): Seconds until the first slice
+
+        Returns:
+            ParentOrder: The scheduled parent order
+
+        Raises:
+            ValueError: If the schedule or order parameters are invalid
+        """
+        if order_type not in ('market', 'limit'):
+            raise ValueError("order_type must be 'market' or 'limit'")
+        if order_type == 'limit' and limit_price is None:
+            raise ValueError("limit_price is required for limit child orders")
+        if volume_profile is not None:
+            profile = [_decimal(weight) for weight in volume_profile]
+        else:
+            profile = [Decimal(1)] * slices
+        total = sum(profile, Decimal(0))
+        if not profile or total <= 0 or any(weight < 0 for weight in profile):
+            raise ValueError("The schedule needs at least one slice with a positive weight")
+        quantity = _decimal(quantity)
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+
+        parent = ParentOrder(symbol.upper(), side, quantity, order_type, [weight / total for weight in profile],
+                             time.monotonic() + delay, duration, limit_price, final_market, self.tracker)
+        self._parents[parent.id] = parent
+        interval = duration / len(profile)
+        for i in range(len(profile)):
+            self._schedule(parent.start + i * interval, self._run_slice, parent, i)
+        self._schedule(parent.end, self._run_finish, parent)
+        return parent
+
+    def cancel(self, parent_id: str):
+        """
+        Cancel a parent order: remaining slices are skipped and open children are canceled.
+
+        Args:
+            parent_id (str): ParentOrder.id
+        """
+        parent = self._parents.get(parent_id)
+        if parent is None or parent.done:
+            return
+        with parent._lock:
+            self._cancel_open_children(parent)
+            parent._finish('canceled')
+
+    def get(self, parent_id: str) -> Optional[ParentOrder]:
+        """Return a parent order by id."""
+        return self._parents.get(parent_id)
+
+    def parents(self) -> List[ParentOrder]:
+        """Return all parent orders submitted to this scheduler."""
+        return list(self._parents.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Timing of executed events.
+
+        Returns:
+            Dict[str, Any]: "events" executed, "pending" events, percentiles of the timer's lateness in
+            releasing each event after its due time ("jitter_p50_ms", "jitter_p95_ms", "jitter_p99_ms"), and
+            of the further wait for a free worker ("queue_p50_ms", ...), which grows when more child
+            orders are due at once than there are workers
+        """
+        with self._wakeup:
+            pending = len(self._events)
+            events = self._events_run
+            windows = {"jitter": list(self._jitter.samples), "queue": list(self._queue_delay.samples)}
+        stats = {"events": events, "pending": pending}
+        for name, samples in windows.items():
+            histogram = _Histogram(len(samples) or 1)
+            histogram.samples.extend(samples)
+            for label, value in histogram.percentiles().items():
+                stats[f"{name}_{label}_ms"] = value * 1000 if value is not None else None
+        return stats
+
+    def _schedule(self, due: float, callback: Callable, *args):
+        with self._wakeup:
+            heapq.heappush(self._events, (due, next(self._sequence), callback, args))
+            # Only wake the timer if this event is now the earliest
+            if self._events[0][0] == due:
+                self._wakeup.notify()
+
+    def _run(self):
+        with self._wakeup:
+            while not self._stopping:
+                if not self._events:
+                    self._wakeup.wait()
+                    continue
+                wait = self._events[0][0] - time.monotonic()
+                if wait > 0:
+                    self._wakeup.wait(wait)
+                    continue
+                due, _, callback, args = heapq.heappop(self._events)
+                released = time.monotonic()
+                self._jitter.add(released - due)
+                self._executor.submit(self._dispatch, released, callback, args)
+
+    def _dispatch(self, released: float, callback: Callable, args: tuple):
+        delay = time.monotonic() - released
+        with self._wakeup:
+            self._queue_delay.add(delay)
+            self._events_run += 1
+        callback(*args)
+
+    def _round(self, parent: ParentOrder, quantity: Decimal) -> Decimal:
+        """Round down to the pair's increment; quantities below its minimum order size become 0."""
+        increment = DEFAULT_QUANTITY_INCREMENT
+        minimum = Decimal(0)
+        if self.validator is not None:
+            try:
+                self.validator.ensure_loaded(self.client)
+                pair = self.validator.get_pair(parent.symbol)
+                increment = pair.asset_increment or increment
+                minimum = pair.min_order_size or minimum
+            except Exception:
+                # Fall back to the defaults; place_order() reports the same problem for the parent
+                pass
+        rounded = (quantity / increment).to_integral_value(rounding=ROUND_DOWN) * increment
+        return rounded if rounded > 0 and rounded >= minimum else Decimal(0)
+
+    def _place_child(self, parent: ParentOrder, quantity: Decimal, order_type: str) -> bool:
+        """Place one child order. Returns False if the parent failed."""
+        price = None
+        try:
+            if order_type == 'limit':
+                price = parent.limit_price(parent) if callable(parent.limit_price) else parent.limit_price
+            child = self.tracker.place_order(parent.symbol, parent.side, order_type, f"{quantity:f}",
+                                             price=str(price) if price is not None else None)
+        except ValidationError as e:
+            # The same child would be rejected again on the next slice
+            parent.errors.append(e)
+            self._cancel_open_children(parent)
+            parent._finish('failed')
+            return False
+        except Exception as e:
+            # Transient failure: the shortfall is picked up by the next slice
+            parent.errors.append(e)
+            return True
+        parent.children.append(child)
+        return True
+
+    def _cancel_open_children(self, parent: ParentOrder) -> bool:
+        """Request cancellation of every child that can still fill. Returns True if any were open."""
+        open_children = [child for child in parent._child_states() if child.get('state') not in TERMINAL_ORDER_STATES]
+        for child in open_children:
+            if child.get('type') == 'market' or child['id'] in parent._cancel_requested:
+                continue
+            parent._cancel_requested.add(child['id'])
+            try:
+                self.tracker.cancel_order(child['id'])
+            except Exception as e:
+                parent.errors.append(e)
+        return bool(open_children)
+
+    def _run_slice(self, parent: ParentOrder, index: int):
+        with parent._lock:
+            if parent.done:
+                return
+            parent.state = 'running'
+            if parent.order_type == 'limit':
+                # Re-price: unfilled limit children are canceled and their remainder placed again once they settle
+                self._cancel_open_children(parent)
+            parent.slices_done = index + 1
+            quantity = self._round(parent, parent.target(index + 1) - parent.filled_quantity -
+                                   parent.working_quantity())
+            if quantity > 0:
+                self._place_child(parent, quantity, parent.order_type)
+
+    def _run_finish(self, parent: ParentOrder):
+        with parent._lock:
+            if parent.done:
+                return
+            settling = self._cancel_open_children(parent)
+            remainder = self._round(parent, parent.quantity - parent.filled_quantity)
+
+            if not settling:
+                if remainder <= 0 or not parent.final_market or parent.swept:
+                    parent._finish('filled' if remainder <= 0 else 'expired')
+                    return
+                parent.swept = True
+                if not self._place_child(parent, remainder, 'market'):
+                    return
+
+            if time.monotonic() - parent.end > self.finish_timeout:
+                parent._finish('expired')
+                return
+        self._schedule(time.monotonic() + self.poll_interval, self._run_finish, parent)
@@ -0,0 +1,222 @@
+import re
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+# Path segments that identify a single resource, collapsed so per-endpoint stats stay bounded
+_ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)")
+
+PERCENTILES = (50, 95, 99)
+
+
+def endpoint_name(endpoint: str) -> str:
+    """Normalize an API path for stats: drop the query string and replace order ids with {id}."""
+    return _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+
+
+class RequestTiming:
+    """
+    Timing of one client call, including all of its retries. Durations are in seconds.
+
+    Attributes:
+        method (str): HTTP method
+        endpoint (str): Normalized API path (order ids replaced by {id})
+        status (Optional[int]): HTTP status of the last attempt (None if no response was received)
+        attempts (int): Requests sent, including retries
+        queued (float): Time waiting for the rate limiter
+        sign (float): Time spent signing
+        transport (float): Time from sending each request until its body was read
+        server (Optional[float]): Part of transport until the response headers arrived, which covers
+            connecting and server processing (sync client only)
+        decode (float): Time spent decoding the response body
+        total (float): Wall time of the whole call, including backoff between retries
+        error (Optional[Exception]): Exception raised by the call, if any
+    """
+
+    __slots__ = ("method", "endpoint", "status", "attempts", "queued", "sign", "transport", "server", "decode",
+                 "total", "error", "_started")
+
+    def __init__(self, method: str, endpoint: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.status = None
+        self.attempts = 0
+        self.queued = 0.0
+        self.sign = 0.0
+        self.transport = 0.0
+        self.server = None
+        self.decode = 0.0
+        self.total = 0.0
+        self.error = None
+        self._started = time.perf_counter()
+
+    def __repr__(self) -> str:
+        return (f"RequestTiming({self.method} {self.endpoint}, status={self.status}, "
+                f"total={self.total * 1000:.2f}ms, attempts={self.attempts})")
+
+
+class _Histogram:
+    """Rolling window of the most recent samples; percentiles are computed when read."""
+
+    __slots__ = ("samples",)
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)
+
+    def add(self, value: float):
+        self.samples.append(value)
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {f"p{pct}": None for pct in PERCENTILES}
+        return {f"p{pct}": ordered[min(len(ordered) - 1, len(ordered) * pct // 100)] for pct in PERCENTILES}
+
+
+class _EndpointStats:
+    __slots__ = ("calls", "retries", "errors", "latency", "phases")
+
+    def __init__(self, window: int):
+        self.calls = 0
+        self.retries = 0
+        self.errors = {}
+        self.latency = _Histogram(window)
+        self.phases = {"queued": 0.0, "sign": 0.0, "transport": 0.0, "server": 0.0, "decode": 0.0}
+
+
+class Instrumentation:
+    """
+    Per-endpoint request metrics and hooks for exporting them.
+
+    Every client call produces a RequestTiming broken down by phase. Calls, retries and errors
+    (by exception class) are counted per endpoint, and the latest `window` call latencies per
+    endpoint feed rolling p50/p95/p99 percentiles. Recording costs a few clock reads and one
+    short lock per call, so it is always on; percentiles are only computed in snapshot().
+
+    Hooks run on the calling thread. Exceptions raised by hooks never fail the request: they
+    are passed to on_hook_error if given and otherwise ignored.
+
+    Usage:
+        client = CryptoHood(api_key, private_key)
+        client.instrumentation.add_post_hook(lambda timing: exporter.observe(timing.endpoint, timing.total))
+        ...
+        print(client.stats()["endpoints"]["POST /api/v1/crypto/trading/orders/"]["p99_ms"])
+
+    Attributes:
+        window (int): Number of recent calls per endpoint used for percentiles
+        hook_errors (int): Exceptions raised by hooks
+    """
+
+    def __init__(self, window: int = 1024, on_hook_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Initialize the instrumentation.
+
+        Args:
+            window (int): Number of recent calls per endpoint used for percentiles
+            on_hook_error (Optional[Callable[[Exception], None]]): Called with exceptions raised by hooks
+        """
+        self.window = window
+        self.on_hook_error = on_hook_error
+        self.hook_errors = 0
+        self._pre_hooks = []
+        self._post_hooks = []
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def add_pre_hook(self, hook: Callable[[str, str], None]) -> Callable[[str, str], None]:
+        """
+        Register a hook called with (method, endpoint) before each client call.
+
+        Returns:
+            Callable[[str, str], None]: The hook, so this can be used as a decorator
+        """
+        self._pre_hooks = self._pre_hooks + [hook]
+        return hook
+
+    def add_post_hook(self, hook: Callable[[RequestTiming], None]) -> Callable[[RequestTiming], None]:
+        """
+        Register a hook called with the RequestTiming after each client call, whether it succeeded or not.
+
+        Returns:
+            Callable[[RequestTiming], None]: The hook, so this can be used as a decorator
+        """
+        self._post_hooks = self._post_hooks + [hook]
+        return hook
+
+    def remove_hook(self, hook: Callable):
+        """Remove a previously registered pre or post hook."""
+        self._pre_hooks = [registered for registered in self._pre_hooks if registered is not hook]
+        self._post_hooks = [registered for registered in self._post_hooks if registered is not hook]
+
+    def _run_hooks(self, hooks: List[Callable], *args):
+        for hook in hooks:
+            try:
+                hook(*args)
+            except Exception as e:
+                with self._lock:
+                    self.hook_errors += 1
+                if self.on_hook_error:
+                    self.on_hook_error(e)
+
+    def start(self, method: str, endpoint: str) -> RequestTiming:
+        """Begin timing a client call and run the pre hooks."""
+        timing = RequestTiming(method, endpoint_name(endpoint))
+        if self._pre_hooks:
+            self._run_hooks(self._pre_hooks, method, timing.endpoint)
+        return timing
+
+    def finish(self, timing: RequestTiming):
+        """Record a finished call and run the post hooks."""
+        timing.total = time.perf_counter() - timing._started
+
+        key = f"{timing.method} {timing.endpoint}"
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats(self.window)
+            stats.calls += 1
+            stats.retries += max(0, timing.attempts - 1)
+            if timing.error is not None:
+                name = type(timing.error).__name__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+            stats.latency.add(timing.total)
+            phases = stats.phases
+            phases["queued"] += timing.queued
+            phases["sign"] += timing.sign
+            phases["transport"] += timing.transport
+            phases["server"] += timing.server or 0.0
+            phases["decode"] += timing.decode
+
+        if self._post_hooks:
+            self._run_hooks(self._post_hooks, timing)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """
+        Return per-endpoint metrics.
+
+        Returns:
+            Dict[str, Dict]: Keyed by "METHOD endpoint": calls, retries, errors (by exception class),
+            p50_ms/p95_ms/p99_ms over the recent window, and the mean time per call spent in each
+            phase (queued_ms, sign_ms, transport_ms, server_ms, decode_ms)
+        """
+        with self._lock:
+            endpoints = {name: (stats.calls, stats.retries, dict(stats.errors), list(stats.latency.samples),
+                                dict(stats.phases)) for name, stats in self._endpoints.items()}
+
+        snapshot = {}
+        for name, (calls, retries, errors, samples, phases) in endpoints.items():
+            histogram = _Histogram(len(samples) or 1)
+            histogram.samples.extend(samples)
+            entry = {"calls": calls, "retries": retries, "errors": errors}
+            for label, value in histogram.percentiles().items():
+                entry[f"{label}_ms"] = value * 1000 if value is not None else None
+            for phase, seconds in phases.items():
+                entry[f"{phase}_ms"] = seconds * 1000 / calls if calls else 0.0
+            snapshot[name] = entry
+        return snapshot
+
+    def reset(self):
+        """Clear all recorded metrics. Hooks stay registered."""
+        with self._lock:
+            self._endpoints = {}
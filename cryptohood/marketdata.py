@@ -0,0 +1,148 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Union
+from urllib.parse import quote
+
+BEST_BID_ASK_ENDPOINT = "/api/v1/crypto/marketdata/best_bid_ask/"
+
+# Conservative limit that proxies and load balancers accept for a full request URL
+MAX_URL_LENGTH = 2000
+
+
+def chunk_symbols(symbols: Iterable[str], base_url_length: int, max_url_length: int = MAX_URL_LENGTH) -> List[List[str]]:
+    """
+    Split symbols into groups whose ?symbol=...&symbol=... query keeps the URL under a length limit.
+
+    Args:
+        symbols (Iterable[str]): Trading pair symbols
+        base_url_length (int): Length of the URL without the query string
+        max_url_length (int): Maximum URL length
+
+    Returns:
+        List[List[str]]: Symbol groups, each sent as one request
+    """
+    chunks = []
+    current = []
+    length = base_url_length
+
+    for symbol in symbols:
+        # "?" or "&", then "symbol=" and the encoded value
+        extra = 1 + len("symbol=") + len(quote(symbol, safe=""))
+        if current and length + extra > max_url_length:
+            chunks.append(current)
+            current = []
+            length = base_url_length
+        current.append(symbol)
+        length += extra
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class _Batch:
+    __slots__ = ("symbols", "done", "quotes", "error")
+
+    def __init__(self):
+        self.symbols = set()
+        self.done = threading.Event()
+        self.quotes = {}
+        self.error = None
+
+
+class QuoteSnapshotService:
+    """
+    Coalesces concurrent best bid/ask lookups into batched requests.
+
+    The first caller opens a batch and waits for a short window; every caller arriving in that
+    window adds its symbols to the same batch. The batch is then fetched with as few
+    best_bid_ask requests as the URL length allows, and each caller receives the quotes for
+    the symbols it asked for. Threads polling overlapping symbols therefore share one request.
+
+    Usage:
+        snapshots = QuoteSnapshotService(client)
+        quotes = snapshots.get_quotes(["BTC-USD", "ETH-USD"])  # {"BTC-USD": {...}, "ETH-USD": {...}}
+
+    Attributes:
+        window (float): Seconds the first caller waits for others to join its batch
+        max_url_length (int): Maximum URL length for a single request
+        requests_sent (int): best_bid_ask requests issued
+        callers_served (int): get_quotes() calls answered
+    """
+
+    def __init__(self, client, window: float = 0.005, max_url_length: int = MAX_URL_LENGTH):
+        """
+        Initialize the service.
+
+        Args:
+            client (CryptoHood): Client used to fetch quotes
+            window (float): Seconds the first caller waits for others to join its batch
+            max_url_length (int): Maximum URL length for a single request
+        """
+        self.client = client
+        self.window = window
+        self.max_url_length = max_url_length
+        self._lock = threading.Lock()
+        self._open_batch = None
+        self.requests_sent = 0
+        self.callers_served = 0
+
+    def get_quotes(self, symbols: Union[str, List[str]], timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Get the best bid/ask quote for each symbol, sharing the request with concurrent callers.
+
+        Args:
+            symbols (Union[str, List[str]]): Single symbol or list of symbols (e.g., "BTC-USD")
+            timeout (Optional[float]): Seconds to wait for a batch started by another caller
+
+        Returns:
+            Dict[str, Dict]: Quote for each requested symbol the API returned, keyed by symbol
+
+        Raises:
+            CryptoHoodAPIError: If the batched request failed
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        symbols = [symbol.upper() for symbol in symbols]
+
+        with self._lock:
+            batch = self._open_batch
+            leader = batch is None
+            if leader:
+                batch = self._open_batch = _Batch()
+            batch.symbols.update(symbols)
+
+        if leader:
+            self._dispatch(batch)
+        elif not batch.done.wait(timeout):
+            raise TimeoutError("Timed out waiting for a batched quote request")
+
+        with self._lock:
+            self.callers_served += 1
+
+        if batch.error is not None:
+            raise batch.error
+        return {symbol: batch.quotes[symbol] for symbol in symbols if symbol in batch.quotes}
+
+    def _dispatch(self, batch: _Batch):
+        """Wait for the coalescing window, close the batch and fetch its symbols."""
+        if self.window > 0:
+            time.sleep(self.window)
+
+        with self._lock:
+            if self._open_batch is batch:
+                self._open_batch = None
+            symbols = sorted(batch.symbols)
+
+        base_length = len(self.client.base_url) + len(BEST_BID_ASK_ENDPOINT)
+        try:
+            for chunk in chunk_symbols(symbols, base_length, self.max_url_length):
+                response = self.client.get_best_bid_ask(chunk)
+                with self._lock:
+                    self.requests_sent += 1
+                for result in response.get('results', []):
+                    batch.quotes[result['symbol']] = result
+        except Exception as e:
+            batch.error = e
+        finally:
+            batch.done.set()
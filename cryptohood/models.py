@@ -0,0 +1,245 @@
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+_MISSING = object()
+
+
+def _decimal_slots(*names: str) -> Tuple[str, ...]:
+    """Slots backing the given lazily parsed Decimal fields (raw value and parsed cache)."""
+    return tuple(slot for name in names for slot in (f"_raw_{name}", f"_dec_{name}"))
+
+
+class _LazyDecimal:
+    """Descriptor that keeps the raw API value and converts it to Decimal on first access."""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.raw_slot = f"_raw_{name}"
+        self.cache_slot = f"_dec_{name}"
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.cache_slot)
+        if value is _MISSING:
+            raw = getattr(instance, self.raw_slot)
+            # str() first so floats such as 0.1 keep their shortest repr instead of binary noise
+            value = None if raw is None or raw == "" else Decimal(str(raw))
+            setattr(instance, self.cache_slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.raw_slot, value)
+        setattr(instance, self.cache_slot, _MISSING)
+
+
+class _Model:
+    """
+    Base class for typed responses.
+
+    Subclasses list plain fields in _fields and numeric fields in _decimal_fields; numeric fields
+    are stored as received and parsed into Decimal only when first read.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _decimal_fields: Tuple[str, ...] = ()
+    # Low-cardinality fields whose repeated values ColumnTable stores only once
+    _shared_fields: Tuple[str, ...] = ()
+
+    def __init__(self, **values: Any):
+        for name in self._fields + self._decimal_fields:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "_Model":
+        """Build a model from one API record, ignoring unknown keys."""
+        return cls(**data)
+
+    @classmethod
+    def from_results(cls, response: Dict) -> List["_Model"]:
+        """Build a model for each record in a response's results list."""
+        return [cls.from_dict(record) for record in response.get('results', [])]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record with its raw (unparsed) values, as received from the API."""
+        data = {name: getattr(self, name) for name in self._fields}
+        data.update({name: getattr(self, f"_raw_{name}") for name in self._decimal_fields})
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields[:3])
+        return f"{type(self).__name__}({fields})"
+
+
+class Account(_Model):
+    """Crypto trading account details."""
+
+    _fields = ("account_number", "status", "buying_power_currency")
+    _decimal_fields = ("buying_power",)
+    __slots__ = _fields + _decimal_slots(*_decimal_fields)
+
+    buying_power = _LazyDecimal()
+
+
+class Quote(_Model):
+    """Best bid and ask for one symbol."""
+
+    _fields = ("symbol", "timestamp")
+    _decimal_fields = ("price", "bid_inclusive_of_sell_spread", "sell_spread", "ask_inclusive_of_buy_spread",
+                       "buy_spread")
+    __slots__ = _fields + _decimal_slots(*_decimal_fields)
+
+    price = _LazyDecimal()
+    bid_inclusive_of_sell_spread = _LazyDecimal()
+    sell_spread = _LazyDecimal()
+    ask_inclusive_of_buy_spread = _LazyDecimal()
+    buy_spread = _LazyDecimal()
+
+    @property
+    def bid(self) -> Optional[Decimal]:
+        """Bid inclusive of sell spread."""
+        return self.bid_inclusive_of_sell_spread
+
+    @property
+    def ask(self) -> Optional[Decimal]:
+        """Ask inclusive of buy spread."""
+        return self.ask_inclusive_of_buy_spread
+
+
+class Holding(_Model):
+    """Quantity held of one asset."""
+
+    _fields = ("account_number", "asset_code")
+    _decimal_fields = ("total_quantity", "quantity_available_for_trading")
+    _shared_fields = ("account_number", "asset_code")
+    __slots__ = _fields + _decimal_slots(*_decimal_fields)
+
+    total_quantity = _LazyDecimal()
+    quantity_available_for_trading = _LazyDecimal()
+
+
+class TradingPair(_Model):
+    """Trading rules for one symbol."""
+
+    _fields = ("symbol", "asset_code", "quote_code", "status")
+    _decimal_fields = ("quote_increment", "asset_increment", "max_order_size", "min_order_size")
+    _shared_fields = ("asset_code", "quote_code", "status")
+    __slots__ = _fields + _decimal_slots(*_decimal_fields)
+
+    quote_increment = _LazyDecimal()
+    asset_increment = _LazyDecimal()
+    max_order_size = _LazyDecimal()
+    min_order_size = _LazyDecimal()
+
+
+class Order(_Model):
+    """A crypto order and its executions."""
+
+    _fields = ("id", "symbol", "side", "type", "state", "client_order_id", "account_number", "created_at",
+               "updated_at", "executions", "market_order_config", "limit_order_config", "stop_loss_order_config",
+               "stop_limit_order_config")
+    _decimal_fields = ("average_price", "filled_asset_quantity")
+    _shared_fields = ("symbol", "side", "type", "state", "account_number")
+    __slots__ = _fields + _decimal_slots(*_decimal_fields)
+
+    average_price = _LazyDecimal()
+    filled_asset_quantity = _LazyDecimal()
+
+    @property
+    def order_config(self) -> Optional[Dict]:
+        """Configuration for this order's type (e.g. limit_order_config for limit orders)."""
+        return getattr(self, f"{self.type}_order_config", None) if self.type else None
+
+
+class ColumnTable:
+    """
+    Column-oriented container for many records of one model type.
+
+    Each field is stored as a single list rather than one dict per record, which removes the
+    per-record dict overhead for large paginated results. Repeated values of low-cardinality
+    fields (symbol, side, state, ...) are stored once. Rows are materialized as models only
+    when indexed, and numeric columns are parsed to Decimal only when requested.
+
+    Usage:
+        orders = ColumnTable.from_records(Order, client.iter_orders())
+        filled = orders.decimal_column("filled_asset_quantity")
+        first = orders[0]  # Order
+    """
+
+    __slots__ = ("model", "columns", "_shared", "_length")
+
+    def __init__(self, model: Type[_Model]):
+        """
+        Initialize an empty table.
+
+        Args:
+            model (Type[_Model]): Model class describing the columns (Order, Holding, ...)
+        """
+        self.model = model
+        self.columns = {name: [] for name in model._fields + model._decimal_fields}
+        self._shared = {name: {} for name in model._shared_fields}
+        self._length = 0
+
+    @classmethod
+    def from_records(cls, model: Type[_Model], records: Iterable[Dict]) -> "ColumnTable":
+        """
+        Load API records (dicts) into a table, consuming generators one record at a time.
+
+        Args:
+            model (Type[_Model]): Model class describing the columns
+            records (Iterable[Dict]): Records, e.g. from client.iter_orders()
+
+        Returns:
+            ColumnTable: Table holding the records
+        """
+        table = cls(model)
+        table.extend(records)
+        return table
+
+    def append(self, record: Dict):
+        """Add one API record."""
+        self.extend((record,))
+
+    def extend(self, records: Iterable[Dict]):
+        """Add API records."""
+        columns = [(name, column, self._shared.get(name)) for name, column in self.columns.items()]
+        for record in records:
+            get = record.get
+            for name, column, shared in columns:
+                value = get(name)
+                if shared is not None and value is not None:
+                    value = shared.setdefault(value, value)
+                column.append(value)
+            self._length += 1
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> _Model:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ColumnTable index out of range")
+        return self.model(**{name: column[index] for name, column in self.columns.items()})
+
+    def __iter__(self) -> Iterator[_Model]:
+        for index in range(self._length):
+            yield self[index]
+
+    def column(self, name: str) -> List[Any]:
+        """Return the raw values of one field."""
+        return self.columns[name]
+
+    def decimal_column(self, name: str) -> List[Optional[Decimal]]:
+        """Return one numeric field parsed to Decimal (None where the value is missing)."""
+        return [None if value is None or value == "" else Decimal(str(value)) for value in self.columns[name]]
+
+
+def load_orders(records: Iterable[Dict]) -> ColumnTable:
+    """Load order records, e.g. client.iter_orders(), into a column-oriented table."""
+    return ColumnTable.from_records(Order, records)
@@ -0,0 +1,313 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set
+
+TERMINAL_ORDER_STATES = frozenset(['canceled', 'filled', 'failed'])
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API timestamp such as 2019-08-24T14:15:22Z or 2019-08-24T14:15:22.123456Z."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _set_result(future: "asyncio.Future", result):
+    if not future.done():
+        future.set_result(result)
+
+
+class OrderTracker:
+    """
+    Keeps an indexed in-memory table of the account's orders, refreshed incrementally.
+
+    Orders are indexed by id and client_order_id, with secondary indexes by symbol and state.
+    refresh() asks only for orders updated since the newest updated_at seen so far (the
+    watermark), so any number of open orders is monitored with one paginated query per poll.
+
+    Usage:
+        tracker = OrderTracker(client)
+        order = tracker.place_order("BTC-USD", "buy", "limit", "0.001", price="50000")
+        tracker.start(interval=1.0)
+        filled = tracker.wait_for(order["id"], timeout=60)
+
+    Attributes:
+        watermark (datetime): Orders updated at or after this time are fetched by the next refresh;
+            only refresh() advances it
+    """
+
+    def __init__(self, client, since: Optional[datetime] = None, overlap: float = 1.0):
+        """
+        Initialize the tracker.
+
+        Args:
+            client (CryptoHood): Client used to place, cancel and query orders
+            since (Optional[datetime]): Track orders updated after this time (default: now)
+            overlap (float): Seconds the watermark is rewound on each query, to tolerate clock skew
+        """
+        self.client = client
+        self.overlap = timedelta(seconds=overlap)
+        since = since or datetime.now(timezone.utc)
+        self.watermark = since.astimezone(timezone.utc) if since.tzinfo else since.replace(tzinfo=timezone.utc)
+
+        self._orders = {}
+        self._by_client_id = {}
+        self._by_symbol = {}
+        self._by_state = {}
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        # Futures of wait_for_async() callers keyed by order id, as (loop, future, states)
+        self._async_waiters = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def _upsert(self, order: Dict) -> bool:
+        """
+        Insert or update an order and its index entries. Must be called with the lock held.
+
+        Returns:
+            bool: True if the order is new or its contents changed
+        """
+        order_id = order.get('id')
+        if not order_id:
+            return False
+
+        previous = self._orders.get(order_id)
+        if previous == order:
+            return False
+
+        if previous is not None:
+            self._by_symbol.get(previous.get('symbol'), set()).discard(order_id)
+            self._by_state.get(previous.get('state'), set()).discard(order_id)
+
+        self._orders[order_id] = order
+        if order.get('client_order_id'):
+            self._by_client_id[order['client_order_id']] = order_id
+        self._by_symbol.setdefault(order.get('symbol'), set()).add(order_id)
+        self._by_state.setdefault(order.get('state'), set()).add(order_id)
+
+        waiters = self._async_waiters.get(order_id)
+        if waiters:
+            self._wake_async_waiters(order_id, order, waiters)
+        return True
+
+    def _wake_async_waiters(self, order_id: str, order: Dict, waiters: List):
+        """Complete the futures waiting for the order's new state. Must be called with the lock held."""
+        remaining = []
+        for waiter in waiters:
+            loop, future, states = waiter
+            if order.get('state') not in states:
+                remaining.append(waiter)
+                continue
+            try:
+                loop.call_soon_threadsafe(_set_result, future, order)
+            except RuntimeError:
+                # The waiter's loop is closed; nobody is left to wake
+                pass
+        if remaining:
+            self._async_waiters[order_id] = remaining
+        else:
+            del self._async_waiters[order_id]
+
+    def track(self, orders: Iterable[Dict]):
+        """Add or update orders obtained elsewhere (e.g. from get_orders)."""
+        with self._changed:
+            if any([self._upsert(order) for order in orders]):
+                self._changed.notify_all()
+
+    def place_order(self, *args, **kwargs) -> Dict:
+        """
+        Place an order through the client and start tracking it.
+
+        Takes the same arguments as CryptoHood.place_order().
+
+        Returns:
+            Dict: Order details
+        """
+        order = self.client.place_order(*args, **kwargs)
+        self.track([order])
+        return order
+
+    def cancel_order(self, order_id: str) -> str:
+        """
+        Request cancellation of an order. Its state changes once refresh() sees the update.
+
+        Returns:
+            str: Success message with order ID
+        """
+        return self.client.cancel_order(order_id)
+
+    def refresh(self) -> List[Dict]:
+        """
+        Fetch every order updated since the watermark and apply the changes.
+
+        Returns:
+            List[Dict]: Orders that were added or changed
+        """
+        since = self.watermark - self.overlap
+        newest = None
+        changed = []
+
+        for order in self.client.iter_orders(updated_at_start=since):
+            updated_at = _parse_timestamp(order.get('updated_at'))
+            if updated_at and (newest is None or updated_at > newest):
+                newest = updated_at
+            with self._lock:
+                if self._upsert(order):
+                    changed.append(order)
+
+        # Pages are not ordered by updated_at, and orders tracked through track() may be newer than
+        # changes not fetched yet, so the watermark only moves after a complete refresh
+        if newest is not None and newest > self.watermark:
+            self.watermark = newest
+
+        if changed:
+            with self._changed:
+                self._changed.notify_all()
+        return changed
+
+    def get(self, order_id: str) -> Optional[Dict]:
+        """Return a tracked order by id."""
+        return self._orders.get(order_id)
+
+    def get_by_client_order_id(self, client_order_id: str) -> Optional[Dict]:
+        """Return a tracked order by its client_order_id."""
+        with self._lock:
+            order_id = self._by_client_id.get(client_order_id)
+            return self._orders.get(order_id) if order_id else None
+
+    def _select(self, index: Dict[str, Set[str]], key: str) -> List[Dict]:
+        with self._lock:
+            return [self._orders[order_id] for order_id in index.get(key, ())]
+
+    def by_symbol(self, symbol: str) -> List[Dict]:
+        """Return tracked orders for a trading pair symbol."""
+        return self._select(self._by_symbol, symbol.upper())
+
+    def by_state(self, state: str) -> List[Dict]:
+        """Return tracked orders in a state ("open", "partially_filled", "filled", ...)."""
+        return self._select(self._by_state, state)
+
+    def open_orders(self) -> List[Dict]:
+        """Return tracked orders that can still fill."""
+        return self.by_state('open') + self.by_state('partially_filled')
+
+    def wait_for(self,
+                 order_id: str,
+                 states: Iterable[str] = TERMINAL_ORDER_STATES,
+                 timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Block until an order reaches one of the given states.
+
+        Someone must be refreshing the tracker, either start() or explicit refresh() calls.
+
+        Args:
+            order_id (str): Order to wait for
+            states (Iterable[str]): Target states (default: filled, canceled or failed)
+            timeout (Optional[float]): Maximum seconds to wait
+
+        Returns:
+            Optional[Dict]: The order once it reached a target state, or None on timeout
+        """
+        states = frozenset(states)
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._changed:
+            while True:
+                order = self._orders.get(order_id)
+                if order is not None and order.get('state') in states:
+                    return order
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._changed.wait(remaining)
+
+    async def wait_for_async(self,
+                             order_id: str,
+                             states: Iterable[str] = TERMINAL_ORDER_STATES,
+                             timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Await an order reaching one of the given states.
+
+        Unlike wait_for(), no thread is held while waiting: the waiter is a future that refresh()
+        or track() completes on the awaiting loop, so any number of orders can be awaited at once.
+        Someone must be refreshing the tracker, either start() or explicit refresh() calls.
+
+        Args:
+            order_id (str): Order to wait for
+            states (Iterable[str]): Target states (default: filled, canceled or failed)
+            timeout (Optional[float]): Maximum seconds to wait
+
+        Returns:
+            Optional[Dict]: The order once it reached a target state, or None on timeout
+        """
+        states = frozenset(states)
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            order = self._orders.get(order_id)
+            if order is not None and order.get('state') in states:
+                return order
+            future = loop.create_future()
+            waiter = (loop, future, states)
+            self._async_waiters.setdefault(order_id, []).append(waiter)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            # Drop the waiter on timeout or cancellation; a completed one was already removed
+            with self._lock:
+                waiters = self._async_waiters.get(order_id)
+                if waiters and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._async_waiters[order_id]
+
+    def _run(self, interval: float, on_error):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+            self._stop.wait(interval)
+
+    def start(self, interval: float = 1.0, on_error=None) -> "OrderTracker":
+        """
+        Refresh on a background thread every interval seconds.
+
+        Args:
+            interval (float): Seconds between refreshes
+            on_error (Optional[Callable[[Exception], None]]): Called with errors raised by refresh()
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval, on_error), name="cryptohood-order-tracker",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop background refreshing."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "OrderTracker":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
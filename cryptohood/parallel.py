@@ -0,0 +1,71 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Union
+
+from .client import CryptoHood
+from .config import ClientConfig
+from .exceptions import CryptoHoodAPIError
+
+# The client owned by the current worker process, built once by the pool initializer
+_worker_client = None
+
+
+def _init_worker(config: ClientConfig):
+    global _worker_client
+    _worker_client = CryptoHood.from_config(config)
+
+
+def worker_client() -> CryptoHood:
+    """
+    Return the current worker process's client.
+
+    Raises:
+        RuntimeError: If called outside a map_symbols() worker
+    """
+    if _worker_client is None:
+        raise RuntimeError("worker_client() is only available inside map_symbols() workers")
+    return _worker_client
+
+
+def _call(fn: Callable[[CryptoHood, str], Any], symbol: str) -> Union[Any, CryptoHoodAPIError]:
+    try:
+        return fn(_worker_client, symbol)
+    except CryptoHoodAPIError as e:
+        return e
+
+
+def map_symbols(fn: Callable[[CryptoHood, str], Any],
+                symbols: List[str],
+                config: Union[ClientConfig, CryptoHood],
+                processes: Optional[int] = None,
+                chunksize: int = 1) -> List[Union[Any, CryptoHoodAPIError]]:
+    """
+    Call fn(client, symbol) for each symbol across a pool of worker processes.
+
+    Each worker builds one client from the config when it starts and reuses it, with its warm
+    connection pool, for every symbol it processes. fn must be picklable (a module-level
+    function) and so must its results. Rate limits in the config apply per worker.
+
+    Usage:
+        def signal(client, symbol):
+            quote = client.get_best_bid_ask(symbol)
+            return compute_signal(quote)  # CPU-heavy work runs in parallel
+
+        signals = map_symbols(signal, ["BTC-USD", "ETH-USD"], ClientConfig(api_key, private_key))
+
+    Args:
+        fn (Callable[[CryptoHood, str], Any]): Function called with the worker's client and a symbol
+        symbols (List[str]): Trading pair symbols
+        config (Union[ClientConfig, CryptoHood]): Settings for the workers' clients, or a client to copy them from
+        processes (Optional[int]): Number of worker processes (default: number of CPUs)
+        chunksize (int): Symbols sent to a worker at a time
+
+    Returns:
+        List[Union[Any, CryptoHoodAPIError]]: Each result, or the API error it raised, in input order
+    """
+    if isinstance(config, CryptoHood):
+        config = config.config
+    if not symbols:
+        return []
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(config,)) as executor:
+        return list(executor.map(_call, [fn] * len(symbols), symbols, chunksize=chunksize))
@@ -0,0 +1,273 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .marketdata import BEST_BID_ASK_ENDPOINT, MAX_URL_LENGTH, chunk_symbols
+from .stream import QuoteUpdate
+
+# Quote field used to mark positions for each mark mode
+MARK_FIELDS = {"mid": "price", "bid": "bid_inclusive_of_sell_spread", "ask": "ask_inclusive_of_buy_spread"}
+
+# Incremental updates accumulate rounding error in the running total; re-sum it this often
+_RESUM_EVERY = 1024
+
+
+class Portfolio:
+    """
+    Holdings marked to market with vectorized valuation.
+
+    Holdings are loaded into parallel NumPy arrays (one slot per asset) and quotes for every
+    held symbol are fetched with as few best_bid_ask requests as the URL length allows. Market
+    value, weights and drift from target weights are array operations over all assets at once.
+
+    When only prices change, update_quotes() rewrites the affected slots and adjusts the running
+    total by the change in value, so a tick touching a few symbols costs a few array writes
+    rather than a full revaluation. Weights are recomputed lazily, once per read after a change.
+    on_quote() can be passed to QuoteStream.subscribe() to keep the portfolio live.
+
+    Assets without a quote are valued at zero and listed in `unpriced`. With include_cash=True
+    the account's buying power is included as a position in the quote currency at a price of 1.
+
+    Usage:
+        portfolio = Portfolio(client, targets={"BTC": 0.6, "ETH": 0.4})
+        portfolio.load()
+        portfolio.total_value
+        portfolio.drift()                   # weights minus targets, aligned with portfolio.assets
+        stream.subscribe(portfolio.on_quote)
+
+    Attributes:
+        client (CryptoHood): Client used to fetch holdings and quotes
+        quote_code (str): Currency positions are valued in
+        mark (str): Quote price used for valuation: "mid", "bid" or "ask"
+        assets (List[str]): Asset codes, in array order
+        symbols (List[str]): Trading pair symbol of each asset
+        quantity (np.ndarray): Total quantity of each asset
+        available (np.ndarray): Quantity available for trading of each asset
+        prices (np.ndarray): Latest mark price of each asset (0 if not quoted)
+        targets (np.ndarray): Target weight of each asset (0 if not set)
+    """
+
+    def __init__(self,
+                 client,
+                 quote_code: str = "USD",
+                 targets: Optional[Dict[str, float]] = None,
+                 mark: str = "mid",
+                 include_cash: bool = False,
+                 max_url_length: int = MAX_URL_LENGTH):
+        """
+        Initialize an empty portfolio; call load() to fetch holdings and quotes.
+
+        Args:
+            client (CryptoHood): Client used to fetch holdings and quotes
+            quote_code (str): Currency positions are valued in
+            targets (Optional[Dict[str, float]]): Target weight keyed by asset code
+            mark (str): Quote price used for valuation: "mid", "bid" (liquidation value) or "ask"
+            include_cash (bool): Include the account's buying power as a position in quote_code
+            max_url_length (int): Maximum URL length for a single best_bid_ask request
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If mark is not one of "mid", "bid" or "ask"
+        """
+        if np is None:
+            raise ImportError("Portfolio requires numpy. Install it with: pip install cryptohood[numpy]")
+        if mark not in MARK_FIELDS:
+            raise ValueError(f"Invalid mark: {mark}. Must be one of: {', '.join(MARK_FIELDS)}")
+
+        self.client = client
+        self.quote_code = quote_code.upper()
+        self.mark = mark
+        self.include_cash = include_cash
+        self.max_url_length = max_url_length
+        self._target_weights = {asset.upper(): float(weight) for asset, weight in (targets or {}).items()}
+        self._lock = threading.Lock()
+        self.assets = []
+        self.prices = np.zeros(0)
+        self._index({}, {})
+
+    def _index(self, quantities: Dict[str, float], available: Dict[str, float]):
+        """Rebuild the arrays from quantities keyed by asset code, keeping known prices."""
+        # Targeted assets that are not held still need a slot so their drift shows up
+        for asset in self._target_weights:
+            quantities.setdefault(asset, 0.0)
+            available.setdefault(asset, 0.0)
+
+        old_prices = dict(zip(self.assets, self.prices.tolist()))
+        self.assets = sorted(quantities)
+        self.symbols = [f"{asset}-{self.quote_code}" for asset in self.assets]
+        self._positions = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.quantity = np.array([quantities[asset] for asset in self.assets], dtype=np.float64)
+        self.available = np.array([available[asset] for asset in self.assets], dtype=np.float64)
+        self.prices = np.array([1.0 if asset == self.quote_code else old_prices.get(asset, 0.0)
+                                for asset in self.assets], dtype=np.float64)
+        self.targets = np.array([self._target_weights.get(asset, 0.0) for asset in self.assets], dtype=np.float64)
+        self._values = self.quantity * self.prices
+        self._total = float(self._values.sum())
+        self._weights = None
+        self._updates = 0
+
+    def load(self):
+        """Fetch holdings, then quotes for every held asset."""
+        self.load_holdings()
+        self.refresh_quotes()
+
+    def load_holdings(self):
+        """Fetch all holdings (and buying power with include_cash) and rebuild the arrays."""
+        quantities = {}
+        available = {}
+        for holding in self.client.iter_holdings():
+            asset = holding['asset_code'].upper()
+            quantities[asset] = float(holding.get('total_quantity') or 0)
+            available[asset] = float(holding.get('quantity_available_for_trading') or 0)
+        if self.include_cash:
+            cash = float(self.client.get_account().get('buying_power') or 0)
+            quantities[self.quote_code] = available[self.quote_code] = cash
+        with self._lock:
+            self._index(quantities, available)
+
+    def refresh_quotes(self) -> int:
+        """
+        Fetch quotes for every asset and update prices.
+
+        Returns:
+            int: Number of assets whose price was updated
+        """
+        symbols = [symbol for asset, symbol in zip(self.assets, self.symbols) if asset != self.quote_code]
+        if not symbols:
+            return 0
+        base_length = len(self.client.base_url) + len(BEST_BID_ASK_ENDPOINT)
+        quotes = []
+        for chunk in chunk_symbols(symbols, base_length, self.max_url_length):
+            quotes.extend(self.client.get_best_bid_ask(chunk).get('results', []))
+        return self.update_quotes(quotes)
+
+    def update_quotes(self, quotes: Iterable[Union[Dict, QuoteUpdate]]) -> int:
+        """
+        Apply new quotes, updating only the affected assets and the running total.
+
+        Args:
+            quotes (Iterable[Union[Dict, QuoteUpdate]]): best_bid_ask results or QuoteStream updates;
+                quotes for symbols not in the portfolio are ignored
+
+        Returns:
+            int: Number of assets whose price was updated
+        """
+        field = MARK_FIELDS[self.mark]
+        positions = []
+        prices = []
+        for quote in quotes:
+            if isinstance(quote, QuoteUpdate):
+                quote = quote.quote
+            position = self._positions.get(quote.get('symbol'))
+            price = quote.get(field)
+            if position is not None and price is not None:
+                positions.append(position)
+                prices.append(float(price))
+        if not positions:
+            return 0
+
+        index = np.array(positions, dtype=np.intp)
+        with self._lock:
+            self.prices[index] = prices
+            unique = np.unique(index)
+            new_values = self.quantity[unique] * self.prices[unique]
+            self._total += float((new_values - self._values[unique]).sum())
+            self._values[unique] = new_values
+            self._weights = None
+            self._updates += len(unique)
+            if self._updates >= _RESUM_EVERY:
+                self._total = float(self._values.sum())
+                self._updates = 0
+        return len(unique)
+
+    def on_quote(self, update: QuoteUpdate):
+        """Apply one QuoteStream update; pass this to QuoteStream.subscribe()."""
+        self.update_quotes((update,))
+
+    @property
+    def values(self) -> "np.ndarray":
+        """Market value of each asset in the quote currency."""
+        with self._lock:
+            return self._values.copy()
+
+    @property
+    def total_value(self) -> float:
+        """Market value of the whole portfolio in the quote currency."""
+        return self._total
+
+    @property
+    def unpriced(self) -> List[str]:
+        """Held assets that have no price yet and are valued at zero."""
+        return [asset for asset, price, quantity in zip(self.assets, self.prices, self.quantity)
+                if price == 0 and quantity != 0]
+
+    def weights(self) -> "np.ndarray":
+        """Share of the total value held in each asset (all zeros for an empty portfolio)."""
+        with self._lock:
+            if self._weights is None:
+                total = self._total
+                self._weights = self._values / total if total > 0 else np.zeros_like(self._values)
+            return self._weights.copy()
+
+    def set_targets(self, targets: Dict[str, float]):
+        """
+        Replace the target weights. Assets that are not held yet get a zero position and are
+        priced on the next refresh_quotes().
+
+        Args:
+            targets (Dict[str, float]): Target weight keyed by asset code
+        """
+        self._target_weights = {asset.upper(): float(weight) for asset, weight in targets.items()}
+        with self._lock:
+            if not set(self._target_weights) <= set(self.assets):
+                self._index(dict(zip(self.assets, self.quantity.tolist())),
+                            dict(zip(self.assets, self.available.tolist())))
+            else:
+                self.targets = np.array([self._target_weights.get(asset, 0.0) for asset in self.assets],
+                                        dtype=np.float64)
+
+    def drift(self) -> "np.ndarray":
+        """Current weight minus target weight of each asset."""
+        return self.weights() - self.targets
+
+    def rebalance_quantities(self) -> "np.ndarray":
+        """
+        Quantity of each asset to buy (positive) or sell (negative) to reach the target weights.
+
+        Assets without a price get 0. Quantities are not rounded to the pair's increments.
+
+        Returns:
+            np.ndarray: Quantity to trade, aligned with assets
+        """
+        with self._lock:
+            difference = self.targets * self._total - self._values
+            prices = self.prices
+            return np.divide(difference, prices, out=np.zeros_like(difference), where=prices > 0)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-asset snapshot, keyed by asset code: quantity, available, price, value, weight, target and drift.
+        """
+        weights = self.weights()
+        values = self.values
+        return {
+            asset: {
+                "quantity": float(self.quantity[i]),
+                "available": float(self.available[i]),
+                "price": float(self.prices[i]),
+                "value": float(values[i]),
+                "weight": float(weights[i]),
+                "target": float(self.targets[i]),
+                "drift": float(weights[i] - self.targets[i])
+            } for i, asset in enumerate(self.assets)
+        }
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    def __repr__(self) -> str:
+        return f"Portfolio({len(self.assets)} assets, total_value={self._total:.2f} {self.quote_code})"
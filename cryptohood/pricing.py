@@ -0,0 +1,397 @@
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from decimal import ROUND_CEILING, Decimal
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .exceptions import ValidationError
+from .validation import OrderValidator
+
+# Quantities the estimated_price endpoint accepts in a single request
+MAX_QUANTITIES_PER_REQUEST = 10
+
+# Estimated price field for each side of the book
+_PRICE_FIELDS = {"ask": "ask_inclusive_of_buy_spread", "bid": "bid_inclusive_of_sell_spread"}
+
+# Order sides mapped to the side of the book they trade against
+_ORDER_SIDES = {"buy": "ask", "sell": "bid"}
+
+
+def _book_side(side: str) -> str:
+    side = _ORDER_SIDES.get(side.lower(), side.lower())
+    if side not in _PRICE_FIELDS:
+        raise ValueError(f"Invalid side: {side}. Must be one of: bid, ask, buy, sell")
+    return side
+
+
+def quantity_grid(max_quantity: Union[str, float, Decimal],
+                  points: int = MAX_QUANTITIES_PER_REQUEST,
+                  min_quantity: Optional[Union[str, float, Decimal]] = None,
+                  increment: Union[str, Decimal] = "0.00000001") -> List[str]:
+    """
+    Build geometrically spaced quantities from min_quantity up to max_quantity.
+
+    Geometric spacing puts more points at small sizes, where most orders are and where the
+    price curve bends the most relative to the quantity.
+
+    Args:
+        max_quantity (Union[str, float, Decimal]): Largest quantity on the grid
+        points (int): Number of quantities
+        min_quantity (Optional[Union[str, float, Decimal]]): Smallest quantity (default: max_quantity / 1000)
+        increment (Union[str, Decimal]): Quantities are rounded to a multiple of this
+
+    Returns:
+        List[str]: Distinct quantities in increasing order, formatted for the API
+    """
+    top = Decimal(str(max_quantity))
+    bottom = Decimal(str(min_quantity)) if min_quantity is not None else top / 1000
+    increment = Decimal(str(increment))
+    if top <= 0 or bottom <= 0 or bottom > top:
+        raise ValueError("Quantities must be positive and min_quantity must not exceed max_quantity")
+    if points < 1:
+        raise ValueError("points must be at least 1")
+
+    ratio = (top / bottom) ** (Decimal(1) / (points - 1)) if points > 1 else Decimal(1)
+    grid = []
+    for i in range(points):
+        quantity = top if i == points - 1 else bottom * ratio ** i
+        quantity = min(top, (quantity / increment).to_integral_value() * increment)
+        if quantity > 0 and (not grid or quantity > grid[-1]):
+            grid.append(quantity)
+    return [f"{quantity.normalize():f}" for quantity in grid]
+
+
+class PriceLadder:
+    """
+    Estimated average fill price as a function of quantity for one side of a symbol's book.
+
+    Prices between grid quantities are linearly interpolated, so answering a sizing question
+    is a binary search over the grid with no network call. Prices are floats: the ladder is
+    an estimate, and quantities and limit prices sent to the API should still be strings.
+
+    Attributes:
+        symbol (str): Trading pair symbol
+        side (str): Side of the book ("ask" for buys, "bid" for sells)
+        quantities (List[float]): Grid quantities in increasing order
+        prices (List[float]): Estimated average fill price at each grid quantity
+        mid (Optional[float]): Mid price reported with the estimates
+        fetched_at (float): time.monotonic() when the estimates were received
+    """
+
+    __slots__ = ("symbol", "side", "quantities", "prices", "mid", "fetched_at")
+
+    def __init__(self,
+                 symbol: str,
+                 side: str,
+                 quantities: Sequence[float],
+                 prices: Sequence[float],
+                 mid: Optional[float] = None,
+                 fetched_at: Optional[float] = None):
+        if not quantities or len(quantities) != len(prices):
+            raise ValueError("A ladder needs one price for each of at least one quantity")
+        points = sorted(zip(quantities, prices))
+        self.symbol = symbol
+        self.side = side
+        self.quantities = [float(quantity) for quantity, _ in points]
+        self.prices = [float(price) for _, price in points]
+        self.mid = mid
+        self.fetched_at = time.monotonic() if fetched_at is None else fetched_at
+
+    @classmethod
+    def from_results(cls, symbol: str, side: str, results: List[Dict]) -> "PriceLadder":
+        """
+        Build a ladder from estimated_price results.
+
+        Args:
+            symbol (str): Trading pair symbol
+            side (str): Side of the book ("bid" or "ask")
+            results (List[Dict]): "results" of one or more estimated_price responses
+
+        Returns:
+            PriceLadder: Ladder for the given side
+        """
+        field = _PRICE_FIELDS[side]
+        results = [result for result in results if result.get("side", side) == side]
+        mid = results[0].get("price") if results else None
+        return cls(symbol, side,
+                   [float(result["quantity"]) for result in results],
+                   [float(result[field]) for result in results],
+                   mid=float(mid) if mid is not None else None)
+
+    @property
+    def max_quantity(self) -> float:
+        """Largest quantity covered by the ladder."""
+        return self.quantities[-1]
+
+    def age(self) -> float:
+        """Seconds since the estimates were received."""
+        return time.monotonic() - self.fetched_at
+
+    def average_price(self, quantity: Union[str, float, Decimal]) -> float:
+        """
+        Expected average fill price for a quantity.
+
+        Quantities below the smallest grid point get that point's price.
+
+        Args:
+            quantity (Union[str, float, Decimal]): Order quantity
+
+        Returns:
+            float: Interpolated average fill price
+
+        Raises:
+            ValueError: If the quantity is larger than the ladder's largest quantity
+        """
+        quantity = float(quantity)
+        quantities = self.quantities
+        if quantity > quantities[-1]:
+            raise ValueError(f"Quantity {quantity} is beyond the ladder's largest quantity {quantities[-1]}")
+        i = bisect_left(quantities, quantity)
+        if i == 0:
+            return self.prices[0]
+        q0, q1 = quantities[i - 1], quantities[i]
+        p0, p1 = self.prices[i - 1], self.prices[i]
+        return p0 + (p1 - p0) * (quantity - q0) / (q1 - q0)
+
+    def cost(self, quantity: Union[str, float, Decimal]) -> float:
+        """Expected notional of filling a quantity (average price times quantity)."""
+        return self.average_price(quantity) * float(quantity)
+
+    def slippage(self, quantity: Union[str, float, Decimal], reference: Optional[float] = None) -> float:
+        """
+        Expected slippage of filling a quantity, as a fraction of the reference price.
+
+        Positive values are always unfavorable: paying more than the reference on the ask side,
+        receiving less on the bid side.
+
+        Args:
+            quantity (Union[str, float, Decimal]): Order quantity
+            reference (Optional[float]): Reference price (default: mid, or the smallest quantity's price)
+
+        Returns:
+            float: Slippage, e.g. 0.001 for 10 basis points
+        """
+        if reference is None:
+            reference = self.mid if self.mid is not None else self.prices[0]
+        price = self.average_price(quantity)
+        difference = price - reference if self.side == "ask" else reference - price
+        return difference / reference
+
+    def max_quantity_for_slippage(self, max_slippage: float, reference: Optional[float] = None) -> float:
+        """
+        Largest quantity on the ladder whose expected slippage stays within a limit.
+
+        Assumes slippage grows with quantity, which holds for any order book.
+
+        Args:
+            max_slippage (float): Slippage limit as a fraction, e.g. 0.002 for 20 basis points
+            reference (Optional[float]): Reference price (default: mid, or the smallest quantity's price)
+
+        Returns:
+            float: Quantity, 0.0 if even the smallest grid quantity exceeds the limit
+        """
+        slippages = [self.slippage(quantity, reference) for quantity in self.quantities]
+        if slippages[0] > max_slippage:
+            return 0.0
+        for i in range(1, len(slippages)):
+            if slippages[i] > max_slippage:
+                # Slippage is linear in quantity between grid points, so solve for the crossing
+                s0, s1 = slippages[i - 1], slippages[i]
+                q0, q1 = self.quantities[i - 1], self.quantities[i]
+                return q0 + (q1 - q0) * (max_slippage - s0) / (s1 - s0)
+        return self.quantities[-1]
+
+    def __repr__(self) -> str:
+        return (f"PriceLadder({self.symbol} {self.side}, {len(self.quantities)} points "
+                f"up to {self.max_quantity:g}, age={self.age():.2f}s)")
+
+
+class PriceLadderService:
+    """
+    Caches estimated-price ladders per (symbol, side) for order sizing.
+
+    A ladder is fetched with as few estimated_price requests as the API's limit of
+    MAX_QUANTITIES_PER_REQUEST quantities per request allows (one request for the default
+    grid), then kept for `ttl` seconds. Within that time every average price, cost and
+    slippage question for the symbol is answered by interpolation without a network call.
+    A cached ladder is refetched early if asked about a quantity beyond its largest one.
+
+    Built grids stay within the pair's min_order_size and max_order_size and are multiples of
+    its asset_increment, as the estimated_price endpoint requires. The trading rules come from
+    the validator, loaded once on first use; a ladder never extends past max_order_size.
+
+    Usage:
+        ladders = PriceLadderService(client)
+        ladder = ladders.get_ladder("BTC-USD", "buy", max_quantity="2")
+        ladder.slippage("0.75")                 # 0.0019
+        ladders.average_price("BTC-USD", "buy", "0.3")
+
+    Attributes:
+        client (Union[CryptoHood, AsyncCryptoHood]): Client used to fetch estimates
+        ttl (float): Seconds a ladder is reused
+        points (int): Quantities on a fetched grid
+        requests_sent (int): estimated_price requests issued
+        validator (OrderValidator): Trading rules that bound the grid quantities
+    """
+
+    def __init__(self,
+                 client,
+                 ttl: float = 2.0,
+                 points: int = MAX_QUANTITIES_PER_REQUEST,
+                 validator: Optional[OrderValidator] = None):
+        """
+        Initialize the service.
+
+        Args:
+            client (Union[CryptoHood, AsyncCryptoHood]): Client used to fetch estimates
+            ttl (float): Seconds a ladder is reused
+            points (int): Quantities on a fetched grid
+            validator (Optional[OrderValidator]): Trading rules for the grid bounds (default: the client's
+                validator when it validates orders, otherwise a new one loaded through the client)
+        """
+        self.client = client
+        self.ttl = ttl
+        self.points = points
+        self.validator = validator or getattr(client, "validator", None) or OrderValidator()
+        self.requests_sent = 0
+        self._ladders = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, key: Tuple[str, str], max_quantity: Optional[float]) -> Optional[PriceLadder]:
+        with self._lock:
+            ladder = self._ladders.get(key)
+        if ladder is None or ladder.age() >= self.ttl:
+            return None
+        if max_quantity is not None and float(max_quantity) > ladder.max_quantity:
+            return None
+        return ladder
+
+    def _cover(self, symbol: str, max_quantity) -> Optional[Decimal]:
+        """
+        Largest grid quantity needed to cover max_quantity within the pair's order size limits.
+
+        Raises:
+            ValidationError: If max_quantity is below the pair's min_order_size
+        """
+        if max_quantity is None:
+            return None
+        top = Decimal(str(max_quantity))
+        pair = self.validator.pairs.get(symbol)
+        if pair is None:
+            return top
+        if pair.min_order_size is not None and top < pair.min_order_size:
+            raise ValidationError({'errors': [{'attr': 'quantity',
+                                               'detail': f'Must be at least {pair.min_order_size:f}'}]})
+        if pair.asset_increment:
+            top = (top / pair.asset_increment).to_integral_value(rounding=ROUND_CEILING) * pair.asset_increment
+        if pair.max_order_size is not None:
+            top = min(top, pair.max_order_size)
+        return top
+
+    def _grid(self, symbol: str, top: Optional[Decimal], quantities: Optional[List[str]]) -> List[str]:
+        if quantities is not None:
+            return [str(quantity) for quantity in quantities]
+        if top is None:
+            raise ValueError("Either max_quantity or quantities is required")
+        pair = self.validator.pairs.get(symbol)
+        if pair is None:
+            return quantity_grid(top, self.points)
+        bottom = top / 1000
+        if pair.min_order_size is not None:
+            bottom = max(bottom, pair.min_order_size)
+        return quantity_grid(top, self.points, min_quantity=bottom, increment=pair.asset_increment or "0.00000001")
+
+    def _store(self, symbol: str, side: str, results: List[Dict]) -> PriceLadder:
+        ladder = PriceLadder.from_results(symbol, side, results)
+        with self._lock:
+            self._ladders[(symbol, side)] = ladder
+        return ladder
+
+    def get_ladder(self,
+                   symbol: str,
+                   side: str,
+                   max_quantity: Optional[Union[str, float, Decimal]] = None,
+                   quantities: Optional[List[str]] = None) -> PriceLadder:
+        """
+        Return a fresh ladder for a symbol and side, fetching it if needed.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTC-USD")
+            side (str): "buy"/"ask" or "sell"/"bid"
+            max_quantity (Optional[Union[str, float, Decimal]]): Largest quantity the ladder must cover
+            quantities (Optional[List[str]]): Explicit grid to fetch instead of one built from max_quantity
+
+        Returns:
+            PriceLadder: Cached or newly fetched ladder
+
+        Raises:
+            ValueError: If neither max_quantity nor quantities is given and no ladder is cached
+            ValidationError: If max_quantity is below the pair's minimum order size
+        """
+        symbol, side = symbol.upper(), _book_side(side)
+        if quantities is None:
+            self.validator.ensure_loaded(self.client)
+        top = self._cover(symbol, max_quantity)
+        ladder = self._cached((symbol, side), top) if quantities is None else None
+        if ladder is not None:
+            return ladder
+
+        results = []
+        grid = self._grid(symbol, top, quantities)
+        for i in range(0, len(grid), MAX_QUANTITIES_PER_REQUEST):
+            response = self.client.get_estimated_price(symbol, side, grid[i:i + MAX_QUANTITIES_PER_REQUEST])
+            with self._lock:
+                self.requests_sent += 1
+            results.extend(response.get("results", []))
+        return self._store(symbol, side, results)
+
+    async def get_ladder_async(self,
+                               symbol: str,
+                               side: str,
+                               max_quantity: Optional[Union[str, float, Decimal]] = None,
+                               quantities: Optional[List[str]] = None) -> PriceLadder:
+        """
+        Async version of get_ladder() for an AsyncCryptoHood client. Batches are fetched concurrently.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTC-USD")
+            side (str): "buy"/"ask" or "sell"/"bid"
+            max_quantity (Optional[Union[str, float, Decimal]]): Largest quantity the ladder must cover
+            quantities (Optional[List[str]]): Explicit grid to fetch instead of one built from max_quantity
+
+        Returns:
+            PriceLadder: Cached or newly fetched ladder
+        """
+        symbol, side = symbol.upper(), _book_side(side)
+        if quantities is None:
+            await self.validator.ensure_loaded_async(self.client)
+        top = self._cover(symbol, max_quantity)
+        ladder = self._cached((symbol, side), top) if quantities is None else None
+        if ladder is not None:
+            return ladder
+
+        grid = self._grid(symbol, top, quantities)
+        batches = [grid[i:i + MAX_QUANTITIES_PER_REQUEST] for i in range(0, len(grid), MAX_QUANTITIES_PER_REQUEST)]
+        responses = await asyncio.gather(*(self.client.get_estimated_price(symbol, side, batch)
+                                           for batch in batches))
+        with self._lock:
+            self.requests_sent += len(batches)
+        return self._store(symbol, side, [result for response in responses for result in response.get("results", [])])
+
+    def average_price(self, symbol: str, side: str, quantity: Union[str, float, Decimal]) -> float:
+        """Expected average fill price for a quantity, fetching a ladder that covers it if needed."""
+        return self.get_ladder(symbol, side, max_quantity=quantity).average_price(quantity)
+
+    def slippage(self, symbol: str, side: str, quantity: Union[str, float, Decimal]) -> float:
+        """Expected slippage from mid for a quantity, fetching a ladder that covers it if needed."""
+        return self.get_ladder(symbol, side, max_quantity=quantity).slippage(quantity)
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop cached ladders for a symbol, or all ladders."""
+        with self._lock:
+            if symbol is None:
+                self._ladders.clear()
+            else:
+                for key in [key for key in self._ladders if key[0] == symbol.upper()]:
+                    del self._ladders[key]
@@ -0,0 +1,213 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+# Robinhood allows 100 requests per minute per account, with bursts of up to 300 requests
+DEFAULT_RATE = 100 / 60
+DEFAULT_BURST = 300
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value (Optional[str]): Either a number of seconds or an HTTP date
+
+    Returns:
+        Optional[int]: Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds() + 0.999))
+
+
+class TokenBucket:
+    """
+    Thread-safe and asyncio-safe token bucket.
+
+    Callers reserve tokens under a short lock and then sleep outside it, so waiting threads
+    and coroutines never hold the lock while blocked. Tokens may go negative: each reservation
+    queues behind the previous ones, which keeps the outgoing rate at the configured ceiling.
+
+    Attributes:
+        rate (float): Tokens added per second
+        capacity (float): Maximum number of tokens (burst size)
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum number of tokens (burst size)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add the tokens accrued since the last update. Must be called with the lock held."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket without waiting.
+
+        Args:
+            tokens (float): Number of tokens to take
+
+        Returns:
+            float: Seconds the caller must wait before using the reserved tokens
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Take tokens only if they are available right now.
+
+        Args:
+            tokens (float): Number of tokens to take
+
+        Returns:
+            bool: True if the tokens were taken
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._blocked_until or self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1):
+        """Block the calling thread until the tokens are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1):
+        """Suspend the calling coroutine until the tokens are available."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def block_for(self, seconds: float):
+        """
+        Stop handing out tokens for a while, e.g. after the server answered with HTTP 429.
+
+        Args:
+            seconds (float): How long to pause
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    @property
+    def available(self) -> float:
+        """Number of tokens that could be taken right now (negative when callers are queued)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._blocked_until:
+                return min(self._tokens, 0.0)
+            return self._tokens
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with one token bucket per endpoint family.
+
+    Endpoints under /marketdata/ share the "marketdata" bucket and every other endpoint uses the
+    "trading" bucket. A single limiter can be shared by several clients (sync or async) so that
+    they pace themselves against the same account-wide limit.
+
+    Usage:
+        limiter = RateLimiter({"marketdata": (5, 20), "trading": (1, 10)})
+        client = CryptoHood(api_key, private_key, rate_limiter=limiter)
+    """
+
+    FAMILIES = ("marketdata", "trading")
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits (Optional[Dict[str, Tuple[float, float]]]): (requests per second, burst size) keyed by
+                endpoint family. Families that are not given use Robinhood's default of 100 requests
+                per minute with a burst of 300.
+        """
+        limits = limits or {}
+        unknown = set(limits) - set(self.FAMILIES)
+        if unknown:
+            raise ValueError(f"Unknown endpoint families: {', '.join(sorted(unknown))}")
+
+        self.buckets = {
+            family: TokenBucket(*limits.get(family, (DEFAULT_RATE, DEFAULT_BURST)))
+            for family in self.FAMILIES
+        }
+
+    @property
+    def limits(self) -> Dict[str, Tuple[float, float]]:
+        """(requests per second, burst size) for each endpoint family."""
+        return {family: (bucket.rate, bucket.capacity) for family, bucket in self.buckets.items()}
+
+    @staticmethod
+    def family(endpoint: str) -> str:
+        """Return the endpoint family ("marketdata" or "trading") for an API path."""
+        return "marketdata" if "/marketdata/" in endpoint else "trading"
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Return the token bucket that paces requests to an API path."""
+        return self.buckets[self.family(endpoint)]
+
+    def acquire(self, endpoint: str):
+        """Block the calling thread until a request to the endpoint may be sent."""
+        self.bucket(endpoint).acquire()
+
+    async def acquire_async(self, endpoint: str):
+        """Suspend the calling coroutine until a request to the endpoint may be sent."""
+        await self.bucket(endpoint).acquire_async()
+
+    def penalize(self, endpoint: str, retry_after: Optional[float] = None):
+        """
+        Pause the endpoint's family after the server rejected a request with HTTP 429.
+
+        Args:
+            endpoint (str): API path that was rate limited
+            retry_after (Optional[float]): Seconds from the Retry-After header. When missing, the
+                family pauses for the time it takes to earn one token.
+        """
+        bucket = self.bucket(endpoint)
+        bucket.block_for(retry_after if retry_after is not None else 1 / bucket.rate)
@@ -0,0 +1,125 @@
+import random
+import threading
+from typing import Dict, Iterable, Optional, Tuple, Type
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Delays use exponential backoff with full jitter: attempt n sleeps a random time between 0 and
+    min(backoff_max, backoff_base * 2 ** (n - 1)) seconds, and never less than the server's
+    Retry-After. Every attempt is signed again, so timestamps never go stale.
+
+    Attributes:
+        max_attempts (int): Total attempts including the first one (1 disables retries)
+        backoff_base (float): Upper bound of the first backoff delay in seconds
+        backoff_max (float): Cap on any single backoff delay in seconds
+        deadline (Optional[float]): Total time budget in seconds across all attempts
+        retry_statuses (Tuple[int, ...]): HTTP status codes that are retried
+        retry_exceptions (Optional[Tuple[Type[BaseException], ...]]): Transport exceptions that are
+            retried. None uses the client's defaults (connection errors and timeouts).
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 backoff_base: float = 0.25,
+                 backoff_max: float = 10.0,
+                 deadline: Optional[float] = None,
+                 retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+                 retry_exceptions: Optional[Iterable[Type[BaseException]]] = None):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.retry_statuses = tuple(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions) if retry_exceptions is not None else None
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Return True if a response with this status code should be retried."""
+        return status_code in self.retry_statuses
+
+    def is_retryable_exception(self, error: BaseException, default: Tuple[Type[BaseException], ...] = ()) -> bool:
+        """
+        Return True if a transport exception should be retried.
+
+        Args:
+            error (BaseException): Exception raised while sending the request
+            default (Tuple[Type[BaseException], ...]): Client-specific retryable exceptions, used when
+                the policy does not name its own
+        """
+        return isinstance(error, self.retry_exceptions if self.retry_exceptions is not None else default)
+
+    def backoff(self, attempt: int) -> float:
+        """Return a full-jitter backoff delay for the given (1-based) attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def next_delay(self, attempt: int, elapsed: float, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Compute how long to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of attempts made so far
+            elapsed (float): Seconds spent since the first attempt started
+            retry_after (Optional[float]): Server-provided Retry-After in seconds
+
+        Returns:
+            Optional[float]: Seconds to sleep, or None when attempts or the deadline budget are exhausted
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = self.backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.deadline is not None and elapsed + delay >= self.deadline:
+            return None
+        return delay
+
+
+class RetryStats:
+    """
+    Thread-safe counters describing retry activity for a client.
+
+    Attributes:
+        attempts (int): Requests sent, including retries
+        retries (int): Requests sent again after a retryable failure
+        exhausted (int): Requests that failed after using up their attempts or deadline, when retries are enabled
+        retry_time (float): Seconds spent sleeping between attempts
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.retry_time = 0.0
+
+    def record_attempt(self):
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, delay: float):
+        with self._lock:
+            self.retries += 1
+            self.retry_time += delay
+
+    def record_exhausted(self):
+        with self._lock:
+            self.exhausted += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return the current counters as a dictionary."""
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+                "retry_time": self.retry_time
+            }
@@ -0,0 +1,105 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+class JSONSerializer:
+    """
+    Standard library JSON serializer.
+
+    Serializers turn request bodies into bytes exactly once; the same bytes are signed and sent.
+    Any object with the same dumps()/loads() methods can be passed to the clients instead.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize a request body to UTF-8 bytes."""
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize a response body."""
+        return json.loads(data)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """orjson-backed serializer (pip install orjson)."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonSerializer(JSONSerializer):
+    """ujson-backed serializer (pip install ujson)."""
+
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, escape_forward_slashes=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return ujson.loads(data)
+
+
+_SERIALIZERS = {
+    "orjson": (OrjsonSerializer, lambda: orjson is not None),
+    "ujson": (UjsonSerializer, lambda: ujson is not None),
+    "json": (JSONSerializer, lambda: True),
+}
+
+
+def get_serializer(serializer: Optional[Union[str, JSONSerializer]] = None) -> JSONSerializer:
+    """
+    Resolve a serializer.
+
+    Args:
+        serializer (Optional[Union[str, JSONSerializer]]): A serializer instance, one of "json", "orjson" or
+            "ujson", or None to use the fastest installed library (orjson, then ujson, then the standard library)
+
+    Returns:
+        JSONSerializer: Serializer instance
+
+    Raises:
+        ValueError: If the named serializer is unknown or its library is not installed
+    """
+    if serializer is None:
+        for factory, available in _SERIALIZERS.values():
+            if available():
+                return factory()
+
+    if not isinstance(serializer, str):
+        return serializer
+
+    if serializer not in _SERIALIZERS:
+        raise ValueError(f"Unknown serializer: {serializer}. Must be one of: {', '.join(_SERIALIZERS)}")
+
+    factory, available = _SERIALIZERS[serializer]
+    if not available():
+        raise ValueError(f"Serializer {serializer} is not installed. Install it with: pip install {serializer}")
+    return factory()
+
+
+def loads_or_text(serializer: JSONSerializer, content: bytes) -> Any:
+    """
+    Decode a response body straight from its raw bytes.
+
+    Bodies that are not JSON, such as the text/plain reply to a cancel request, are returned as text.
+    """
+    try:
+        return serializer.loads(content)
+    except ValueError:
+        return content.decode("utf-8", errors="replace")
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses identical concurrent calls into one.
+
+    The first caller for a key runs the function; callers arriving with the same key while it
+    is in flight wait for it and receive the same result, or the same exception. Once the call
+    completes the key is forgotten, so later callers start a new call; nothing is cached.
+    Results are shared between callers and must not be mutated.
+
+    Usage:
+        flights = SingleFlight()
+        account = flights.do(("GET", "/api/v1/crypto/trading/accounts/"), fetch_account)
+
+    Attributes:
+        calls (int): Calls that ran the function
+        shared (int): Calls that received another caller's result
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn(), or wait for the identical call already in flight.
+
+        Args:
+            key (Hashable): Identifies identical calls
+            fn (Callable[[], Any]): Performs the call
+
+        Returns:
+            Any: fn()'s result
+
+        Raises:
+            Exception: Whatever fn() raised, in every caller that shared the call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the calls made and the calls served by sharing."""
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared}
+
+
+class AsyncSingleFlight:
+    """
+    asyncio version of SingleFlight.
+
+    The call runs as its own task that every caller awaits through asyncio.shield(), so
+    cancelling one caller, including the first, does not cancel the call for the others.
+    Use one instance per event loop.
+
+    Attributes:
+        calls (int): Calls that ran the coroutine
+        shared (int): Calls that received another caller's result
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn(), or the identical call already in flight.
+
+        Args:
+            key (Hashable): Identifies identical calls
+            fn (Callable[[], Awaitable[Any]]): Returns the coroutine that performs the call
+
+        Returns:
+            Any: The coroutine's result
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Future"):
+        self._tasks.pop(key, None)
+        # Mark the exception as retrieved in case every caller was cancelled before it arrived
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the calls made and the calls served by sharing."""
+        return {"calls": self.calls, "shared": self.shared}
@@ -0,0 +1,274 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Union
+
+from .orders import _parse_timestamp
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id TEXT PRIMARY KEY,
+    client_order_id TEXT,
+    symbol TEXT,
+    side TEXT,
+    type TEXT,
+    state TEXT,
+    created_at REAL,
+    updated_at REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_symbol_created ON orders (symbol, created_at);
+CREATE INDEX IF NOT EXISTS orders_state_created ON orders (state, created_at);
+CREATE INDEX IF NOT EXISTS orders_created ON orders (created_at);
+CREATE INDEX IF NOT EXISTS orders_updated ON orders (updated_at);
+CREATE INDEX IF NOT EXISTS orders_client_order_id ON orders (client_order_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Keep the newer copy when the same order arrives twice (e.g. from overlapping syncs)
+_UPSERT = """
+INSERT INTO orders (id, client_order_id, symbol, side, type, state, created_at, updated_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    client_order_id = excluded.client_order_id,
+    symbol = excluded.symbol,
+    side = excluded.side,
+    type = excluded.type,
+    state = excluded.state,
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    data = excluded.data
+WHERE excluded.updated_at IS NULL OR orders.updated_at IS NULL OR excluded.updated_at >= orders.updated_at
+"""
+
+WATERMARK_KEY = "orders_watermark"
+
+
+def _watermark_key(filters: Dict) -> str:
+    """Meta key of the watermark for one set of sync() filters; each filtered sync has its own."""
+    filters = {name: value.upper() if name == 'symbol' and isinstance(value, str) else value
+               for name, value in filters.items() if value is not None}
+    if not filters:
+        return WATERMARK_KEY
+    return f"{WATERMARK_KEY}:{json.dumps(filters, sort_keys=True, default=str)}"
+
+
+def _epoch(value: Optional[Union[str, datetime]]) -> Optional[float]:
+    """Convert an API timestamp or datetime to epoch seconds, so stored times compare numerically."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = _parse_timestamp(value)
+        if value is None:
+            return None
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class OrderStore:
+    """
+    Local SQLite copy of the account's order history, kept current with incremental syncs.
+
+    Each order is stored once, keyed by id, alongside indexed symbol, state and timestamp
+    columns. sync() remembers the newest updated_at it has stored (the watermark) and asks the
+    API only for orders updated since then, so after the first run each sync is a single
+    small delta query. Syncs with different filters keep separate watermarks, since a filtered
+    sync says nothing about the orders it did not ask for.
+
+    Usage:
+        with OrderStore("orders.db") as store:
+            store.sync(client)
+            filled = store.query(symbol="BTC-USD", state="filled", start=datetime(2024, 1, 1))
+
+    Attributes:
+        path (str): Database file (":memory:" for a temporary store)
+        overlap (timedelta): How far the watermark is rewound on each sync, to tolerate clock skew
+    """
+
+    def __init__(self, path: str = ":memory:", overlap: float = 1.0, batch_size: int = 500):
+        """
+        Open or create the store.
+
+        Args:
+            path (str): SQLite database file (default: in-memory)
+            overlap (float): Seconds the watermark is rewound on each sync
+            batch_size (int): Orders written per transaction while syncing
+        """
+        self.path = path
+        self.overlap = timedelta(seconds=overlap)
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "OrderStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """Newest updated_at stored by a completed unfiltered sync, or None before the first sync."""
+        return self.watermark_for()
+
+    def watermark_for(self, **filters) -> Optional[datetime]:
+        """Newest updated_at stored by a completed sync with these filters, or None before the first one."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (_watermark_key(filters),)).fetchone()
+        return datetime.fromtimestamp(float(row[0]), timezone.utc) if row else None
+
+    @staticmethod
+    def _row(order: Dict) -> tuple:
+        return (order['id'], order.get('client_order_id'), order.get('symbol'), order.get('side'), order.get('type'),
+                order.get('state'), _epoch(order.get('created_at')), _epoch(order.get('updated_at')), json.dumps(order))
+
+    def _write(self, orders: List[Dict], watermark_key: Optional[str] = None, watermark: Optional[float] = None):
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, [self._row(order) for order in orders if order.get('id')])
+            if watermark_key is not None and watermark is not None:
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value "
+                    "WHERE CAST(excluded.value AS REAL) > CAST(meta.value AS REAL)", (watermark_key, repr(watermark)))
+
+    def upsert(self, orders: Iterable[Dict]) -> int:
+        """
+        Insert or update orders by id. An order is only replaced by a copy with a newer updated_at.
+
+        Args:
+            orders (Iterable[Dict]): Orders as returned by the API
+
+        Returns:
+            int: Number of orders written
+        """
+        return self._apply(orders, watermark_key=None)
+
+    def _sync_filters(self, filters: Dict) -> Dict:
+        watermark = self.watermark_for(**filters)
+        return {} if watermark is None else {'updated_at_start': watermark - self.overlap}
+
+    def _apply(self, orders: Iterable[Dict], watermark_key: Optional[str]) -> int:
+        """Store orders in batches, then advance the watermark_key watermark (if any) once all were stored."""
+        newest = None
+        batch = []
+        count = 0
+        for order in orders:
+            updated_at = _epoch(order.get('updated_at'))
+            if updated_at is not None and (newest is None or updated_at > newest):
+                newest = updated_at
+            batch.append(order)
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                count += len(batch)
+                batch = []
+
+        # Pages are not ordered by updated_at, so an interrupted sync must not move the watermark
+        self._write(batch, watermark_key, newest)
+        return count + len(batch)
+
+    def sync(self, client, **filters) -> int:
+        """
+        Fetch orders changed since the last sync and store them.
+
+        The first sync downloads the full history; later syncs query with updated_at_start set
+        to the watermark. Each set of filters has its own watermark, so sync(client, symbol="BTC-USD")
+        followed by sync(client) still downloads the other symbols' history.
+
+        Args:
+            client (CryptoHood): Client used to query orders
+            **filters: Extra get_orders() filters (e.g. symbol), applied to this sync
+
+        Returns:
+            int: Number of orders received and stored
+        """
+        return self._apply(client.iter_orders(**self._sync_filters(filters), **filters), _watermark_key(filters))
+
+    async def sync_async(self, client, **filters) -> int:
+        """Same as sync(), using an AsyncCryptoHood client."""
+        return self._apply([order async for order in client.iter_orders(**self._sync_filters(filters), **filters)],
+                           _watermark_key(filters))
+
+    def get(self, order_id: str) -> Optional[Dict]:
+        """Return a stored order by id."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM orders WHERE id = ?", (order_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_by_client_order_id(self, client_order_id: str) -> Optional[Dict]:
+        """Return a stored order by its client_order_id."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM orders WHERE client_order_id = ?", (client_order_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(self,
+              symbol: Optional[str] = None,
+              state: Optional[Union[str, List[str]]] = None,
+              side: Optional[str] = None,
+              start: Optional[Union[str, datetime]] = None,
+              end: Optional[Union[str, datetime]] = None,
+              time_field: str = "created_at",
+              limit: Optional[int] = None) -> List[Dict]:
+        """
+        Query stored orders through the local indexes.
+
+        Args:
+            symbol (Optional[str]): Trading pair symbol (e.g., "BTC-USD")
+            state (Optional[Union[str, List[str]]]): Single state or list of states
+            side (Optional[str]): Order side ("buy" or "sell")
+            start (Optional[Union[str, datetime]]): Include orders at or after this time
+            end (Optional[Union[str, datetime]]): Include orders before this time
+            time_field (str): Timestamp the range applies to ("created_at" or "updated_at")
+            limit (Optional[int]): Maximum number of orders to return
+
+        Returns:
+            List[Dict]: Matching orders, oldest first
+        """
+        if time_field not in ("created_at", "updated_at"):
+            raise ValueError(f"Invalid time_field: {time_field}. Must be one of: created_at, updated_at")
+
+        clauses = []
+        args = []
+        if symbol:
+            clauses.append("symbol = ?")
+            args.append(symbol.upper())
+        if state:
+            states = [state] if isinstance(state, str) else list(state)
+            clauses.append(f"state IN ({', '.join('?' * len(states))})")
+            args.extend(states)
+        if side:
+            clauses.append("side = ?")
+            args.append(side)
+        if start is not None:
+            clauses.append(f"{time_field} >= ?")
+            args.append(_epoch(start))
+        if end is not None:
+            clauses.append(f"{time_field} < ?")
+            args.append(_epoch(end))
+
+        sql = "SELECT data FROM orders"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {time_field}"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
@@ -0,0 +1,239 @@
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Dict, List, Optional, Union
+
+from .exceptions import RateLimitError
+from .marketdata import BEST_BID_ASK_ENDPOINT
+
+
+class QuoteUpdate:
+    """
+    A change in the best bid or ask for one symbol.
+
+    Attributes:
+        symbol (str): Trading pair symbol
+        bid (float): Bid inclusive of sell spread
+        ask (float): Ask inclusive of buy spread
+        previous_bid (Optional[float]): Bid before this update (None for the first quote)
+        previous_ask (Optional[float]): Ask before this update (None for the first quote)
+        quote (Dict): Raw quote as returned by the API
+    """
+
+    __slots__ = ("symbol", "bid", "ask", "previous_bid", "previous_ask", "quote")
+
+    def __init__(self, symbol: str, quote: Dict, previous: Optional[Dict] = None):
+        self.symbol = symbol
+        self.bid = quote.get('bid_inclusive_of_sell_spread')
+        self.ask = quote.get('ask_inclusive_of_buy_spread')
+        self.previous_bid = previous.get('bid_inclusive_of_sell_spread') if previous else None
+        self.previous_ask = previous.get('ask_inclusive_of_buy_spread') if previous else None
+        self.quote = quote
+
+    def __repr__(self) -> str:
+        return f"QuoteUpdate(symbol={self.symbol!r}, bid={self.bid!r}, ask={self.ask!r})"
+
+
+class QuoteStream:
+    """
+    Emulates a quote feed by polling best_bid_ask and dispatching only the quotes that moved.
+
+    Polling runs on a background thread over the client's pooled connection. After a poll with
+    no changes the interval grows by backoff_factor up to max_interval; any change resets it to
+    min_interval. The stream also slows down when the client's rate limiter is nearly empty and
+    waits out the reset time after a RateLimitError.
+
+    Usage:
+        stream = QuoteStream(client, ["BTC-USD", "ETH-USD"], min_interval=0.5)
+        stream.subscribe(lambda update: print(update.symbol, update.bid, update.ask))
+        with stream:
+            ...
+
+        # or, from asyncio code
+        stream.start()
+        async for update in stream:
+            ...
+
+    Attributes:
+        symbols (List[str]): Symbols being polled
+        interval (float): Current polling interval in seconds
+        last_error (Optional[Exception]): Most recent polling error, if any
+    """
+
+    def __init__(self,
+                 client,
+                 symbols: Union[str, List[str]],
+                 min_interval: float = 1.0,
+                 max_interval: float = 10.0,
+                 backoff_factor: float = 1.5,
+                 min_tokens: float = 5,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Initialize the stream.
+
+        Args:
+            client (CryptoHood): Client used to poll quotes
+            symbols (Union[str, List[str]]): Single symbol or list of symbols (e.g., "BTC-USD")
+            min_interval (float): Polling interval while quotes are moving, in seconds
+            max_interval (float): Longest interval when quotes are stable or the rate limit is near
+            backoff_factor (float): Interval multiplier after a poll with no changes
+            min_tokens (float): Slow down when the rate limiter has fewer tokens than this left
+            on_error (Optional[Callable[[Exception], None]]): Called with errors raised while polling or
+                by a subscriber callback
+        """
+        if isinstance(symbols, str):
+            symbols = [symbols]
+
+        self.client = client
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.min_tokens = min_tokens
+        self.on_error = on_error
+        self.interval = min_interval
+        self.last_error = None
+        self._quotes = {}
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback: Callable[[QuoteUpdate], None]) -> Callable[[QuoteUpdate], None]:
+        """
+        Register a callback for quote updates. Callbacks run on the polling thread.
+
+        Returns:
+            Callable[[QuoteUpdate], None]: The callback, so this can be used as a decorator
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[QuoteUpdate], None]):
+        """Remove a previously registered callback."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    @property
+    def quotes(self) -> Dict[str, Dict]:
+        """Latest quote for each symbol."""
+        with self._lock:
+            return dict(self._quotes)
+
+    def poll_once(self) -> List[QuoteUpdate]:
+        """
+        Fetch quotes once, dispatch the ones whose bid or ask changed and adapt the interval.
+
+        Returns:
+            List[QuoteUpdate]: Updates dispatched by this poll
+        """
+        response = self.client.get_best_bid_ask(self.symbols)
+
+        updates = []
+        with self._lock:
+            for quote in response.get('results', []):
+                symbol = quote.get('symbol')
+                previous = self._quotes.get(symbol)
+                if previous is None or self._changed(previous, quote):
+                    updates.append(QuoteUpdate(symbol, quote, previous))
+                self._quotes[symbol] = quote
+            callbacks = list(self._callbacks)
+
+        for update in updates:
+            for callback in callbacks:
+                try:
+                    callback(update)
+                except Exception as e:
+                    # A failing subscriber must not starve the others or slow down polling
+                    if self.on_error:
+                        self.on_error(e)
+
+        if updates:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+
+        return updates
+
+    @staticmethod
+    def _changed(previous: Dict, quote: Dict) -> bool:
+        return (previous.get('bid_inclusive_of_sell_spread') != quote.get('bid_inclusive_of_sell_spread') or
+                previous.get('ask_inclusive_of_buy_spread') != quote.get('ask_inclusive_of_buy_spread'))
+
+    def _next_delay(self) -> float:
+        """Current interval, stretched when the client's rate limiter is running low."""
+        limiter = getattr(self.client, 'rate_limiter', None)
+        if limiter is not None:
+            bucket = limiter.bucket(BEST_BID_ASK_ENDPOINT)
+            if bucket.available < self.min_tokens:
+                return min(self.max_interval, max(self.interval, self.min_tokens / bucket.rate))
+        return self.interval
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = None
+            try:
+                self.poll_once()
+                self.last_error = None
+            except RateLimitError as e:
+                self.last_error = e
+                delay = e.reset_time if e.reset_time is not None else self.max_interval
+            except Exception as e:
+                self.last_error = e
+                self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+
+            if self.last_error is not None and self.on_error:
+                self.on_error(self.last_error)
+
+            self._stop.wait(delay if delay is not None else self._next_delay())
+
+    def start(self) -> "QuoteStream":
+        """Start polling on a background thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="cryptohood-quote-stream", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop polling and wait for the background thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "QuoteStream":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    async def updates(self, maxsize: int = 0) -> AsyncIterator[QuoteUpdate]:
+        """
+        Iterate over quote updates from asyncio code. The stream must be started.
+
+        Args:
+            maxsize (int): Maximum number of buffered updates (0 means unbounded). When the buffer
+                is full the oldest update is dropped.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize)
+
+        def put(update: QuoteUpdate):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(update)
+
+        def forward(update: QuoteUpdate):
+            loop.call_soon_threadsafe(put, update)
+
+        self.subscribe(forward)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(forward)
+
+    def __aiter__(self) -> AsyncIterator[QuoteUpdate]:
+        return self.updates()
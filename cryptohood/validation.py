@@ -0,0 +1,255 @@
+import asyncio
+import threading
+from decimal import ROUND_DOWN, Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional, Union
+
+from .exceptions import InvalidSymbolError, ValidationError
+from .models import TradingPair
+
+VALID_ORDER_SIDES = ['buy', 'sell']
+VALID_ORDER_TYPES = ['limit', 'market', 'stop_limit', 'stop_loss']
+
+# Order types sent with a price by place_order()
+PRICED_ORDER_TYPES = frozenset(['limit'])
+
+TRADABLE_STATUS = 'tradable'
+
+
+def _to_decimal(value: Union[str, int, float, Decimal]) -> Optional[Decimal]:
+    """Parse a quantity or price, returning None if it is not a finite number."""
+    try:
+        number = value if isinstance(value, Decimal) else Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+    return number if number.is_finite() else None
+
+
+def _is_multiple(value: Decimal, increment: Optional[Decimal]) -> bool:
+    return not increment or value % increment == 0
+
+
+class OrderValidator:
+    """
+    Checks orders against the exchange's trading rules before they are signed and sent.
+
+    All trading pairs are loaded once into a table keyed by symbol. Each check is then a dict
+    lookup and a few Decimal comparisons, so invalid orders fail locally instead of after a
+    round trip. Errors are raised as the same ValidationError the API would return.
+
+    Usage:
+        validator = OrderValidator.from_client(client)
+        quantity = validator.round_quantity("BTC-USD", "0.000123456789")
+        validator.validate("BTC-USD", "buy", "market", quantity)
+
+    Attributes:
+        pairs (Dict[str, TradingPair]): Trading rules keyed by symbol
+    """
+
+    def __init__(self, pairs: Optional[Iterable[Dict]] = None):
+        """
+        Initialize the validator.
+
+        Args:
+            pairs (Optional[Iterable[Dict]]): Trading pair records as returned by the API; use
+                load() or load_async() to fetch them later
+        """
+        self.pairs = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        # Load shared by concurrent ensure_loaded_async() callers
+        self._async_load = None
+        if pairs is not None:
+            self._index(pairs)
+
+    @classmethod
+    def from_client(cls, client) -> "OrderValidator":
+        """Create a validator loaded with every trading pair through a CryptoHood client."""
+        validator = cls()
+        validator.load(client)
+        return validator
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the trading pair table has been loaded."""
+        return self._loaded
+
+    def _index(self, pairs: Iterable[Dict]):
+        table = {}
+        for pair in pairs:
+            if pair.get('symbol'):
+                table[pair['symbol'].upper()] = TradingPair.from_dict(pair)
+        self.pairs = table
+        self._loaded = True
+
+    def load(self, client):
+        """
+        Load every trading pair, following pagination.
+
+        Args:
+            client (CryptoHood): Client used to fetch the trading pairs
+        """
+        with self._lock:
+            self._index(client.iter_trading_pairs())
+
+    async def load_async(self, client):
+        """
+        Load every trading pair, following pagination.
+
+        Args:
+            client (AsyncCryptoHood): Client used to fetch the trading pairs
+        """
+        self._index([pair async for pair in client.iter_trading_pairs()])
+
+    def ensure_loaded(self, client):
+        """Load the trading pairs through the client unless they are already loaded."""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._index(client.iter_trading_pairs())
+
+    async def ensure_loaded_async(self, client):
+        """
+        Load the trading pairs through an AsyncCryptoHood client unless they are already loaded.
+
+        Concurrent callers share one load, so a burst of validated orders fetches the table once.
+        Cancelling a caller does not cancel the load for the others; a failed load is retried by
+        the next call.
+        """
+        if self._loaded:
+            return
+        task = self._async_load
+        if task is None:
+            task = self._async_load = asyncio.ensure_future(self.load_async(client))
+            task.add_done_callback(self._async_load_done)
+        await asyncio.shield(task)
+
+    def _async_load_done(self, task: "asyncio.Future"):
+        self._async_load = None
+        # Mark the exception as retrieved in case every caller was cancelled before it arrived
+        if not task.cancelled():
+            task.exception()
+
+    def get_pair(self, symbol: str) -> TradingPair:
+        """
+        Return the trading rules for a symbol.
+
+        Raises:
+            InvalidSymbolError: If the symbol is not a known trading pair
+        """
+        pair = self.pairs.get(symbol.upper()) if symbol else None
+        if pair is None:
+            raise InvalidSymbolError(symbol)
+        return pair
+
+    def errors(self,
+               symbol: str,
+               side: str,
+               order_type: str,
+               quantity: Union[str, Decimal],
+               price: Optional[Union[str, Decimal]] = None) -> List[Dict[str, str]]:
+        """
+        Check an order and list every rule it breaks.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., "BTC-USD")
+            side (str): Order side ("buy" or "sell")
+            order_type (str): Order type ("market", "limit", ...)
+            quantity (Union[str, Decimal]): Order quantity
+            price (Optional[Union[str, Decimal]]): Limit price
+
+        Returns:
+            List[Dict[str, str]]: Errors in the API's format ({"attr": ..., "detail": ...}); empty if the order is valid
+
+        Raises:
+            InvalidSymbolError: If the symbol is not a known trading pair
+        """
+        pair = self.get_pair(symbol)
+        errors = []
+
+        if pair.status and pair.status != TRADABLE_STATUS:
+            errors.append({'attr': 'symbol', 'detail': f'{pair.symbol} is not tradable (status: {pair.status})'})
+        if side not in VALID_ORDER_SIDES:
+            errors.append({'attr': 'side', 'detail': f'Must be one of: {", ".join(VALID_ORDER_SIDES)}'})
+        if order_type not in VALID_ORDER_TYPES:
+            errors.append({'attr': 'type', 'detail': f'Must be one of: {", ".join(VALID_ORDER_TYPES)}'})
+
+        amount = _to_decimal(quantity)
+        if amount is None or amount <= 0:
+            errors.append({'attr': 'asset_quantity', 'detail': f'Must be a positive number, got {quantity!r}'})
+        else:
+            if not _is_multiple(amount, pair.asset_increment):
+                errors.append({'attr': 'asset_quantity', 'detail': f'Must be a multiple of {pair.asset_increment:f}'})
+            if pair.min_order_size is not None and amount < pair.min_order_size:
+                errors.append({'attr': 'asset_quantity', 'detail': f'Must be at least {pair.min_order_size:f}'})
+            if pair.max_order_size is not None and amount > pair.max_order_size:
+                errors.append({'attr': 'asset_quantity', 'detail': f'Must be at most {pair.max_order_size:f}'})
+
+        if order_type in PRICED_ORDER_TYPES:
+            limit_price = _to_decimal(price) if price is not None else None
+            if limit_price is None or limit_price <= 0:
+                errors.append({'attr': 'price', 'detail': f'A positive price is required for {order_type} orders'})
+            elif not _is_multiple(limit_price, pair.quote_increment):
+                errors.append({'attr': 'price', 'detail': f'Must be a multiple of {pair.quote_increment:f}'})
+
+        return errors
+
+    def validate(self,
+                 symbol: str,
+                 side: str,
+                 order_type: str,
+                 quantity: Union[str, Decimal],
+                 price: Optional[Union[str, Decimal]] = None):
+        """
+        Check an order against the trading rules.
+
+        Takes the same arguments as errors().
+
+        Raises:
+            InvalidSymbolError: If the symbol is not a known trading pair
+            ValidationError: If the order breaks any other rule
+        """
+        errors = self.errors(symbol, side, order_type, quantity, price)
+        if errors:
+            raise ValidationError({'type': 'validation_error', 'errors': errors})
+
+    def _round(self, value: Union[str, Decimal], increment: Optional[Decimal]) -> str:
+        number = _to_decimal(value)
+        if number is None:
+            raise ValidationError({'errors': [{'attr': 'value', 'detail': f'Not a number: {value!r}'}]})
+        if not increment:
+            return str(number)
+        # Round down to a whole number of increments, keeping the increment's precision
+        rounded = (number / increment).to_integral_value(rounding=ROUND_DOWN) * increment
+        return str(rounded.quantize(increment))
+
+    def round_quantity(self, symbol: str, quantity: Union[str, Decimal]) -> str:
+        """
+        Round a quantity down to the symbol's asset increment.
+
+        Args:
+            symbol (str): Trading pair symbol
+            quantity (Union[str, Decimal]): Quantity to round
+
+        Returns:
+            str: Rounded quantity, ready to pass to place_order()
+
+        Raises:
+            InvalidSymbolError: If the symbol is not a known trading pair
+        """
+        return self._round(quantity, self.get_pair(symbol).asset_increment)
+
+    def round_price(self, symbol: str, price: Union[str, Decimal]) -> str:
+        """
+        Round a price down to the symbol's quote increment.
+
+        Args:
+            symbol (str): Trading pair symbol
+            price (Union[str, Decimal]): Price to round
+
+        Returns:
+            str: Rounded price
+
+        Raises:
+            InvalidSymbolError: If the symbol is not a known trading pair
+        """
+        return self._round(price, self.get_pair(symbol).quote_increment)
@@ -5,6 +5,7 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=["requests>=2.25.0", "pandas>=2.0.0", "python-dotenv>=0.19.0"],
+    extras_require={"async": ["aiohttp>=3.8.0"], "fast": ["orjson>=3.6.0"], "numpy": ["numpy>=1.20"]},
     author="Humza Sami",
     author_email="humzasami20@gmail.com",
     description="A Python wrapper for the Robinhood Crypto API that simplifies cryptocurrency trading and market data access",